@@ -5,6 +5,7 @@ import pandas as pd
 import json
 import requests
 import os
+import numpy as np
 from io import BytesIO
 
 # === Configuration interface ===
@@ -35,17 +36,17 @@ except Exception as e:
 # === Source des données ===
 st.sidebar.info("Source : **Azure Blob Storage** ☁️")
 
-# === Chargement des user_ids depuis Azure Blob Storage ===
+# === Chargement de l'annuaire utilisateurs depuis Azure Blob Storage ===
 @st.cache_data(ttl=3600)  # Cache pendant 1 heure
-def load_user_ids_from_azure():
-    """Charge les user_ids valides depuis Azure Blob Storage"""
+def load_user_directory_from_azure():
+    """Charge l'annuaire utilisateurs (user_id, nb de clics) depuis Azure Blob Storage"""
     try:
         from azure.storage.blob import BlobServiceClient
         
         # Connexion au Blob Storage
         blob_service = BlobServiceClient.from_connection_string(AZURE_CONN_STR)
         container_name = "artefacts-fresh"  # Ton conteneur Azure
-        blob_name = "user_ids_valid.json"   # Ton fichier JSON
+        blob_name = "user_directory_light.npy"  # Annuaire partagé avec la Function (scripts/export_user_directory.py)
         
         # Télécharger le fichier depuis Azure
         blob_client = blob_service.get_blob_client(
@@ -53,17 +54,19 @@ def load_user_ids_from_azure():
             blob=blob_name
         )
         
-        # Lire le contenu du blob
+        # Lire le contenu du blob (tableau structuré trié par user_id)
         blob_data = blob_client.download_blob().readall()
-        user_ids = json.loads(blob_data.decode('utf-8'))
+        records = np.load(BytesIO(blob_data), allow_pickle=False)
+        user_ids = records["user_id"].tolist()
+        click_counts = dict(zip(user_ids, records["click_count"].tolist()))
         
         st.sidebar.success(f"✅ {len(user_ids)} utilisateurs chargés depuis Azure")
-        return sorted(user_ids)
+        return user_ids, click_counts
         
     except Exception as e:
-        st.sidebar.error(f"❌ Erreur chargement user_ids depuis Azure: {e}")
+        st.sidebar.error(f"❌ Erreur chargement annuaire utilisateurs depuis Azure: {e}")
         # Fallback avec des user_ids testés (de ta liste initiale)
-        return [8, 59021, 96, 330, 397, 452, 1060, 1685, 1926, 1943]
+        return [8, 59021, 96, 330, 397, 452, 1060, 1685, 1926, 1943], {}
 
 # === Chargement des métadonnées depuis Azure Blob Storage ===
 @st.cache_data(ttl=3600)
@@ -108,7 +111,7 @@ def load_articles_metadata_from_azure():
         return {}
 
 # Chargement des données depuis Azure
-user_ids = load_user_ids_from_azure()
+user_ids, user_click_counts = load_user_directory_from_azure()
 articles_metadata = load_articles_metadata_from_azure()
 
 # === Demo rapide ===
@@ -130,6 +133,11 @@ alpha = st.sidebar.slider("Pondération (alpha)", 0.0, 1.0, 0.7)
 threshold = st.sidebar.slider("Seuil historique utilisateur", 1, 20, 5)
 top_n = st.sidebar.slider("Nombre d'articles à recommander", 1, 10, 5)
 
+# Mode effectif du mode "auto", lu dans l'annuaire (même règle que la Function)
+if mode == "auto" and selected_user_id in user_click_counts:
+    nb_clicks = user_click_counts[selected_user_id]
+    st.sidebar.caption(f"Historique : {nb_clicks} clics → {'cbf' if nb_clicks < threshold else 'hybrid'}")
+
 # === Bouton de recommandation ===
 if st.sidebar.button("🚀 Obtenir les recommandations"):
     with st.spinner("Appel de l'Azure Function..."):
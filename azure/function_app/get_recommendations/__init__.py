@@ -4,7 +4,6 @@ import azure.functions as func
 import json
 import logging
 import os
-import sys
 from dotenv import load_dotenv
 
 # ================================
@@ -35,39 +34,10 @@ def load_correct_env():
 load_correct_env()
 
 # ================================
-# 🔍 Recherche dynamique de src/
+# ✅ Import du moteur de recommandation (package p10_reco, cf. scripts/build_function_app.py)
 # ================================
 
-def find_src_path(start_path: str, max_depth: int = 5) -> str:
-    current_path = start_path
-    for _ in range(max_depth):
-        candidate = os.path.join(current_path, "src")
-        if os.path.isdir(candidate):
-            return candidate
-        current_path = os.path.dirname(current_path)
-    raise FileNotFoundError("❌ Dossier 'src/' introuvable dans l'arborescence ascendante.")
-
-try:
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    src_path = find_src_path(current_dir)
-
-    if src_path not in sys.path:
-        sys.path.insert(0, src_path)
-        logging.info(f"[INIT] src/ détecté et ajouté au sys.path : {src_path}")
-
-except Exception as e:
-    logging.error(f"[INIT ERROR] Impossible d'ajouter src/ : {str(e)}")
-    raise
-
-# ================================
-# ✅ Import du moteur de recommandation
-# ================================
-
-try:
-    from wrappers import get_recommendations_from_user
-except ImportError as e:
-    logging.error(f"[IMPORT ERROR] wrappers.py introuvable ou cassé : {str(e)}")
-    raise
+from p10_reco import get_recommendations_from_user
 
 # ================================
 # 🚀 Azure Function principale
@@ -9,9 +9,13 @@ echo ===================================
 echo 📦 Nettoyage des anciens __pycache__...
 for /r %%i in (__pycache__) do rd /s /q "%%i"
 
+echo ===================================
+echo 📦 Copie du package de service p10_reco...
+python ..\..\scripts\build_function_app.py .
+
 echo ===================================
 echo 🔁 Génération du fichier .zip...
-powershell Compress-Archive -Path get_recommendations, src, requirements.txt -DestinationPath ../function_app.zip -Force
+powershell Compress-Archive -Path get_recommendations, p10_reco, requirements.txt -DestinationPath ../function_app.zip -Force
 
 echo ===================================
 echo 🔐 Connexion à Azure...
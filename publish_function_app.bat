@@ -23,6 +23,7 @@ echo ===================================
 echo Publication de la Function App...
 echo ===================================
 cd C:\Users\motar\Desktop\1-openclassrooms\AI_Engineer\1-projets\P10\2-python\azure\function_app
+python ..\..\scripts\build_function_app.py .
 func azure functionapp publish p10arnaudrecommendcs
 
 echo ===================================
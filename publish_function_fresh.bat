@@ -27,6 +27,9 @@ IF %ERRORLEVEL% NEQ 0 (
 echo Nettoyage des fichiers __pycache__...
 for /r azure\function_app %%i in (__pycache__) do rd /s /q "%%i" 2>nul
 
+:: Copie du package de service p10_reco dans la Function App
+python scripts\build_function_app.py azure\function_app
+
 :: Navigation vers le dossier function_app
 cd azure\function_app
 
@@ -27,9 +27,10 @@ python scripts\check_azure_artifacts.py
 
 echo.
 echo === VALIDATION CONNECTIVITÉ AZURE ===
-REM Test rapide de chargement depuis Azure (si connexion disponible)
+REM Test rapide de chargement depuis Azure (si connexion disponible) ; p10_reco installé (pip install -e .),
+REM l'import de p10_reco.wrappers charge le fichier .env (chaîne de connexion)
 echo Test de connectivité Azure en cours...
-python -c "import sys; sys.path.insert(0, 'src'); from loaders import load_df; print('Test Azure:', 'OK' if load_df(source='azure', filename='df_light.parquet', container_name='artefacts-fresh') is not None else 'ECHEC')" 2>nul || echo Test Azure : Connexion indisponible
+python -c "import p10_reco.wrappers; from p10_reco.loaders import load_df; print('Test Azure:', 'OK' if load_df(source='azure', filename='df_light.parquet', container_name='artefacts-fresh') is not None else 'ECHEC')" 2>nul || echo Test Azure : Connexion indisponible
 
 echo.
 echo === VALIDATION API AZURE FUNCTION (si disponible) ===
@@ -0,0 +1,59 @@
+# scripts/ann_recall_report.py
+
+# ============================================================================
+# RAPPORT : rappel@k de l'index IVF (CBF approché) vs recherche exacte
+# ============================================================================
+
+import os
+import argparse
+import numpy as np
+
+from p10_reco.loaders import load_df, load_embeddings
+from p10_reco.click_index import build_user_click_index
+from p10_reco.ann_index import build_ivf_index, recall_at_k_report
+
+# Racine du projet (outputs/, models/) ; p10_reco est installé (pip install -e .)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def build_user_queries(df, embeddings, n_users: int = 200, seed: int = 0) -> np.ndarray:
+    """
+    Profils CBF (normalisés) d'un échantillon d'utilisateurs, utilisés comme requêtes.
+    Les embeddings sont indexés par article_id (lignes du fichier .npz).
+    """
+    index = build_user_click_index(df)
+    rng = np.random.default_rng(seed)
+    user_ids = rng.choice(index.user_ids, size=min(n_users, index.n_users), replace=False)
+
+    queries = []
+    for user_id in user_ids:
+        rows = index.get_articles(user_id)
+        rows = rows[rows < len(embeddings)]
+        if len(rows):
+            profile = embeddings[rows].mean(axis=0)
+            queries.append(profile / np.linalg.norm(profile))
+    return np.array(queries, dtype=embeddings.dtype)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rappel@k de l'index IVF selon n_probe")
+    parser.add_argument("--df", default="df.parquet", help="Fichier de clics dans outputs/")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--n-lists", type=int, default=None)
+    parser.add_argument("--n-users", type=int, default=200)
+    args = parser.parse_args()
+
+    embeddings = load_embeddings(source="local")
+    df = load_df(source="local", filename=args.df)
+    print(f">>> Embeddings : {embeddings.shape}, clics : {len(df):,}")
+
+    index = build_ivf_index(embeddings, n_lists=args.n_lists)
+    print(f">>> Index IVF : {index.n_lists} listes")
+
+    queries = build_user_queries(df, embeddings, n_users=args.n_users)
+    report = recall_at_k_report(index, embeddings, queries, k=args.k)
+    print(report.to_string(index=False))
+
+
+# Exécution depuis le terminal (racine du projet) :
+# python scripts/ann_recall_report.py --k 10
@@ -0,0 +1,37 @@
+# scripts/build_function_app.py
+
+# ============================================================================
+# BUILD : copie du package de service src/p10_reco dans les Function Apps
+# ============================================================================
+# Azure Functions ajoute la racine de l'app au sys.path : le package copié à
+# côté de get_recommendations/ s'importe normalement (from p10_reco import ...).
+# src/p10_reco reste l'unique source ; les copies ne sont pas versionnées.
+
+import os
+import sys
+import shutil
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+package_src = os.path.join(project_root, "src", "p10_reco")
+default_apps = [os.path.join(project_root, "azure", "function_app"),
+                os.path.join(project_root, "azure", "function_app2")]
+
+
+def vendor_package(app_dir: str) -> str:
+    """Remplace app_dir/p10_reco par une copie à jour de src/p10_reco"""
+    target = os.path.join(app_dir, "p10_reco")
+    if os.path.exists(target):
+        shutil.rmtree(target)
+    shutil.copytree(package_src, target, ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+    return target
+
+
+if __name__ == "__main__":
+    apps = sys.argv[1:] or default_apps
+    for app_dir in apps:
+        print(f">>> Package copié : {vendor_package(os.path.abspath(app_dir))}")
+
+
+# Exécution depuis le terminal (racine du projet), avant chaque publication :
+# python scripts/build_function_app.py                      (les deux Function Apps)
+# python scripts/build_function_app.py azure/function_app   (une seule)
@@ -5,9 +5,9 @@ from dotenv import load_dotenv
 import pandas as pd
 import numpy as np
 
-from src.loaders import (
+from p10_reco.loaders import (
     load_df,
-    load_embeddings,
+    load_embeddings_with_ids,
     load_cf_model
 )
 
@@ -24,8 +24,8 @@ print("Chargement des artefacts en LOCAL")
 df_local = load_df(source="local")
 print(f"✔ df_local : {df_local.shape}")
 
-embeddings_local, mapping_local = load_embeddings(source="local")
-print(f"✔ embeddings_local : {embeddings_local.shape}, mapping : {len(mapping_local)} articles")
+embeddings_local, article_ids_local, _ = load_embeddings_with_ids(source="local")
+print(f"✔ embeddings_local : {embeddings_local.shape}, article_id : {len(article_ids_local)} articles")
 
 model_local = load_cf_model(source="local")
 print("✔ Modèle CF local chargé")
@@ -36,8 +36,10 @@ print("\nChargement des artefacts depuis AZURE Blob Storage")
 df_blob = load_df(source="azure", connection_string=AZURE_CONN_STR)
 print(f"✔ df_blob : {df_blob.shape}")
 
-embeddings_blob, mapping_blob = load_embeddings(source="azure", connection_string=AZURE_CONN_STR)
-print(f"✔ embeddings_blob : {embeddings_blob.shape}, mapping : {len(mapping_blob)} articles")
+embeddings_blob, article_ids_blob, _ = load_embeddings_with_ids(source="azure",
+                                                                filename="articles_embeddings_light.npy",
+                                                                connection_string=AZURE_CONN_STR)
+print(f"✔ embeddings_blob : {embeddings_blob.shape}, article_id : {len(article_ids_blob)} articles")
 
 model_blob = load_cf_model(source="azure", connection_string=AZURE_CONN_STR)
 print("✔ Modèle CF Azure chargé")
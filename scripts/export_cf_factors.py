@@ -0,0 +1,29 @@
+# scripts/export_cf_factors.py
+
+# ============================================================================
+# EXPORT : model_cf*.pkl (Surprise) → model_cf*_factors/ (tableaux .npy mappables)
+# ============================================================================
+
+import os
+
+from surprise import dump  # Extra "train" (pip install -e .[train])
+from p10_reco.cf_scoring import CFFactors, save_cf_factors
+
+# Racine du projet (outputs/, models/) ; p10_reco est installé (pip install -e .)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+for model_name in ["model_cf", "model_cf_light"]:
+    model_path = os.path.join(project_root, "models", f"{model_name}.pkl")
+    if not os.path.exists(model_path):
+        print(f">>> Modèle absent, ignoré : {model_path}")
+        continue
+
+    _, model = dump.load(model_path)
+    output_dir = save_cf_factors(CFFactors.from_svd(model), os.path.join(project_root, "models", f"{model_name}_factors"))
+    size = sum(os.path.getsize(os.path.join(output_dir, f)) for f in os.listdir(output_dir))
+    print(f">>> {model_name} : {os.path.getsize(model_path) / 1e6:.1f} Mo (pickle) → {size / 1e6:.1f} Mo ({output_dir})")
+
+
+# Exécution depuis le terminal (racine du projet), puis upload du dossier sur le conteneur Blob
+# (blobs model_cf_light_factors/<tableau>.npy) :
+# python scripts/export_cf_factors.py
@@ -0,0 +1,48 @@
+# scripts/export_embeddings_npy.py
+
+# ============================================================================
+# EXPORT : articles_embeddings_compressed.npz → articles_embeddings.npy (memmap)
+#          df_articles_light.parquet → articles_embeddings_light.npy (--light, Azure)
+# ============================================================================
+
+import os
+import argparse
+import numpy as np
+
+from p10_reco.embeddings import save_embeddings_npy
+from p10_reco.loaders import read_parquet
+
+# Racine du projet (outputs/, models/) ; p10_reco est installé (pip install -e .)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+parser = argparse.ArgumentParser(description="Exporte les embeddings au format .npy mappable")
+parser.add_argument("--light", action="store_true",
+                    help="Catalogue allégé de df_articles_light.parquet (artefact servi sur Azure)")
+args = parser.parse_args()
+
+if args.light:
+    # Mêmes articles que les métadonnées affichées par app.py (df_articles_light.parquet)
+    parquet_path = os.path.join(project_root, "outputs", "df_articles_light.parquet")
+    npy_path = os.path.join(project_root, "outputs", "articles_embeddings_light.npy")
+
+    df_articles = read_parquet(parquet_path, columns=["article_id", "embedding"])
+    embeddings = np.array(df_articles["embedding"].tolist())
+    article_ids = df_articles["article_id"].to_numpy(dtype=np.int64)
+    print(f">>> Embeddings chargés depuis {parquet_path} : {embeddings.shape}")
+else:
+    npz_path = os.path.join(project_root, "outputs", "articles_embeddings_compressed.npz")
+    npy_path = os.path.join(project_root, "outputs", "articles_embeddings.npy")
+
+    embeddings = np.load(npz_path)["embeddings"]
+    # Ligne i du .npz = article_id i (ordre de articles_metadata.csv)
+    article_ids = np.arange(len(embeddings), dtype=np.int64)
+    print(f">>> Embeddings chargés depuis {npz_path} : {embeddings.shape}")
+
+save_embeddings_npy(embeddings, npy_path, article_ids=article_ids)
+print(f">>> Artefact mappable écrit : {npy_path} ({os.path.getsize(npy_path) / 1e6:.1f} Mo)")
+
+
+# Exécution depuis le terminal (racine du projet), puis upload des trois .npy
+# (matrice, _article_ids, _norms) sur le conteneur Blob :
+# python scripts/export_embeddings_npy.py            (local : catalogue complet)
+# python scripts/export_embeddings_npy.py --light    (Azure : catalogue de df_articles_light)
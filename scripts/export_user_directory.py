@@ -0,0 +1,50 @@
+# scripts/export_user_directory.py
+
+# ============================================================================
+# EXPORT : df*.parquet → user_directory*.npy (user_id int32, nb de clics, offset CSR)
+#          + user_profiles*.npy (profils CBF float32, mêmes lignes que l'annuaire)
+# ============================================================================
+
+import os
+import argparse
+
+from p10_reco.loaders import CLICK_COLUMNS, read_parquet, load_embeddings_with_ids
+from p10_reco.article_index import ArticleIndex
+from p10_reco.click_index import build_user_click_index
+from p10_reco.user_directory import build_user_directory, save_user_directory
+from p10_reco.user_profiles import build_user_profiles, save_user_profiles
+
+# Racine du projet (outputs/, models/) ; p10_reco est installé (pip install -e .)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+parser = argparse.ArgumentParser(description="Exporte l'annuaire utilisateurs et les profils CBF (lignes alignées)")
+parser.add_argument("--light", action="store_true",
+                    help="Artefacts allégés seulement (df_light.parquet, servis sur Azure)")
+args = parser.parse_args()
+
+# Profils calculés sur les embeddings servis avec chaque table de clics (cf. wrappers.ARTIFACT_FILES)
+datasets = [("df_light", "_light")] if args.light else [("df", ""), ("df_light", "_light")]
+for df_name, suffix in datasets:
+    df_path = os.path.join(project_root, "outputs", f"{df_name}.parquet")
+    embeddings_name = f"articles_embeddings{suffix}.npy"
+    if not os.path.exists(df_path) or not os.path.exists(os.path.join(project_root, "outputs", embeddings_name)):
+        print(f">>> Fichier absent, ignoré : {df_path} ou {embeddings_name}")
+        continue
+
+    embeddings, article_ids, norms = load_embeddings_with_ids(source="local", filename=embeddings_name)
+    article_index = ArticleIndex.from_article_ids(article_ids, norms=norms)
+
+    click_index = build_user_click_index(read_parquet(df_path, columns=CLICK_COLUMNS))
+    directory = build_user_directory(click_index)
+    output_path = save_user_directory(directory, os.path.join(project_root, "outputs", f"user_directory{suffix}.npy"))
+    print(f">>> {df_name} : {directory.n_users:,} utilisateurs → {os.path.getsize(output_path) / 1e3:.1f} Ko ({output_path})")
+
+    profiles = build_user_profiles(click_index, embeddings, article_index)
+    output_path = save_user_profiles(profiles, os.path.join(project_root, "outputs", f"user_profiles{suffix}.npy"))
+    print(f">>> {df_name} : profils {profiles.vectors.shape} → {os.path.getsize(output_path) / 1e6:.1f} Mo ({output_path})")
+
+
+# Exécution depuis le terminal (racine du projet), puis upload de user_directory_light.npy
+# (lu par la Function et par app.py) et de user_profiles_light.npy sur le conteneur Blob :
+# python scripts/export_user_directory.py            (df et df_light)
+# python scripts/export_user_directory.py --light    (df_light seulement, cf. notebooks/03_generate_light_artifacts.ipynb)
@@ -0,0 +1,64 @@
+# scripts/precompute_recommendations.py
+
+# ============================================================================
+# PRÉCALCUL : top-N par utilisateur valide et par configuration (cbf, cf, hybrid x alpha)
+# ============================================================================
+
+import os
+import json
+import time
+import argparse
+
+from p10_reco.wrappers import ARTIFACT_FILES, get_artifacts, source_versions
+from p10_reco.precomputed import DEFAULT_ALPHAS, build_precomputed_table, save_precomputed_table
+
+# Racine du projet (outputs/, models/) ; p10_reco est installé (pip install -e .)
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Précalcule la table de recommandations servie par le wrapper")
+    parser.add_argument("--source", default="local", choices=["local", "azure"],
+                        help="Artefacts de départ (la table est nommée d'après ARTIFACT_FILES[source])")
+    parser.add_argument("--users", default=os.path.join(project_root, "outputs", "user_ids_valid.json"))
+    parser.add_argument("--top-n", type=int, default=10, help="N stocké (le curseur de app.py va jusqu'à 10)")
+    parser.add_argument("--alphas", type=float, nargs="+", default=list(DEFAULT_ALPHAS))
+    args = parser.parse_args()
+
+    with open(args.users) as f:
+        user_ids = json.load(f)
+
+    # Versions lues avant le chargement : un artefact republié entre-temps rend la table invalide, jamais l'inverse
+    sources = source_versions(args.source)
+    # Empreintes du contenu (lecture complète, hors ligne uniquement) : traçabilité dans meta.json
+    digests = source_versions(args.source, content=True) if args.source == "local" else None
+    artifacts = get_artifacts(source=args.source, mode="hybrid")
+    print(f">>> {len(user_ids)} utilisateurs, {2 + len(args.alphas)} configurations, top {args.top_n}")
+
+    start = time.perf_counter()
+    table = build_precomputed_table(user_ids,
+                                    df=artifacts["df"],
+                                    model_cf=artifacts["model_cf"],
+                                    embeddings=artifacts["embeddings"],
+                                    article_id_to_index=artifacts["article_index"],
+                                    click_index=artifacts["click_index"],
+                                    user_profiles=artifacts.get("user_profiles"),
+                                    alphas=args.alphas,
+                                    top_n=args.top_n,
+                                    sources=sources)
+    print(f">>> Table calculée en {time.perf_counter() - start:.1f} s")
+
+    output_dir = save_precomputed_table(table, os.path.join(project_root, "models",
+                                                            ARTIFACT_FILES[args.source]["precomputed"]),
+                                        source_digests=digests)
+    size = sum(os.path.getsize(os.path.join(output_dir, f)) for f in os.listdir(output_dir))
+    print(f">>> {output_dir} : {size / 1e6:.1f} Mo")
+
+
+# Exécution depuis le terminal (racine du projet), à relancer après chaque réentraînement
+# ou republication des clics / embeddings (la table n'est servie qu'avec les artefacts dont
+# meta.json enregistre les versions : taille et date de modification en local, une copie
+# des fichiers invalide donc la table) ; pour Azure, calcul sur les blobs publiés (ETag),
+# puis upload du dossier sur le conteneur Blob (blobs reco_table_light/<tableau>.npy) :
+# python scripts/precompute_recommendations.py --source local
+# python scripts/precompute_recommendations.py --source azure
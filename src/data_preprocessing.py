@@ -5,7 +5,10 @@ import pandas as pd
 import numpy as np
 import pickle
 from typing import Tuple
-from sklearn.decomposition import PCA
+
+# Format des embeddings servis (matrice normalisée .npy + article_id) : défini dans le package de service
+from p10_reco.embeddings import normalize_embeddings, article_ids_path, save_embeddings_npy
+from p10_reco.article_index import ArticleIndex
 
 
 def load_metadata(metadata_path: str) -> pd.DataFrame:
@@ -46,6 +49,8 @@ def reduce_embeddings(embeddings_array: np.ndarray, n_components: int = 100) ->
     Returns:
         np.ndarray: matrice réduite (nb_articles, n_components)
     """
+    from sklearn.decomposition import PCA  # import local : inutile au service de recommandations
+
     pca = PCA(n_components=n_components)
     # fit_transform sur l'ensemble des embeddings
     reduced = pca.fit_transform(embeddings_array)
@@ -121,7 +126,7 @@ def load_all_data(data_path: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFr
     return df_clicks_full, df_clicks_sample, df_articles
 
 
-def load_article_embeddings(df_articles_path : str, embedding_col : str = "embedding") -> Tuple[np.ndarray, dict]:
+def load_article_embeddings(df_articles_path : str, embedding_col : str = "embedding") -> Tuple[np.ndarray, ArticleIndex]:
     """
     Charge les embeddings compressés des articles à partir d’un fichier parquet.
     
@@ -131,15 +136,16 @@ def load_article_embeddings(df_articles_path : str, embedding_col : str = "embed
         
     Returns:
         Tuple:
-            - embeddings (np.ndarray) : matrice (n_articles, n_dims)
-            - article_id_to_index (dict) : mapping {article_id: index}
+            - embeddings (np.ndarray) : matrice (n_articles, n_dims), L2-normalisée (float32)
+            - article_id_to_index (ArticleIndex) : correspondance article_id ↔ index en tableaux,
+              avec les normes d'origine des lignes (profils CBF sur les embeddings bruts)
     """
     df_articles = pd.read_parquet(df_articles_path)
 
     if embedding_col not in df_articles.columns:
         raise ValueError(f"Colonne '{embedding_col}' absente du fichier parquet.")
 
-    embeddings = np.array(df_articles[embedding_col].tolist())
-    article_id_to_index = {article_id: idx for idx, article_id in enumerate(df_articles["article_id"].values)}
+    embeddings, norms = normalize_embeddings(np.array(df_articles[embedding_col].tolist()), return_norms=True)
+    article_id_to_index = ArticleIndex.from_article_ids(df_articles["article_id"].values, norms=norms)
 
     return embeddings, article_id_to_index
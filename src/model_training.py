@@ -11,16 +11,19 @@ from surprise import Dataset, Reader, SVD
 from sklearn.decomposition import PCA
 import joblib
 
+from p10_reco.cf_scoring import CFFactors, save_cf_factors
+from p10_reco.article_index import ArticleIndex
+
 
 
 # pour lier df et embeddings
-def create_article_index_mapping(df_articles : pd.DataFrame) -> dict:
+def create_article_index_mapping(df_articles : pd.DataFrame) -> ArticleIndex:
     """
-    Crée un mapping article_id → index utilisé dans les embeddings.
+    Crée la correspondance article_id ↔ index utilisée dans les embeddings.
     - df_articles : DataFrame contenant 'article_id' (indexés de 0 à n)
-    Retour : dictionnaire {article_id: index}
+    Retour : ArticleIndex (tableaux id → index et index → id)
     """
-    return {article_id: idx for idx, article_id in enumerate(df_articles["article_id"].values)}
+    return ArticleIndex.from_article_ids(df_articles["article_id"].values)
 
 
 def train_cf_model(df : pd.DataFrame,
@@ -64,4 +67,25 @@ def train_cf_model(df : pd.DataFrame,
     # Sauvegarde avec surprise.dump
     dump.dump(model_path, algo = model)
 
+    # Artefact compact utilisé en production (cf. export_cf_factors)
+    export_cf_factors(model, os.path.splitext(model_path)[0] + "_factors")
+
     return model
+
+
+def export_cf_factors(model : SVD, output_dir : str) -> str:
+    """
+    Exporte un modèle SVD entraîné en artefact compact, sans le trainset ni pickle :
+    un .npy par tableau (user_ids, pu, bu, item_ids, qi, bi) + meta.json.
+
+    Les lignes sont triées par identifiant brut : user_ids / item_ids tiennent lieu
+    de mappings raw → inner (ligne = position dans le tableau trié).
+
+    Args:
+        model (SVD) : modèle CF entraîné
+        output_dir (str) : dossier de l'artefact (ex : models/model_cf_factors)
+
+    Returns:
+        str : dossier de l'artefact
+    """
+    return save_cf_factors(CFFactors.from_svd(model), output_dir)
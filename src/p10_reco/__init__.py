@@ -0,0 +1,25 @@
+# src/p10_reco/__init__.py
+# Package de service des recommandations (local, Streamlit, Azure Functions)
+
+from .wrappers import (
+    get_recommendations_from_user,
+    is_known_user,
+    ingest_clicks,
+    get_artifacts,
+    warmup,
+    reload,
+)
+from .recommendation_engine import get_recommendations, get_recommendations_batch
+
+__version__ = "0.1.0"
+
+__all__ = [
+    "get_recommendations_from_user",
+    "is_known_user",
+    "ingest_clicks",
+    "get_artifacts",
+    "warmup",
+    "reload",
+    "get_recommendations",
+    "get_recommendations_batch",
+]
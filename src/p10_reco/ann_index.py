@@ -0,0 +1,196 @@
+# src/p10_reco/ann_index.py
+
+import time
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .ranking import top_k_indices
+
+
+@dataclass(frozen=True)
+class IVFIndex:
+    """
+    Index IVF (inverted file) pour la recherche approchée des plus proches voisins.
+
+    Les articles sont répartis en n_lists groupes par k-means sphérique sur les
+    embeddings L2-normalisés. Une requête ne score que les articles des n_probe
+    groupes dont le centroïde est le plus proche : n_probe est le réglage
+    rappel / latence (n_probe = n_lists ⇔ recherche exacte).
+
+    Attributs :
+        centroids (np.ndarray) : centroïdes normalisés (n_lists, n_dims)
+        offsets (np.ndarray) : bornes des listes dans rows (n_lists + 1,)
+        rows (np.ndarray) : lignes d'embeddings regroupées par liste (n_articles,)
+        n_probe (int) : nombre de listes visitées par défaut
+    """
+    centroids: np.ndarray
+    offsets: np.ndarray
+    rows: np.ndarray
+    n_probe: int = 8
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+
+def _assign(embeddings: np.ndarray, centroids: np.ndarray, chunk_size: int = 16384) -> np.ndarray:
+    """
+    Centroïde le plus proche (produit scalaire max) de chaque ligne, par blocs
+    pour borner la mémoire à chunk_size x n_lists scores.
+    """
+    labels = np.empty(len(embeddings), dtype=np.int64)
+    for start in range(0, len(embeddings), chunk_size):
+        block = embeddings[start:start + chunk_size]
+        labels[start:start + chunk_size] = np.argmax(block @ centroids.T, axis=1)
+    return labels
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def build_ivf_index(embeddings: np.ndarray,
+                    n_lists: int = None,
+                    n_iter: int = 10,
+                    sample_size: int = 50000,
+                    n_probe: int = 8,
+                    seed: int = 0) -> IVFIndex:
+    """
+    Construit un index IVF par k-means sphérique (NumPy pur).
+
+    Args:
+        embeddings (np.ndarray): matrice L2-normalisée (n_articles, n_dims)
+        n_lists (int): nombre de groupes (défaut : 4 * sqrt(n_articles))
+        n_iter (int): itérations de k-means
+        sample_size (int): lignes tirées pour l'apprentissage des centroïdes
+        n_probe (int): groupes visités par défaut à la recherche
+        seed (int): graine aléatoire (index reproductible)
+
+    Returns:
+        IVFIndex: index prêt pour search_ivf
+    """
+    n_articles = len(embeddings)
+    if n_lists is None:
+        n_lists = max(1, int(4 * np.sqrt(n_articles)))
+    n_lists = min(n_lists, n_articles)
+
+    rng = np.random.default_rng(seed)
+    sample_rows = rng.choice(n_articles, size=min(sample_size, n_articles), replace=False)
+    sample = np.asarray(embeddings[sample_rows], dtype=np.float32)
+
+    # Initialisation sur des articles tirés au hasard, puis itérations de Lloyd
+    centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+    for _ in range(n_iter):
+        labels = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, sample)
+        empty = np.bincount(labels, minlength=n_lists) == 0
+        # Un groupe vide garde son centroïde précédent
+        sums[empty] = centroids[empty]
+        centroids = _normalize_rows(sums).astype(np.float32)
+
+    # Affectation de tout le catalogue et listes au format CSR
+    labels = _assign(embeddings, centroids)
+    rows = np.argsort(labels, kind="stable")
+    offsets = np.zeros(n_lists + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(labels, minlength=n_lists))
+
+    return IVFIndex(centroids=centroids, offsets=offsets, rows=rows, n_probe=min(n_probe, n_lists))
+
+
+def search_ivf(index: IVFIndex,
+               embeddings: np.ndarray,
+               query: np.ndarray,
+               k: int,
+               n_probe: int = None,
+               exclude_rows: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Recherche approchée des k articles les plus similaires à une requête.
+
+    Si les n_probe groupes visités contiennent moins de k articles non exclus
+    (petits groupes, gros historique), les groupes suivants sont visités
+    (n_probe doublé) jusqu'à k candidats ou jusqu'à la recherche exacte.
+
+    Args:
+        index (IVFIndex): index construit par build_ivf_index
+        embeddings (np.ndarray): matrice L2-normalisée indexée
+        query (np.ndarray): vecteur requête normalisé (n_dims,)
+        k (int): nombre de résultats
+        n_probe (int): groupes visités (défaut : index.n_probe)
+        exclude_rows (np.ndarray): lignes à exclure (ex : articles déjà vus)
+
+    Returns:
+        Tuple: (lignes d'embeddings, scores), triés par score décroissant
+    """
+    n_probe = index.n_probe if n_probe is None else min(n_probe, index.n_lists)
+    query = query.astype(embeddings.dtype, copy=False)
+    centroid_scores = index.centroids @ query
+
+    while True:
+        # top_k_indices est stable : les groupes déjà visités restent en tête de liste
+        lists = top_k_indices(centroid_scores, n_probe)
+        candidates = np.concatenate([index.rows[index.offsets[c]:index.offsets[c + 1]] for c in lists])
+        if exclude_rows is not None and len(exclude_rows):
+            candidates = candidates[~np.isin(candidates, exclude_rows)]
+        if len(candidates) >= k or n_probe >= index.n_lists:
+            break
+        n_probe = min(2 * n_probe, index.n_lists)
+
+    scores = embeddings[candidates] @ query
+    top = top_k_indices(scores, k)
+    return candidates[top], scores[top]
+
+
+def recall_at_k_report(index: IVFIndex,
+                       embeddings: np.ndarray,
+                       queries: np.ndarray,
+                       k: int = 10,
+                       n_probe_grid: Iterable[int] = (1, 2, 4, 8, 16, 32)) -> pd.DataFrame:
+    """
+    Compare la recherche IVF à la recherche exacte pour choisir n_probe.
+
+    Args:
+        index (IVFIndex): index évalué
+        embeddings (np.ndarray): matrice L2-normalisée indexée
+        queries (np.ndarray): requêtes normalisées (n_queries, n_dims), ex : profils utilisateurs
+        k (int): taille des listes comparées
+        n_probe_grid (Iterable[int]): valeurs de n_probe testées
+
+    Returns:
+        pd.DataFrame: une ligne par n_probe (recall@k, latence moyenne en ms,
+                      fraction du catalogue scorée), plus la référence exacte
+    """
+    exact_results = []
+    start = time.perf_counter()
+    for query in queries:
+        exact_results.append(set(top_k_indices(embeddings @ query, k).tolist()))
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    report = [{"n_probe": index.n_lists, "method": "exact", f"recall@{k}": 1.0,
+               "latency_ms": exact_ms, "scanned_fraction": 1.0}]
+
+    sizes = np.diff(index.offsets)
+    for n_probe in n_probe_grid:
+        n_probe = min(n_probe, index.n_lists)
+        hits, scanned = 0, 0
+        start = time.perf_counter()
+        for query, expected in zip(queries, exact_results):
+            rows, _ = search_ivf(index, embeddings, query, k, n_probe=n_probe)
+            hits += len(expected.intersection(rows.tolist()))
+        latency_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        # Fraction moyenne du catalogue réellement scorée
+        for query in queries:
+            scanned += sizes[top_k_indices(index.centroids @ query.astype(index.centroids.dtype), n_probe)].sum()
+
+        report.append({"n_probe": n_probe, "method": "ivf",
+                       f"recall@{k}": hits / (k * len(queries)),
+                       "latency_ms": latency_ms,
+                       "scanned_fraction": scanned / (len(queries) * len(embeddings))})
+
+    return pd.DataFrame(report)
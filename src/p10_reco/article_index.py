@@ -0,0 +1,105 @@
+# src/p10_reco/article_index.py
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ArticleIndex:
+    """
+    Correspondance article_id ↔ ligne de la matrice d'embeddings, en tableaux.
+
+    Les article_id étant de petits entiers, id → ligne est un adressage direct
+    dans un tableau dense (quelques Mo pour tout le catalogue, contre des
+    centaines de Mo de dict Python) ; ligne → id est le tableau des article_id
+    enregistré avec les embeddings (cf. embeddings.article_ids_path).
+
+    Attributs :
+        id_to_row (np.ndarray) : ligne de chaque article_id, -1 si absent (max_id + 1,)
+        row_to_id (np.ndarray) : article_id de chaque ligne, -1 si aucun (n_rows,)
+        norms (np.ndarray) : norme d'origine de chaque ligne de la matrice normalisée
+                             (cf. embeddings.mean_profile), None si inconnue (n_rows,)
+    """
+    id_to_row: np.ndarray
+    row_to_id: np.ndarray
+    norms: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_article_ids(cls, article_ids, norms=None) -> "ArticleIndex":
+        """
+        Index construit à partir de l'article_id de chaque ligne (un seul scatter),
+        avec, si elles sont connues, les normes d'origine des lignes.
+        """
+        row_to_id = np.asarray(article_ids, dtype=np.int64)
+        if len(row_to_id) and row_to_id.min() < 0:
+            raise ValueError("article_id négatif : adressage direct impossible")
+
+        id_to_row = np.full(int(row_to_id.max()) + 1 if len(row_to_id) else 0, -1, dtype=np.int32)
+        id_to_row[row_to_id] = np.arange(len(row_to_id), dtype=np.int32)
+        if norms is not None and len(norms) != len(row_to_id):
+            raise ValueError(f"Erreur : {len(norms)} normes vs {len(row_to_id)} article_id")
+        return cls(id_to_row=id_to_row, row_to_id=row_to_id, norms=norms)
+
+    @classmethod
+    def from_dict(cls, article_id_to_index: dict) -> "ArticleIndex":
+        """
+        Conversion d'un ancien mapping {article_id: ligne} (lignes sans article_id → -1).
+        """
+        ids = np.fromiter(article_id_to_index.keys(), dtype=np.int64, count=len(article_id_to_index))
+        rows = np.fromiter(article_id_to_index.values(), dtype=np.int64, count=len(article_id_to_index))
+        if len(ids) and ids.min() < 0:
+            raise ValueError("article_id négatif : adressage direct impossible")
+
+        id_to_row = np.full(int(ids.max()) + 1 if len(ids) else 0, -1, dtype=np.int32)
+        id_to_row[ids] = rows
+        row_to_id = np.full(int(rows.max()) + 1 if len(rows) else 0, -1, dtype=np.int64)
+        row_to_id[rows] = ids
+        return cls(id_to_row=id_to_row, row_to_id=row_to_id)
+
+    def rows(self, article_ids) -> np.ndarray:
+        """
+        Lignes des articles (vectorisé), -1 pour les articles absents.
+        """
+        article_ids = np.asarray(article_ids, dtype=np.int64)
+        rows = np.full(article_ids.shape, -1, dtype=np.int64)
+        inside = (article_ids >= 0) & (article_ids < len(self.id_to_row))
+        rows[inside] = self.id_to_row[article_ids[inside]]
+        return rows
+
+    def ids(self, rows) -> np.ndarray:
+        """
+        article_id des lignes (vectorisé), -1 pour les lignes sans article.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        ids = np.full(rows.shape, -1, dtype=np.int64)
+        inside = (rows >= 0) & (rows < len(self.row_to_id))
+        ids[inside] = self.row_to_id[rows[inside]]
+        return ids
+
+    # Accès unitaire compatible avec l'ancien dict (notebooks, scripts)
+    def get(self, article_id, default=None):
+        row = int(self.rows([article_id])[0])
+        return row if row >= 0 else default
+
+    def __getitem__(self, article_id) -> int:
+        row = self.get(article_id)
+        if row is None:
+            raise KeyError(article_id)
+        return row
+
+    def __contains__(self, article_id) -> bool:
+        return self.get(article_id) is not None
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.id_to_row >= 0))
+
+
+def as_article_index(article_id_to_index) -> ArticleIndex:
+    """
+    ArticleIndex à partir d'un ArticleIndex (inchangé) ou d'un dict {article_id: ligne}.
+    """
+    if isinstance(article_id_to_index, ArticleIndex):
+        return article_id_to_index
+    return ArticleIndex.from_dict(article_id_to_index)
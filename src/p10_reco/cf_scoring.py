@@ -0,0 +1,213 @@
+# src/p10_reco/cf_scoring.py
+
+import os
+import json
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+# Tableaux de l'artefact de facteurs (un .npy par tableau) + métadonnées scalaires
+CF_FACTOR_ARRAYS = ("user_ids", "pu", "bu", "item_ids", "qi", "bi")
+CF_FACTOR_META = "meta.json"
+
+
+@dataclass(frozen=True)
+class CFFactors:
+    """
+    Facteurs d'un modèle SVD (Surprise) extraits une fois pour un scoring vectorisé.
+
+    Les identifiants bruts sont triés et les lignes de facteurs/biais sont
+    alignées sur cet ordre : raw id → ligne par recherche dichotomique.
+
+    Attributs :
+        user_ids (np.ndarray) : user_id bruts triés (n_users,)
+        pu (np.ndarray) : facteurs utilisateurs (n_users, n_factors)
+        bu (np.ndarray) : biais utilisateurs (n_users,)
+        item_ids (np.ndarray) : article_id bruts triés (n_items,)
+        qi (np.ndarray) : facteurs articles (n_items, n_factors)
+        bi (np.ndarray) : biais articles (n_items,)
+        global_mean (float) : moyenne globale des notes
+        rating_scale (tuple) : bornes (min, max) de l'échelle de notes
+        biased (bool) : modèle entraîné avec biais (SVD(biased=True))
+    """
+    user_ids: np.ndarray
+    pu: np.ndarray
+    bu: np.ndarray
+    item_ids: np.ndarray
+    qi: np.ndarray
+    bi: np.ndarray
+    global_mean: float
+    rating_scale: Tuple[float, float]
+    biased: bool = True
+
+    @classmethod
+    def from_svd(cls, model) -> "CFFactors":
+        """
+        Extrait pu, qi, bu, bi, la moyenne globale et les mappings raw → inner
+        d'un modèle Surprise SVD entraîné.
+        """
+        trainset = model.trainset
+
+        user_raw, user_inner = _sorted_raw_to_inner(trainset._raw2inner_id_users)
+        item_raw, item_inner = _sorted_raw_to_inner(trainset._raw2inner_id_items)
+
+        return cls(user_ids=user_raw,
+                   pu=np.ascontiguousarray(model.pu[user_inner]),
+                   bu=np.asarray(model.bu)[user_inner],
+                   item_ids=item_raw,
+                   qi=np.ascontiguousarray(model.qi[item_inner]),
+                   bi=np.asarray(model.bi)[item_inner],
+                   global_mean=float(trainset.global_mean),
+                   rating_scale=tuple(trainset.rating_scale),
+                   biased=bool(model.biased))
+
+    def user_position(self, user_id) -> int:
+        """
+        Ligne de l'utilisateur dans pu/bu, -1 s'il est inconnu du modèle.
+        """
+        pos = int(np.searchsorted(self.user_ids, user_id))
+        if pos < len(self.user_ids) and self.user_ids[pos] == user_id:
+            return pos
+        return -1
+
+    def user_positions(self, user_ids) -> np.ndarray:
+        """
+        Lignes des utilisateurs dans pu/bu (vectorisé), -1 pour les inconnus.
+        """
+        return _lookup_positions(self.user_ids, user_ids)
+
+    def item_positions(self, article_ids) -> np.ndarray:
+        """
+        Lignes des articles dans qi/bi (vectorisé), -1 pour les articles inconnus.
+        """
+        return _lookup_positions(self.item_ids, article_ids)
+
+    def score(self, user_id, article_ids) -> np.ndarray:
+        """
+        Scores CF de l'utilisateur pour une liste d'articles, en un seul produit
+        matrice-vecteur. Identique à model.predict(user_id, aid).est, y compris
+        le repli sur la moyenne globale et l'écrêtage à l'échelle de notes.
+        """
+        u = self.user_position(user_id)
+        items = self.item_positions(article_ids)
+        known = items >= 0
+        known_items = items[known]
+
+        est = np.full(len(items), self.global_mean, dtype=np.float64)
+
+        if self.biased:
+            if u >= 0:
+                est += self.bu[u]
+            est[known] += self.bi[known_items]
+            if u >= 0:
+                est[known] += self.qi[known_items] @ self.pu[u]
+        elif u >= 0:
+            # Sans biais : prédiction impossible (→ moyenne globale) hors couples connus
+            est[known] = self.qi[known_items] @ self.pu[u]
+
+        lower_bound, higher_bound = self.rating_scale
+        return np.clip(est, lower_bound, higher_bound)
+
+    def prepare_items(self, article_ids) -> "CFItems":
+        """
+        Partie articles du scoring d'un catalogue (positions, facteurs, biais),
+        calculée une fois puis réutilisée par score_matrix pour chaque bloc.
+        """
+        items = self.item_positions(article_ids)
+        known_items = items >= 0
+
+        # Facteurs nuls pour les inconnus : seuls les couples connus ont un produit scalaire
+        item_factors = np.zeros((len(items), self.qi.shape[1]), dtype=self.qi.dtype)
+        item_factors[known_items] = self.qi[items[known_items]]
+        bi = np.where(known_items, self.bi[items], 0.0)
+        return CFItems(known=known_items, factors=item_factors, bi=bi)
+
+    def score_matrix(self, user_ids, article_ids=None, items: "CFItems" = None) -> np.ndarray:
+        """
+        Scores CF (n_users, n_articles) d'un bloc d'utilisateurs, en un seul
+        produit matrice-matrice. Chaque ligne est identique à score().
+        items : catalogue préparé par prepare_items (sinon préparé ici depuis article_ids)
+        """
+        if items is None:
+            items = self.prepare_items(article_ids)
+
+        users = self.user_positions(user_ids)
+        known_users = users >= 0
+        user_factors = np.zeros((len(users), self.pu.shape[1]), dtype=self.pu.dtype)
+        user_factors[known_users] = self.pu[users[known_users]]
+        dots = user_factors @ items.factors.T
+
+        if self.biased:
+            bu = np.where(known_users, self.bu[users], 0.0)
+            est = self.global_mean + bu[:, None] + items.bi[None, :] + dots
+        else:
+            known = known_users[:, None] & items.known[None, :]
+            est = np.where(known, dots, self.global_mean)
+
+        lower_bound, higher_bound = self.rating_scale
+        return np.clip(est, lower_bound, higher_bound)
+
+
+@dataclass(frozen=True)
+class CFItems:
+    """
+    Catalogue préparé pour CFFactors.score_matrix (cf. prepare_items).
+
+    Attributs :
+        known (np.ndarray) : articles connus du modèle (n_articles,)
+        factors (np.ndarray) : facteurs articles, nuls pour les inconnus (n_articles, n_factors)
+        bi (np.ndarray) : biais articles, nuls pour les inconnus (n_articles,)
+    """
+    known: np.ndarray
+    factors: np.ndarray
+    bi: np.ndarray
+
+
+def _lookup_positions(sorted_ids: np.ndarray, ids) -> np.ndarray:
+    """
+    Position de chaque id dans un tableau trié (recherche dichotomique), -1 si absent.
+    """
+    ids = np.asarray(ids)
+    if len(sorted_ids) == 0:
+        return np.full(ids.shape, -1, dtype=np.int64)
+    pos = np.searchsorted(sorted_ids, ids)
+    pos = np.minimum(pos, len(sorted_ids) - 1)
+    return np.where(sorted_ids[pos] == ids, pos, -1)
+
+
+def _sorted_raw_to_inner(raw2inner: dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convertit un dict raw id → inner id en deux tableaux triés par raw id.
+    """
+    raw_ids = np.array(list(raw2inner.keys()))
+    inner_ids = np.fromiter(raw2inner.values(), dtype=np.int64, count=len(raw2inner))
+    order = np.argsort(raw_ids, kind="stable")
+    return raw_ids[order], inner_ids[order]
+
+
+def save_cf_factors(factors: CFFactors, output_dir: str) -> str:
+    """
+    Écrit des CFFactors en artefact mappable : un .npy par tableau
+    (CF_FACTOR_ARRAYS) + meta.json (moyenne globale, échelle, biais).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    for name in CF_FACTOR_ARRAYS:
+        np.save(os.path.join(output_dir, f"{name}.npy"), np.ascontiguousarray(getattr(factors, name)))
+
+    with open(os.path.join(output_dir, CF_FACTOR_META), "w") as f:
+        json.dump({"global_mean": factors.global_mean,
+                   "rating_scale": list(factors.rating_scale),
+                   "biased": factors.biased}, f)
+
+    return output_dir
+
+
+def get_cf_scorer(model) -> CFFactors:
+    """
+    Renvoie des CFFactors prêts au scoring à partir d'un SVD ou de CFFactors.
+    """
+    if isinstance(model, CFFactors):
+        return model
+    return CFFactors.from_svd(model)
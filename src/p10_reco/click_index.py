@@ -0,0 +1,94 @@
+# src/p10_reco/click_index.py
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class UserClickIndex:
+    """
+    Index compact utilisateur → articles cliqués, au format CSR.
+
+    Les articles cliqués par l'utilisateur user_ids[i] sont
+    article_ids[offsets[i]:offsets[i + 1]] (sans doublons, triés).
+
+    Attributs :
+        user_ids (np.ndarray) : identifiants utilisateurs triés (n_users,)
+        offsets (np.ndarray) : bornes des historiques dans article_ids (n_users + 1,)
+        article_ids (np.ndarray) : articles cliqués, concaténés par utilisateur
+        click_counts (np.ndarray) : nombre total de clics par utilisateur (doublons inclus)
+        all_articles (np.ndarray) : articles présents dans les clics (ordre d'apparition)
+    """
+    user_ids: np.ndarray
+    offsets: np.ndarray
+    article_ids: np.ndarray
+    click_counts: np.ndarray
+    all_articles: np.ndarray
+
+    @property
+    def n_users(self) -> int:
+        return len(self.user_ids)
+
+    def position(self, user_id: int) -> int:
+        """
+        Renvoie la ligne de l'utilisateur dans l'index (-1 s'il est inconnu).
+        Recherche dichotomique : O(log n_users).
+        """
+        pos = int(np.searchsorted(self.user_ids, user_id))
+        if pos < len(self.user_ids) and self.user_ids[pos] == user_id:
+            return pos
+        return -1
+
+    def get_articles(self, user_id: int) -> np.ndarray:
+        """
+        Articles (uniques) cliqués par l'utilisateur, vide s'il est inconnu.
+        """
+        pos = self.position(user_id)
+        if pos < 0:
+            return self.article_ids[:0]
+        return self.article_ids[self.offsets[pos]:self.offsets[pos + 1]]
+
+    def get_click_count(self, user_id: int) -> int:
+        """
+        Nombre total de clics de l'utilisateur (0 s'il est inconnu).
+        """
+        pos = self.position(user_id)
+        return int(self.click_counts[pos]) if pos >= 0 else 0
+
+
+def build_user_click_index(df: pd.DataFrame) -> UserClickIndex:
+    """
+    Construit l'index CSR à partir du DataFrame de clics (un seul passage trié).
+
+    Args:
+        df (pd.DataFrame): interactions (colonnes : user_id, article_id)
+
+    Returns:
+        UserClickIndex: index prêt à être partagé entre requêtes
+    """
+    users = df["user_id"].to_numpy()
+    articles = df["article_id"].to_numpy()
+
+    # Tri par (user_id, article_id) : les historiques deviennent contigus
+    order = np.lexsort((articles, users))
+    users_sorted = users[order]
+    articles_sorted = articles[order]
+
+    user_ids, click_counts = np.unique(users_sorted, return_counts=True)
+
+    # Suppression des clics répétés sur un même article
+    keep = np.ones(len(users_sorted), dtype=bool)
+    keep[1:] = (users_sorted[1:] != users_sorted[:-1]) | (articles_sorted[1:] != articles_sorted[:-1])
+    users_unique = users_sorted[keep]
+
+    offsets = np.empty(len(user_ids) + 1, dtype=np.int64)
+    offsets[:-1] = np.searchsorted(users_unique, user_ids)
+    offsets[-1] = len(users_unique)
+
+    return UserClickIndex(user_ids=user_ids,
+                          offsets=offsets,
+                          article_ids=articles_sorted[keep],
+                          click_counts=click_counts,
+                          all_articles=pd.unique(articles))
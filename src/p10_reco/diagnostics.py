@@ -0,0 +1,84 @@
+# src/p10_reco/diagnostics.py
+# Diagnostic du service (Function App) : environnement, artefacts chargés, accès Blob
+
+import os
+import sys
+import logging
+
+from .loaders import CONN_STR_ENV_VARS, get_connection_string, get_blob_service_client
+
+
+def test_azure_blob_connection(container_name: str = "artefacts-fresh") -> dict:
+    """Test de connexion Azure Blob avec diagnostic détaillé (liste des blobs du conteneur)"""
+    results = {
+        "connection_test": False,
+        "container_access": False,
+        "file_listing": [],
+        "error_details": None,
+        "environment_vars": {var: "***SET***" if os.getenv(var) else "NOT_SET" for var in CONN_STR_ENV_VARS},
+    }
+
+    conn_str = get_connection_string()
+    if not conn_str:
+        results["error_details"] = "Aucune chaîne de connexion trouvée"
+        return results
+
+    try:
+        # Client partagé avec les loaders
+        blob_service = get_blob_service_client(conn_str)
+        results["connection_test"] = True
+
+        container_client = blob_service.get_container_client(container_name)
+        results["file_listing"] = [{
+            "name": blob.name,
+            "size": blob.size,
+            "last_modified": blob.last_modified.isoformat() if blob.last_modified else None
+        } for blob in container_client.list_blobs()]
+        results["container_access"] = True
+        logging.info(f"[BLOB_TEST] Accès conteneur OK, {len(results['file_listing'])} fichiers trouvés")
+
+    except Exception as e:
+        results["error_details"] = str(e)
+        logging.error(f"[BLOB_TEST] Erreur: {e}")
+
+    return results
+
+
+def test_specific_file_download(filename: str = "df_light.parquet", container_name: str = "artefacts-fresh") -> dict:
+    """Test de téléchargement d'un fichier spécifique"""
+    conn_str = get_connection_string()
+    if not conn_str:
+        return {"success": False, "error": "Pas de chaîne de connexion"}
+
+    try:
+        blob_client = get_blob_service_client(conn_str).get_blob_client(container=container_name, blob=filename)
+        file_size = len(blob_client.download_blob().readall())
+        logging.info(f"[BLOB_DOWNLOAD] {filename} téléchargé: {file_size} bytes")
+        return {"success": True, "file_size": file_size}
+
+    except Exception as e:
+        logging.error(f"[BLOB_DOWNLOAD] Erreur téléchargement {filename}: {e}")
+        return {"success": False, "error": str(e)}
+
+
+def system_diagnostic(check_blob: bool = True) -> dict:
+    """Diagnostic complet du service : environnement, artefacts chargés, accès Blob"""
+    from . import wrappers
+
+    diagnostics = {
+        "python_version": sys.version,
+        "package_dir": os.path.dirname(os.path.abspath(__file__)),
+        "environment_vars": {"ENV": os.getenv("ENV"),
+                             **{var: "***" if os.getenv(var) else None for var in CONN_STR_ENV_VARS}},
+        "artifacts_loaded": {source: sorted(artifacts["components"])
+                             for source, artifacts in wrappers._ARTIFACTS.items()},
+        "result_cache": wrappers.RESULT_CACHE.stats(),
+        "live_clicks": {source: artifacts["live_updates"].n_events
+                        for source, artifacts in wrappers._ARTIFACTS.items() if artifacts.get("live_updates")},
+    }
+
+    if check_blob:
+        diagnostics["azure_blob_test"] = test_azure_blob_connection()
+        diagnostics["blob_download_test"] = test_specific_file_download("df_light.parquet")
+
+    return diagnostics
@@ -0,0 +1,105 @@
+# src/p10_reco/embeddings.py
+
+import os
+import numpy as np
+
+
+def normalize_embeddings(embeddings_array: np.ndarray, return_norms: bool = False):
+    """
+    Normalise chaque embedding (norme L2 = 1) dans une matrice float32 contiguë.
+
+    La similarité cosinus devient un simple produit scalaire : le CBF
+    n'a plus à renormaliser tout le catalogue à chaque requête.
+
+    Args:
+        embeddings_array (np.ndarray): matrice (nb_articles, dim)
+        return_norms (bool): renvoie aussi la norme d'origine de chaque ligne
+
+    Returns:
+        np.ndarray: matrice normalisée (nb_articles, dim), float32, C-contiguë
+        (+ normes d'origine (nb_articles,), float32, si return_norms)
+    """
+    normalized = np.array(embeddings_array, dtype=np.float32, order="C")
+    norms = np.linalg.norm(normalized, axis=1)
+    divisors = np.where(norms == 0, 1.0, norms).astype(np.float32)  # vecteurs nuls laissés à zéro
+    normalized /= divisors[:, None]
+    if return_norms:
+        return normalized, norms.astype(np.float32)
+    return normalized
+
+
+def is_normalized(embeddings: np.ndarray, sample_size: int = 1024, atol: float = 1e-3) -> bool:
+    """
+    Vrai si la matrice est en float32 et ses lignes de norme 1 (ou nulles),
+    vérifié sur sample_size lignes réparties sur toute la matrice : un
+    artefact d'un autre producteur n'est pas servi tel quel sur la foi de son type.
+    """
+    if embeddings.dtype != np.float32 or embeddings.ndim != 2:
+        return False
+    if len(embeddings) == 0:
+        return True
+    rows = np.unique(np.linspace(0, len(embeddings) - 1, num=min(sample_size, len(embeddings))).astype(np.int64))
+    norms = np.linalg.norm(embeddings[rows], axis=1)
+    return bool(np.all((np.abs(norms - 1.0) <= atol) | (norms == 0)))
+
+
+def mean_profile(embeddings: np.ndarray, rows: np.ndarray, norms: np.ndarray = None) -> np.ndarray:
+    """
+    Profil CBF : moyenne des embeddings d'origine des lignes rows.
+
+    La matrice étant normalisée, chaque ligne est remise à sa norme d'origine
+    (norms[i] * ligne i) : le profil est celui calculé sur les embeddings bruts.
+    Sans normes connues, moyenne des lignes telles quelles.
+    """
+    if norms is None:
+        return np.mean(embeddings[rows], axis=0)
+    return np.mean(embeddings[rows] * norms[rows][:, None], axis=0)
+
+
+def article_ids_path(embeddings_path: str) -> str:
+    """
+    Chemin du fichier article_id associé à un artefact d'embeddings
+    (ex : articles_embeddings.npy → articles_embeddings_article_ids.npy).
+    """
+    root, _ = os.path.splitext(embeddings_path)
+    return f"{root}_article_ids.npy"
+
+
+def norms_path(embeddings_path: str) -> str:
+    """
+    Chemin du fichier des normes d'origine associé à un artefact d'embeddings
+    (ex : articles_embeddings.npy → articles_embeddings_norms.npy).
+    """
+    root, _ = os.path.splitext(embeddings_path)
+    return f"{root}_norms.npy"
+
+
+def save_embeddings_npy(embeddings_array: np.ndarray,
+                        output_path: str,
+                        article_ids: np.ndarray = None) -> None:
+    """
+    Sauvegarde les embeddings normalisés au format .npy brut (non compressé).
+
+    Contrairement au .npz compressé, ce fichier s'ouvre par np.memmap sans
+    décompression : démarrage quasi instantané et pages partagées entre les
+    workers d'une même machine. L'en-tête .npy est aligné (64 octets), le bloc
+    float32 peut donc être mappé directement.
+
+    Args:
+        embeddings_array (np.ndarray): matrice (nb_articles, dim)
+        output_path (str): chemin du fichier .npy
+        article_ids (np.ndarray): article_id de chaque ligne, sauvegardés à côté
+            (cf. article_ids_path) ; par défaut article_id = numéro de ligne
+
+    Les normes d'origine des lignes sont sauvegardées à côté (cf. norms_path) :
+    les profils CBF restent ceux des embeddings bruts (cf. mean_profile).
+    """
+    if article_ids is not None and len(article_ids) != len(embeddings_array):
+        raise ValueError(f"Erreur : {len(article_ids)} article_id vs {len(embeddings_array)} embeddings")
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    normalized, norms = normalize_embeddings(embeddings_array, return_norms=True)
+    np.save(output_path, normalized)
+    np.save(norms_path(output_path), norms)
+    if article_ids is not None:
+        np.save(article_ids_path(output_path), np.asarray(article_ids, dtype=np.int64))
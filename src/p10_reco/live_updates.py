@@ -0,0 +1,228 @@
+# src/p10_reco/live_updates.py
+
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from .article_index import as_article_index
+from .embeddings import mean_profile
+
+
+def parse_click_events(events) -> list:
+    """
+    Valide et convertit tout un lot de clics (tuples ou dicts user_id,
+    article_id, click_timestamp) en tuples (int, int, float ou None), avant
+    toute ingestion : un lot invalide est refusé en entier.
+
+    Lève TypeError / ValueError (position du premier clic invalide).
+    """
+    if isinstance(events, (str, bytes, dict)) or not hasattr(events, "__iter__"):
+        raise TypeError(f"liste de clics attendue, reçu {type(events).__name__}")
+
+    parsed = []
+    for position, event in enumerate(events):
+        try:
+            if isinstance(event, dict):
+                user_id, article_id, timestamp = event["user_id"], event["article_id"], event.get("click_timestamp")
+            elif isinstance(event, (list, tuple)) and len(event) in (2, 3):
+                user_id, article_id, timestamp = (*event, None)[:3]
+            else:
+                raise TypeError("clic attendu en dict ou en tuple (user_id, article_id[, click_timestamp])")
+            parsed.append((int(user_id), int(article_id), None if timestamp is None else float(timestamp)))
+        except KeyError as e:
+            raise ValueError(f"clic n°{position} : champ {e} manquant")
+        except (TypeError, ValueError) as e:
+            raise type(e)(f"clic n°{position} : {e}")
+    return parsed
+
+
+@dataclass
+class _UserState:
+    """
+    État incrémental d'un utilisateur : somme (pondérée) et poids des embeddings
+    vus, articles vus depuis le chargement des artefacts, clics reçus.
+    """
+    profile_sum: np.ndarray
+    weight: float
+    base_seen: np.ndarray
+    new_seen: set = field(default_factory=set)
+    new_articles: list = field(default_factory=list)
+    new_clicks: int = 0
+    last_timestamp: Optional[float] = None
+    revision: int = 0
+
+
+class LiveUpdates:
+    """
+    Surcouche en mémoire des clics reçus depuis le chargement des artefacts.
+
+    Chaque clic met à jour, en O(d), le profil de l'utilisateur (somme courante
+    et nombre d'embeddings, éventuellement amortis dans le temps) et ses
+    articles vus, sans reconstruire df_light.parquet ni recharger les artefacts.
+    Le moteur lit la surcouche au travers de click_index et user_profiles,
+    qui s'utilisent à la place de l'index des clics et des profils de base.
+
+    Comme pour l'index des clics, un article déjà vu ne modifie pas le profil
+    (moyenne sur les articles distincts) ; il compte en revanche comme un clic.
+    Le modèle CF n'est pas réentraîné : les nouveaux clics n'y interviennent
+    que par l'exclusion des articles vus.
+
+    Args:
+        click_index (UserClickIndex) : index des clics des artefacts
+        embeddings (np.ndarray) : matrice d'embeddings L2-normalisée
+        article_id_to_index (ArticleIndex ou dict) : mapping article_id → ligne
+        user_profiles (UserProfiles) : profils précalculés (optionnel)
+        half_life (float) : demi-vie de l'amortissement, dans l'unité de
+                            click_timestamp (ms pour les clics Globo) ; None = sans amortissement
+    """
+
+    def __init__(self, click_index, embeddings: np.ndarray, article_id_to_index,
+                 user_profiles=None, half_life: float = None):
+        self.base_click_index = click_index
+        self.base_profiles = user_profiles
+        self.embeddings = embeddings
+        self.article_index = as_article_index(article_id_to_index)
+        self.half_life = half_life
+        self._users = {}
+        self._n_events = 0  # Tenu par ingest sous le verrou : lu sans parcourir _users
+        self._lock = threading.Lock()
+        self.click_index = LiveClickIndex(self)
+        self.user_profiles = LiveProfiles(self)
+
+    @property
+    def n_events(self) -> int:
+        """
+        Nombre de clics ingérés, lisible pendant les ingestions d'autres threads.
+        """
+        return self._n_events
+
+    def has_user(self, user_id: int) -> bool:
+        return user_id in self._users
+
+    def revision(self, user_id: int) -> int:
+        """
+        Nombre de clics reçus pour l'utilisateur (0 sans clic ingéré) : à inclure
+        dans les clés de cache des réponses.
+        """
+        state = self._users.get(user_id)
+        return state.revision if state is not None else 0
+
+    def _seed(self, user_id: int) -> _UserState:
+        """
+        État initial tiré des artefacts : O(d) avec la matrice des profils,
+        sinon une moyenne sur l'historique (une seule fois par utilisateur).
+        """
+        base_seen = self.base_click_index.get_articles(user_id)
+        rows = self.article_index.rows(base_seen)
+        rows = rows[rows >= 0]
+
+        profile = self.base_profiles.get(user_id) if self.base_profiles is not None else None
+        if profile is None:
+            profile = (mean_profile(self.embeddings, rows, self.article_index.norms) if len(rows)
+                       else np.zeros(self.embeddings.shape[1]))
+
+        return _UserState(profile_sum=np.asarray(profile, dtype=np.float64) * len(rows),
+                          weight=float(len(rows)),
+                          base_seen=base_seen)
+
+    def ingest(self, user_id: int, article_id: int, click_timestamp: float = None):
+        """
+        Prend en compte un clic (user_id, article_id, click_timestamp) en O(d).
+        """
+        user_id, article_id = int(user_id), int(article_id)
+        row = int(self.article_index.rows([article_id])[0])
+
+        with self._lock:
+            state = self._users.get(user_id)
+            if state is None:
+                state = self._users[user_id] = self._seed(user_id)
+
+            # Amortissement du profil courant selon le temps écoulé depuis le dernier clic
+            if self.half_life and click_timestamp is not None and state.last_timestamp is not None:
+                elapsed = max(float(click_timestamp) - state.last_timestamp, 0.0)
+                decay = 0.5 ** (elapsed / self.half_life)
+                state.profile_sum *= decay
+                state.weight *= decay
+            if click_timestamp is not None:
+                state.last_timestamp = max(float(click_timestamp), state.last_timestamp or float(click_timestamp))
+
+            base_pos = int(np.searchsorted(state.base_seen, article_id))
+            already_seen = article_id in state.new_seen or (
+                base_pos < len(state.base_seen) and state.base_seen[base_pos] == article_id)
+            if not already_seen:
+                state.new_seen.add(article_id)
+                state.new_articles.append(article_id)
+                if row >= 0:
+                    # Embedding d'origine (ligne normalisée remise à sa norme), comme mean_profile
+                    norm = self.article_index.norms[row] if self.article_index.norms is not None else 1.0
+                    state.profile_sum += self.embeddings[row] * norm
+                    state.weight += 1.0
+
+            state.new_clicks += 1
+            state.revision += 1
+            self._n_events += 1
+
+    def ingest_many(self, events) -> int:
+        """
+        Ingestion d'une suite d'événements (tuples ou dicts user_id, article_id,
+        click_timestamp), dans l'ordre reçu. Le lot est validé en entier avant
+        le premier clic (cf. parse_click_events) : une erreur n'en applique aucun.
+        Renvoie le nombre d'événements.
+        """
+        parsed = parse_click_events(events)
+        for user_id, article_id, click_timestamp in parsed:
+            self.ingest(user_id, article_id, click_timestamp)
+        return len(parsed)
+
+
+class LiveClickIndex:
+    """
+    Vue de l'index des clics complétée par les clics ingérés (mêmes méthodes
+    que UserClickIndex pour le moteur de recommandation).
+    """
+
+    def __init__(self, live: LiveUpdates):
+        self._live = live
+
+    @property
+    def all_articles(self) -> np.ndarray:
+        return self._live.base_click_index.all_articles
+
+    @property
+    def n_users(self) -> int:
+        return self._live.base_click_index.n_users
+
+    def position(self, user_id: int) -> int:
+        return self._live.base_click_index.position(user_id)
+
+    def get_articles(self, user_id: int) -> np.ndarray:
+        state = self._live._users.get(user_id)
+        if state is None or not state.new_articles:
+            return self._live.base_click_index.get_articles(user_id)
+        return np.union1d(state.base_seen, np.asarray(state.new_articles, dtype=state.base_seen.dtype))
+
+    def get_click_count(self, user_id: int) -> int:
+        state = self._live._users.get(user_id)
+        extra = state.new_clicks if state is not None else 0
+        return self._live.base_click_index.get_click_count(user_id) + extra
+
+
+class LiveProfiles:
+    """
+    Vue des profils CBF complétée par les clics ingérés (même accès que UserProfiles).
+    """
+
+    def __init__(self, live: LiveUpdates):
+        self._live = live
+
+    def get(self, user_id: int) -> Optional[np.ndarray]:
+        state = self._live._users.get(user_id)
+        if state is not None:
+            if state.weight <= 0:
+                return None
+            return (state.profile_sum / state.weight).astype(self._live.embeddings.dtype)
+        if self._live.base_profiles is not None:
+            return self._live.base_profiles.get(user_id)
+        return None
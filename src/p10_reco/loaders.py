@@ -0,0 +1,749 @@
+# src/p10_reco/loaders.py
+
+import os
+import json
+import glob
+import pickle
+import hashlib
+import logging
+import tempfile
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from .embeddings import normalize_embeddings, is_normalized, article_ids_path, norms_path
+from .cf_scoring import CFFactors, CF_FACTOR_ARRAYS, CF_FACTOR_META
+from .precomputed import PrecomputedTable, PRECOMPUTED_ARRAYS, PRECOMPUTED_META
+from .user_directory import UserDirectory, USER_DIRECTORY_DTYPE
+from .user_profiles import UserProfiles
+
+# Variables d'environnement : fichier .env charge par wrappers.load_correct_env (pas a l'import)
+# Racine du projet (outputs/, models/, .env.*) : P10_PROJECT_ROOT, sinon le dpt (src/p10_reco/../..)
+PROJECT_ROOT = os.getenv("P10_PROJECT_ROOT",
+                         os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# Variables d'environnement reconnues pour la chane de connexion Blob (local, Function App)
+CONN_STR_ENV_VARS = ["AZURE_CONN_STR", "AZURE_STORAGE_CONNECTION_STRING",
+                     "AzureWebJobsAZURE_CONN_STR", "AzureWebJobsStorage"]
+
+# Dossier local des artefacts tlchargs (fichiers mapps en mmoire, partags entre workers)
+ARTIFACTS_CACHE_DIR = os.getenv("ARTIFACTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "p10_artifacts"))
+
+# Taille maximale du cache disque (octets) : au-del, les versions les moins rcemment utilises sont supprimes
+ARTIFACTS_CACHE_MAX_BYTES = int(os.getenv("ARTIFACTS_CACHE_MAX_BYTES", str(4 * 1024 ** 3)))
+
+# Nombre de requtes de plage parallles par blob (les gros blobs sont tlchargs par morceaux)
+BLOB_MAX_CONCURRENCY = int(os.getenv("BLOB_MAX_CONCURRENCY", "4"))
+
+# Taille du pool de connexions HTTP keep-alive partag par tous les chargements
+BLOB_POOL_SIZE = int(os.getenv("BLOB_POOL_SIZE", "16"))
+
+_BLOB_CLIENTS = {}
+_BLOB_CLIENTS_LOCK = threading.Lock()
+
+# Verrous par fichier du cache disque : deux threads ne telechargent pas la meme version
+_DOWNLOAD_LOCKS = {}
+_DOWNLOAD_LOCKS_LOCK = threading.Lock()
+
+
+def get_connection_string(connection_string: str = None) -> str:
+    """
+    Chane de connexion Blob : argument explicite, sinon premire variable
+    d'environnement dfinie parmi CONN_STR_ENV_VARS (None si aucune).
+    """
+    if connection_string:
+        return connection_string
+    for var in CONN_STR_ENV_VARS:
+        if os.getenv(var):
+            return os.getenv(var)
+    return None
+
+
+def _build_blob_transport():
+    """
+    Transport HTTP du client Blob : une session requests avec un pool de connexions
+    keep-alive, pour ne payer la poigne de main TLS qu'une fois par connexion.
+    """
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=BLOB_POOL_SIZE, pool_maxsize=BLOB_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)  # Emulateur local (Azurite)
+    return RequestsTransport(session=session, session_owner=False)
+
+
+def get_blob_service_client(conn_str: str):
+    """
+    Renvoie le BlobServiceClient du processus pour une chane de connexion,
+    cr au premier appel puis partag par tous les chargements et diagnostics.
+    Fonctionne aussi avec la chane de connexion d'un mulateur local (BlobEndpoint=http://...).
+    Le SDK Azure n'est import qu'ici : le mode local ne le charge pas.
+    """
+    client = _BLOB_CLIENTS.get(conn_str)
+    if client is not None:
+        return client
+
+    from azure.storage.blob import BlobServiceClient
+
+    with _BLOB_CLIENTS_LOCK:
+        if conn_str not in _BLOB_CLIENTS:
+            _BLOB_CLIENTS[conn_str] = BlobServiceClient.from_connection_string(
+                conn_str, transport=_build_blob_transport()
+            )
+        return _BLOB_CLIENTS[conn_str]
+
+
+def load_bundle(tasks: dict, max_workers: int = None) -> dict:
+    """
+    Excute plusieurs chargements d'artefacts en parallle (pool de threads).
+    Les tlchargements Blob librent le GIL : la dure totale est celle du plus
+    gros artefact et non la somme de tous.
+
+    Args:
+        tasks (dict): nom  fonction sans argument renvoyant l'artefact
+        max_workers (int): taille du pool (dfaut : un thread par artefact)
+
+    Returns:
+        dict: nom  artefact charg (la premire erreur rencontre est propage)
+    """
+    if not tasks:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks)) as executor:
+        futures = {name: executor.submit(task) for name, task in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _cached_blob_path(filename: str, etag: str) -> str:
+    """
+    Chemin local d'une version de blob : <nom>.<empreinte ETag><extension>.
+    Chaque version a son propre fichier : une nouvelle publication ne touche pas
+    aux fichiers dj mapps par d'autres processus.
+    """
+    root, ext = os.path.splitext(filename)
+    version = hashlib.sha1(etag.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(ARTIFACTS_CACHE_DIR, f"{root}.{version}{ext}")
+
+
+def _cached_versions(filename: str) -> list:
+    """
+    Versions en cache d'un blob (mtadonnes .meta.json), de la plus rcente  la plus ancienne.
+    """
+    versions = []
+    for meta_path in glob.glob(os.path.join(ARTIFACTS_CACHE_DIR, "**", "*.meta.json"), recursive=True):
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            continue
+        path = meta_path[:-len(".meta.json")]
+        if meta.get("blob") == filename and os.path.exists(path):
+            versions.append((os.path.getmtime(path), path))
+    return [path for _, path in sorted(versions, reverse=True)]
+
+
+def evict_cache(max_bytes: int = None, keep: tuple = ()) -> list:
+    """
+    Supprime les fichiers du cache les moins rcemment utiliss (mtime, mis  jour
+    chaque lecture) jusqu' repasser sous max_bytes. Les chemins de keep sont conservs.
+
+    Retour : chemins supprims
+    """
+    max_bytes = ARTIFACTS_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    for meta_path in glob.glob(os.path.join(ARTIFACTS_CACHE_DIR, "**", "*.meta.json"), recursive=True):
+        path = meta_path[:-len(".meta.json")]
+        if os.path.exists(path):
+            entries.append((os.path.getmtime(path), os.path.getsize(path), path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = []
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path in keep:
+            continue
+        # Un processus qui mappe encore ce fichier garde ses pages jusqu' la fermeture
+        for stale in (path, f"{path}.meta.json"):
+            try:
+                os.remove(stale)
+            except FileNotFoundError:
+                pass
+        total -= size
+        removed.append(path)
+    return removed
+
+
+def _download_lock(local_path: str) -> threading.Lock:
+    """
+    Verrou du processus associe a une version de blob en cache.
+    """
+    with _DOWNLOAD_LOCKS_LOCK:
+        return _DOWNLOAD_LOCKS.setdefault(local_path, threading.Lock())
+
+
+def download_blob_to_file(container_name: str, filename: str, conn_str: str) -> str:
+    """
+    Renvoie le chemin local d'un blob, via le cache disque ARTIFACTS_CACHE_DIR.
+
+    Une requte HEAD compare l'ETag du blob  la version en cache : le blob n'est
+    retlcharg que s'il a chang. En cas d'chec reseau du HEAD, la version en
+    cache la plus rcente est utilise si elle existe. Un blob supprime (404) ou
+    refuse (authentification) n'est jamais servi depuis le cache : l'erreur est propagee.
+    """
+    from azure.core.exceptions import ServiceRequestError, ServiceResponseError
+
+    blob_client = get_blob_service_client(conn_str).get_blob_client(
+        container=container_name,
+        blob=filename
+    )
+
+    try:
+        properties = blob_client.get_blob_properties()
+    except (ServiceRequestError, ServiceResponseError, ConnectionError, TimeoutError) as e:
+        cached = _cached_versions(filename)
+        if not cached:
+            raise
+        logging.warning(f"[LOADERS] HEAD {filename} impossible ({e}) : version en cache utilise")
+        os.utime(cached[0])
+        return cached[0]
+
+    local_path = _cached_blob_path(filename, properties.etag)
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)  # Blobs "dossier/fichier"
+
+    # Un seul telechargement par version dans le processus : les autres threads
+    # attendent puis lisent le fichier ecrit (cache hit)
+    with _download_lock(local_path):
+        if os.path.exists(local_path) and os.path.getsize(local_path) == properties.size:
+            os.utime(local_path)  # Dernire utilisation (LRU)
+            return local_path
+
+        # Ecriture dans un fichier temporaire propre a l'appel puis bascule atomique
+        # (le tlchargement choue si le blob est republi entre le HEAD et le GET)
+        from azure.core import MatchConditions
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(local_path),
+                                        prefix=f"{os.path.basename(local_path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                blob_client.download_blob(max_concurrency=BLOB_MAX_CONCURRENCY, etag=properties.etag,
+                                          match_condition=MatchConditions.IfNotModified).readinto(f)
+            os.replace(tmp_path, local_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        with open(f"{local_path}.meta.json", "w") as f:
+            json.dump({"blob": filename,
+                       "container": container_name,
+                       "etag": properties.etag,
+                       "last_modified": properties.last_modified.isoformat() if properties.last_modified else None,
+                       "size": properties.size}, f)
+
+    evict_cache(keep=(local_path,))
+    return local_path
+
+
+def artifact_version(source: str,
+                     folder: str,
+                     filename: str,
+                     container_name: str = "artefacts-fresh",
+                     connection_string: str = None,
+                     content: bool = False) -> str:
+    """
+    Version d'un artefact publie, lue sans le charger : ETag du blob (requete
+    HEAD) sur Azure, taille et date de modification de <folder>/<filename> en
+    local (un simple stat, rien n'est lu au demarrage).
+
+    content=True : empreinte SHA-256 du contenu local (lecture complete du
+    fichier, reservee aux traitements hors ligne comme le precalcul).
+    """
+    if source == "local":
+        path = os.path.abspath(os.path.join(PROJECT_ROOT, folder, filename))
+        if not os.path.exists(path):
+            raise FileNotFoundError(f" Artefact non trouve : {path}")
+        if not content:
+            stat = os.stat(path)
+            return f"size={stat.st_size};mtime_ns={stat.st_mtime_ns}"
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return f"sha256:{digest.hexdigest()}"
+
+    elif source == "azure":
+        try:
+            conn_str = get_connection_string(connection_string)
+            if not conn_str:
+                raise RuntimeError("Chane de connexion Azure manquante.")
+            blob_client = get_blob_service_client(conn_str).get_blob_client(container=container_name, blob=filename)
+            return blob_client.get_blob_properties().etag
+        except Exception as e:
+            raise RuntimeError(f" Erreur lecture version du blob {filename} : {str(e)}")
+
+    else:
+        raise ValueError("Paramtre 'source' invalide. Attendu : 'local' ou 'azure'")
+
+
+# Colonnes de df.parquet utilises par le moteur (df.parquet contient aussi session, device, OS, pays...)
+CLICK_COLUMNS = ["user_id", "article_id"]
+
+
+def compact_dtypes(df: pd.DataFrame, max_category_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Rduit l'empreinte mmoire d'un DataFrame de clics (en place) :
+    - identifiants (*_id) en int32 (int64 conserv si les valeurs ne tiennent pas)
+    - autres entiers rduits au plus petit type (ex : codes device/OS en int8)
+    - flottants en float32
+    - textes peu varis (nb valeurs distinctes / nb lignes <= max_category_ratio) en category
+
+    Retour : le DataFrame compact
+    """
+    int32 = np.iinfo(np.int32)
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            continue
+        if pd.api.types.is_integer_dtype(series):
+            if col.endswith("_id"):
+                if len(series) == 0 or (series.min() >= int32.min and series.max() <= int32.max):
+                    df[col] = series.astype(np.int32)
+            else:
+                df[col] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series):
+            df[col] = series.astype(np.float32)
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            if len(series) and series.nunique() / len(series) <= max_category_ratio:
+                df[col] = series.astype("category")
+    return df
+
+
+def read_parquet(path: str, columns: list = None) -> pd.DataFrame:
+    """
+    Lit un fichier parquet par memory map (pas de copie du fichier en mmoire),
+    en ne dcodant que les colonnes demandes (toutes si columns vaut None).
+    Les colonnes Arrow sont libres au fur et  mesure de la conversion pandas.
+    """
+    with pa.memory_map(path, "r") as source:
+        table = pq.read_table(source, columns=columns, memory_map=True)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def open_embeddings_memmap(path: str, normalize: bool = True) -> np.ndarray:
+    """
+    Ouvre un artefact .npy d'embeddings en lecture seule par np.memmap : pas de
+    dcompression au dmarrage, pages partages entre processus via le cache de l'OS.
+    Les artefacts crits par save_embeddings_npy sont dj normaliss : la normalisation
+    est verifiee sur un echantillon de lignes (cf. is_normalized), pas deduite du type.
+    """
+    embeddings = np.load(path, mmap_mode="r")
+    if normalize and not is_normalized(embeddings):
+        # Artefact non normalis (autre producteur) : copie normalise en mmoire
+        return normalize_embeddings(embeddings)
+    return embeddings
+
+
+def load_metadata(source: str = "local",
+                  filename: str = "df_articles.parquet",
+                  container_name: str = "artefacts-fresh",
+                  storage_account_url: str = "https://p10arnaudcs01.blob.core.windows.net/",
+                  connection_string: str = None,
+                  columns: list = None) -> pd.DataFrame:
+    """
+    Charge les mtadonnes articles depuis le disque local ou Azure Blob Storage.
+    columns : colonnes  dcoder (toutes par dfaut)
+    """
+
+    if source == "local":
+        outputs_path = os.path.abspath(os.path.join(PROJECT_ROOT, "outputs"))
+        meta_path = os.path.join(outputs_path, filename)
+
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"Fichier local introuvable : {meta_path}")
+
+        if filename.endswith(".parquet"):
+            return read_parquet(meta_path, columns=columns)
+        elif filename.endswith(".csv"):
+            return pd.read_csv(meta_path, usecols=columns)
+        else:
+            raise ValueError("Format de fichier non support pour les mtadonnes")
+
+    elif source == "azure":
+        try:
+            conn_str = get_connection_string(connection_string)
+            if not conn_str:
+                raise RuntimeError("Chane de connexion Azure manquante. Dfinir AZURE_CONN_STR.")
+
+            local_path = download_blob_to_file(container_name, filename, conn_str)
+
+            if filename.endswith(".parquet"):
+                return read_parquet(local_path, columns=columns)
+            elif filename.endswith(".csv"):
+                return pd.read_csv(local_path, usecols=columns)
+            else:
+                raise ValueError("Format de fichier non support pour les mtadonnes")
+
+        except Exception as e:
+            raise RuntimeError(f"Erreur chargement mtadonnes Azure : {str(e)}")
+
+    else:
+        raise ValueError("Paramtre 'source' invalide. Attendu : 'local' ou 'azure'")
+
+
+
+def load_df(source: str = "local",
+            filename: str = "df_light.parquet",
+            container_name: str = "artefacts-fresh",
+            connection_string: str = None,
+            columns: list = None,
+            compact: bool = False) -> pd.DataFrame:
+    """
+    Charge le DataFrame principal contenant les utilisateurs.
+    columns : colonnes  dcoder (ex : CLICK_COLUMNS, + "click_timestamp"), toutes par dfaut
+    compact : rduit les types (ids en int32, textes en category, cf. compact_dtypes)
+    """
+    if source == "local":
+        path = os.path.abspath(os.path.join(PROJECT_ROOT, "outputs", filename))
+        if not os.path.exists(path):
+            raise FileNotFoundError(f" Fichier df.parquet introuvable : {path}")
+        df = read_parquet(path, columns=columns)
+        return compact_dtypes(df) if compact else df
+
+    elif source == "azure":
+        try:
+            conn_str = get_connection_string(connection_string)
+            if not conn_str:
+                raise RuntimeError("Chane de connexion Azure manquante.")
+
+            df = read_parquet(download_blob_to_file(container_name, filename, conn_str), columns=columns)
+            return compact_dtypes(df) if compact else df
+
+        except Exception as e:
+            raise RuntimeError(f" Erreur chargement df.parquet Azure : {str(e)}")
+
+    else:
+        raise ValueError("Paramtre 'source' invalide. Attendu : 'local' ou 'azure'")
+
+
+def open_user_directory(path: str) -> UserDirectory:
+    """
+    Ouvre l'annuaire utilisateurs par np.memmap (tableau structur USER_DIRECTORY_DTYPE).
+    """
+    records = np.load(path, mmap_mode="r", allow_pickle=False)
+    if records.dtype != USER_DIRECTORY_DTYPE:
+        raise ValueError(f" Annuaire utilisateurs invalide ({records.dtype}) : {path}")
+    return UserDirectory.from_records(records)
+
+
+def load_user_directory(source: str = "local",
+                        filename: str = "user_directory_light.npy",
+                        container_name: str = "artefacts-fresh",
+                        connection_string: str = None) -> UserDirectory:
+    """
+    Charge l'annuaire utilisateurs (cf. scripts/export_user_directory.py), gnr
+    ct des fichiers de clics dans outputs/.
+    """
+    if source == "local":
+        path = os.path.abspath(os.path.join(PROJECT_ROOT, "outputs", filename))
+        if not os.path.exists(path):
+            raise FileNotFoundError(f" Annuaire utilisateurs introuvable : {path}")
+        return open_user_directory(path)
+
+    elif source == "azure":
+        try:
+            conn_str = get_connection_string(connection_string)
+            if not conn_str:
+                raise RuntimeError("Chane de connexion Azure manquante.")
+            return open_user_directory(download_blob_to_file(container_name, filename, conn_str))
+        except Exception as e:
+            raise RuntimeError(f" Erreur chargement annuaire utilisateurs Azure : {str(e)}")
+
+    else:
+        raise ValueError("Paramtre 'source' invalide. Attendu : 'local' ou 'azure'")
+
+
+def open_user_profiles(path: str, user_directory: UserDirectory) -> UserProfiles:
+    """
+    Ouvre la matrice des profils par np.memmap, lignes alignes sur l'annuaire utilisateurs.
+    """
+    vectors = np.load(path, mmap_mode="r", allow_pickle=False)
+    if vectors.ndim != 2 or len(vectors) != user_directory.n_users:
+        raise ValueError(f" Profils non aligns sur l'annuaire ({vectors.shape} vs {user_directory.n_users}) : {path}")
+    return UserProfiles(user_ids=user_directory.user_ids, vectors=vectors)
+
+
+def load_user_profiles(source: str = "local",
+                       filename: str = "user_profiles_light.npy",
+                       user_directory: UserDirectory = None,
+                       container_name: str = "artefacts-fresh",
+                       connection_string: str = None) -> UserProfiles:
+    """
+    Charge la matrice des profils utilisateurs (cf. scripts/export_user_directory.py),
+    lignes alignees sur l'annuaire deja charge (cf. load_user_directory).
+    """
+    if user_directory is None:
+        raise ValueError(" Annuaire utilisateurs requis pour lire les profils")
+    if source == "local":
+        path = os.path.abspath(os.path.join(PROJECT_ROOT, "outputs", filename))
+        if not os.path.exists(path):
+            raise FileNotFoundError(f" Profils utilisateurs introuvables : {path}")
+        return open_user_profiles(path, user_directory)
+
+    try:
+        conn_str = get_connection_string(connection_string)
+        if not conn_str:
+            raise RuntimeError("Chane de connexion Azure manquante.")
+        return open_user_profiles(download_blob_to_file(container_name, filename, conn_str), user_directory)
+    except Exception as e:
+        raise RuntimeError(f" Erreur chargement profils utilisateurs Azure : {str(e)}")
+
+
+def load_embeddings(source: str = "local",
+                    filename: str = "articles_embeddings_compressed.npz",
+                    container_name: str = "artefacts-fresh",
+                    connection_string: str = None,
+                    normalize: bool = True) -> np.ndarray:
+    """
+    Charge la matrice des embeddings darticles (rduits) .npz ou .npy
+    Par dfaut, la matrice est L2-normalise en float32 contigu une fois pour toutes.
+    Un artefact .npy est ouvert en np.memmap (cf. open_embeddings_memmap).
+    """
+    if source == "local":
+        path = os.path.abspath(os.path.join(PROJECT_ROOT, "outputs", filename))
+        if not os.path.exists(path):
+            raise FileNotFoundError(f" Embeddings non trouvs : {path}")
+        if filename.endswith(".npy"):
+            return open_embeddings_memmap(path, normalize=normalize)
+        embeddings = np.load(path)["embeddings"]
+        return normalize_embeddings(embeddings) if normalize else embeddings
+
+    elif source == "azure":
+        try:
+            conn_str = get_connection_string(connection_string)
+            if not conn_str:
+                raise RuntimeError("Chane de connexion Azure manquante.")
+
+            local_path = download_blob_to_file(container_name, filename, conn_str)
+            if filename.endswith(".npy"):
+                # Fichier local mappable plutt qu'un buffer en mmoire
+                return open_embeddings_memmap(local_path, normalize=normalize)
+
+            embeddings = np.load(local_path)["embeddings"]
+            return normalize_embeddings(embeddings) if normalize else embeddings
+
+        except Exception as e:
+            raise RuntimeError(f" Erreur chargement embeddings Azure : {str(e)}")
+
+    else:
+        raise ValueError("Paramtre 'source' invalide. Attendu : 'local' ou 'azure'")
+
+
+def _load_sidecar(source: str, filename: str, container_name: str, connection_string: str = None):
+    """
+    Tableau .npy publie a cote d'un artefact (article_id, normes...), None s'il est absent.
+    Sur Azure, seul un blob inexistant (404) vaut absence : toute autre erreur
+    (reseau, authentification) est propagee plutot que de servir des lignes mal identifiees.
+    """
+    if source == "local":
+        path = os.path.abspath(os.path.join(PROJECT_ROOT, "outputs", filename))
+        return np.load(path) if os.path.exists(path) else None
+
+    from azure.core.exceptions import ResourceNotFoundError
+
+    conn_str = get_connection_string(connection_string)
+    if not conn_str:
+        raise RuntimeError("Chane de connexion Azure manquante.")
+    try:
+        return np.load(download_blob_to_file(container_name, filename, conn_str))
+    except ResourceNotFoundError:
+        return None  # Pas de fichier publie
+
+
+def load_embeddings_with_ids(source: str = "local",
+                             filename: str = "articles_embeddings.npy",
+                             container_name: str = "artefacts-fresh",
+                             connection_string: str = None) -> tuple:
+    """
+    Charge la source canonique des embeddings, l'article_id et la norme d'origine de chaque ligne.
+
+    - .npy : matrice mappee + fichiers voisins <nom>_article_ids.npy (obligatoire : un
+      catalogue partiel lu dans l'ordre des lignes servirait de faux article_id) et
+      <nom>_norms.npy (un .npy non normalise est normalise en memoire, normes calculees ici)
+    - .npz : cles "embeddings" (matrice brute, normes calculees ici) et, si presente,
+      "article_ids" ; sinon article_id = numero de ligne (catalogue complet, ordre de articles_metadata)
+    Sans normes enregistrees, les profils CBF moyennent les lignes normalisees (avertissement).
+
+    Retour : (embeddings normalises, article_ids, normes d'origine ou None)
+    """
+    raw = load_embeddings(source=source,
+                          filename=filename,
+                          container_name=container_name,
+                          connection_string=connection_string,
+                          normalize=False)
+    if filename.endswith(".npy") and is_normalized(raw):
+        # Artefact de save_embeddings_npy : memmap servi tel quel, normes lues a cote
+        embeddings = raw
+        norms = _load_sidecar(source, norms_path(filename), container_name, connection_string)
+        if norms is None:
+            logging.warning(f"[LOADERS] {norms_path(filename)} absent : profils CBF calcules sur les lignes normalisees")
+    else:
+        # Matrice brute (.npz, autre producteur) : normalisee ici, normes calculees au passage
+        embeddings, norms = normalize_embeddings(raw, return_norms=True)
+
+    article_ids = None
+    if filename.endswith(".npy"):
+        article_ids = _load_sidecar(source, article_ids_path(filename), container_name, connection_string)
+        if article_ids is None:
+            raise FileNotFoundError(f" article_id des embeddings introuvables : {article_ids_path(filename)} "
+                                    f"(cf. scripts/export_embeddings_npy.py)")
+
+    elif filename.endswith(".npz"):
+        if source == "local":
+            path = os.path.abspath(os.path.join(PROJECT_ROOT, "outputs", filename))
+        else:
+            # Deja dans le cache disque (telecharge par load_embeddings) : simple HEAD
+            path = download_blob_to_file(container_name, filename, get_connection_string(connection_string))
+        with np.load(path) as npz:
+            if "article_ids" in npz.files:
+                article_ids = npz["article_ids"]
+
+    if article_ids is None:
+        article_ids = np.arange(len(embeddings), dtype=np.int64)
+    return embeddings, article_ids, norms
+
+
+def open_cf_factors(paths: dict, meta_path: str) -> CFFactors:
+    """
+    Assemble des CFFactors  partir des fichiers de l'artefact : tableaux ouverts
+    par np.memmap (pages partages entre workers), scalaires lus dans meta.json.
+    """
+    with open(meta_path) as f:
+        meta = json.load(f)
+    arrays = {name: np.load(paths[name], mmap_mode="r") for name in CF_FACTOR_ARRAYS}
+    return CFFactors(global_mean=float(meta["global_mean"]),
+                     rating_scale=tuple(meta["rating_scale"]),
+                     biased=bool(meta["biased"]),
+                     **arrays)
+
+
+def load_cf_factors(source: str = "local",
+                    dirname: str = "model_cf_factors",
+                    container_name: str = "artefacts-fresh",
+                    connection_string: str = None) -> CFFactors:
+    """
+    Charge l'artefact de facteurs CF (cf. cf_scoring.save_cf_factors) :
+    chaque tableau .npy est mapp en lecture seule, aucun pickle n'est dsrialis.
+    Sur Azure, les fichiers sont les blobs <dirname>/<tableau>.npy.
+    """
+    if source == "local":
+        folder = os.path.abspath(os.path.join(PROJECT_ROOT, "models", dirname))
+        if not os.path.isdir(folder):
+            raise FileNotFoundError(f" Facteurs CF non trouvs : {folder}")
+        paths = {name: os.path.join(folder, f"{name}.npy") for name in CF_FACTOR_ARRAYS}
+        meta_path = os.path.join(folder, CF_FACTOR_META)
+
+    elif source == "azure":
+        try:
+            conn_str = get_connection_string(connection_string)
+            if not conn_str:
+                raise RuntimeError("Chane de connexion Azure manquante.")
+            paths = load_bundle({
+                name: (lambda name=name: download_blob_to_file(container_name, f"{dirname}/{name}.npy", conn_str))
+                for name in CF_FACTOR_ARRAYS
+            })
+            meta_path = download_blob_to_file(container_name, f"{dirname}/{CF_FACTOR_META}", conn_str)
+        except Exception as e:
+            raise RuntimeError(f" Erreur chargement facteurs CF Azure : {str(e)}")
+
+    else:
+        raise ValueError("Paramtre 'source' invalide. Attendu : 'local' ou 'azure'")
+
+    return open_cf_factors(paths, meta_path)
+
+
+def open_precomputed_table(paths: dict, meta_path: str) -> PrecomputedTable:
+    """
+    Assemble la table de recommandations precalculees : tableaux mappes par
+    np.memmap, grille des alphas et versions des artefacts de depart lues dans meta.json.
+    """
+    with open(meta_path) as f:
+        meta = json.load(f)
+    arrays = {name: np.load(paths[name], mmap_mode="r") for name in PRECOMPUTED_ARRAYS}
+    return PrecomputedTable(alphas=tuple(float(a) for a in meta["alphas"]),
+                            sources=meta.get("sources"),
+                            **arrays)
+
+
+def load_precomputed_table(source: str = "local",
+                           dirname: str = "reco_table",
+                           container_name: str = "artefacts-fresh",
+                           connection_string: str = None) -> PrecomputedTable:
+    """
+    Charge l'artefact de recommandations precalculees (cf. scripts/precompute_recommendations.py).
+    Sur Azure, les fichiers sont les blobs <dirname>/<tableau>.npy.
+    """
+    if source == "local":
+        folder = os.path.abspath(os.path.join(PROJECT_ROOT, "models", dirname))
+        if not os.path.isdir(folder):
+            raise FileNotFoundError(f" Table precalculee non trouvee : {folder}")
+        paths = {name: os.path.join(folder, f"{name}.npy") for name in PRECOMPUTED_ARRAYS}
+        meta_path = os.path.join(folder, PRECOMPUTED_META)
+
+    elif source == "azure":
+        try:
+            conn_str = get_connection_string(connection_string)
+            if not conn_str:
+                raise RuntimeError("Chane de connexion Azure manquante.")
+            paths = load_bundle({
+                name: (lambda name=name: download_blob_to_file(container_name, f"{dirname}/{name}.npy", conn_str))
+                for name in PRECOMPUTED_ARRAYS
+            })
+            meta_path = download_blob_to_file(container_name, f"{dirname}/{PRECOMPUTED_META}", conn_str)
+        except Exception as e:
+            raise RuntimeError(f" Erreur chargement table precalculee Azure : {str(e)}")
+
+    else:
+        raise ValueError("Paramtre 'source' invalide. Attendu : 'local' ou 'azure'")
+
+    return open_precomputed_table(paths, meta_path)
+
+
+def load_cf_model(source: str = "local",
+                  filename: str = "model_cf.pkl",
+                  container_name: str = "artefacts-fresh",
+                  connection_string: str = None):
+    """
+    Charge un modle CF entran (format Surprise).
+    """
+    if source == "local":
+        path = os.path.abspath(os.path.join(PROJECT_ROOT, "models", filename))
+        if not os.path.exists(path):
+            raise FileNotFoundError(f" Modle CF non trouv : {path}")
+        from surprise import dump  # Surprise n'est utile qu'au modle pickl (cf. load_cf_factors)
+        _, model = dump.load(path)
+        return model
+
+    elif source == "azure":
+        try:
+            conn_str = get_connection_string(connection_string)
+            if not conn_str:
+                raise RuntimeError("Chane de connexion Azure manquante.")
+
+            with open(download_blob_to_file(container_name, filename, conn_str), "rb") as f:
+                model_obj = pickle.load(f)
+            return model_obj["algo"]
+
+        except Exception as e:
+            raise RuntimeError(f" Erreur chargement modle CF Azure : {str(e)}")
+
+    else:
+        raise ValueError("Paramtre 'source' invalide. Attendu : 'local' ou 'azure'")
+
+
+
+# Appels :
+# En local              :           df = load_df(source="local")
+    
+# Depuis Azure Blob     :           df = load_df(source="azure")
\ No newline at end of file
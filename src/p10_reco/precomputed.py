@@ -0,0 +1,154 @@
+# src/p10_reco/precomputed.py
+
+import os
+import json
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .recommendation_engine import get_recommendations_batch
+from .article_index import as_article_index
+
+
+# Tableaux de l'artefact de recommandations précalculées (un .npy par tableau) + métadonnées
+PRECOMPUTED_ARRAYS = ("user_ids", "click_counts", "recs")
+PRECOMPUTED_META = "meta.json"
+
+# Grille par défaut : alpha de 0.0 à 1.0 par pas de 0.1 (curseur de app.py)
+DEFAULT_ALPHAS = tuple(round(a, 1) for a in np.linspace(0.0, 1.0, 11))
+
+
+@dataclass(frozen=True)
+class PrecomputedTable:
+    """
+    Top-N précalculé par utilisateur et par configuration : "cbf", "cf", puis
+    "hybrid" pour chaque alpha de la grille.
+
+    Le mode "auto" n'est pas stocké : il se résout à la lecture à partir du
+    nombre de clics (cbf sous le seuil, hybrid au-delà), comme dans
+    get_recommendations ; tout seuil est donc servi par la table.
+
+    Attributs :
+        user_ids (np.ndarray) : user_id triés (n_users,)
+        click_counts (np.ndarray) : clics par utilisateur, doublons inclus (n_users,)
+        recs (np.ndarray) : article_id par utilisateur, configuration et rang,
+                            complétés par -1 (n_users, 2 + n_alphas, top_n)
+        alphas (tuple) : valeurs d'alpha des configurations hybrid
+        sources (dict) : version de chaque artefact de départ (cf. wrappers.source_versions),
+                         None si inconnue : la table n'est servie qu'avec ces artefacts
+    """
+    user_ids: np.ndarray
+    click_counts: np.ndarray
+    recs: np.ndarray
+    alphas: tuple
+    sources: Optional[dict] = None
+
+    @property
+    def top_n(self) -> int:
+        return self.recs.shape[2]
+
+    def config_position(self, mode: str, alpha: float) -> int:
+        """
+        Colonne de la configuration (mode "cbf", "cf" ou "hybrid"), -1 si absente de la grille.
+        """
+        if mode == "cbf":
+            return 0
+        if mode == "cf":
+            return 1
+        if mode == "hybrid":
+            matches = np.flatnonzero(np.isclose(self.alphas, alpha, rtol=0, atol=1e-9))
+            return 2 + int(matches[0]) if len(matches) else -1
+        return -1
+
+    def lookup(self, user_id: int, mode: str, alpha: float,
+               user_clicks_threshold: int, top_n: int) -> Optional[List[int]]:
+        """
+        Recommandations précalculées (top_n premiers de la ligne), None si
+        l'utilisateur, le mode, alpha ou top_n sortent de la table : l'appelant
+        se replie alors sur le calcul en ligne.
+        """
+        if top_n > self.top_n:
+            return None
+
+        pos = int(np.searchsorted(self.user_ids, user_id))
+        if pos >= len(self.user_ids) or self.user_ids[pos] != user_id:
+            return None
+
+        if mode == "auto":
+            nb_clicks = int(self.click_counts[pos])
+            if nb_clicks == 0:
+                return []
+            mode = "cbf" if nb_clicks < user_clicks_threshold else "hybrid"
+
+        config = self.config_position(mode, alpha)
+        if config < 0:
+            return None
+
+        row = self.recs[pos, config, :top_n]
+        return [int(aid) for aid in row[row >= 0]]
+
+
+def build_precomputed_table(user_ids: Sequence[int],
+                            df,
+                            model_cf,
+                            embeddings: np.ndarray,
+                            article_id_to_index,
+                            click_index,
+                            alphas: Sequence[float] = DEFAULT_ALPHAS,
+                            top_n: int = 10,
+                            block_size: int = 64,
+                            user_profiles=None,
+                            sources: Optional[dict] = None) -> PrecomputedTable:
+    """
+    Calcule la table hors ligne avec get_recommendations_batch (une passe par
+    configuration). top_k_indices départage les ex aequo de façon stable : le
+    top-n servi est exactement le préfixe du top-N stocké.
+
+    Args:
+        user_ids : utilisateurs à précalculer (ex : outputs/user_ids_valid.json)
+        df, model_cf, embeddings, article_id_to_index, click_index : artefacts de service
+        alphas : grille des pondérations du mode hybride
+        top_n (int) : nombre d'articles stockés par configuration (N)
+        block_size (int) : utilisateurs par bloc de get_recommendations_batch
+        user_profiles (UserProfiles) : profils CBF précalculés (optionnel)
+        sources (dict) : versions des artefacts de départ, enregistrées dans meta.json
+
+    Returns:
+        PrecomputedTable
+    """
+    sorted_ids = np.unique(np.asarray(list(user_ids), dtype=np.int64))
+    article_index = as_article_index(article_id_to_index)
+    alphas = tuple(float(a) for a in alphas)
+    configs = [("cbf", 0.0), ("cf", 0.0)] + [("hybrid", a) for a in alphas]
+
+    recs = np.full((len(sorted_ids), len(configs), top_n), -1, dtype=np.int64)
+    for c, (mode, alpha) in enumerate(configs):
+        results = get_recommendations_batch(sorted_ids.tolist(), df, model_cf, embeddings,
+                                            article_index, mode=mode, alpha=alpha,
+                                            top_n=top_n, click_index=click_index,
+                                            block_size=block_size, user_profiles=user_profiles)
+        for i, user_id in enumerate(sorted_ids.tolist()):
+            items = results[user_id]
+            recs[i, c, :len(items)] = items
+
+    click_counts = np.array([click_index.get_click_count(u) for u in sorted_ids.tolist()], dtype=np.int32)
+    return PrecomputedTable(user_ids=sorted_ids, click_counts=click_counts, recs=recs, alphas=alphas,
+                            sources=sources)
+
+
+def save_precomputed_table(table: PrecomputedTable, output_dir: str, source_digests: Optional[dict] = None) -> str:
+    """
+    Écrit la table en artefact mappable : un .npy par tableau + meta.json
+    (alphas, versions des artefacts de départ comparées au chargement et,
+    pour traçabilité, empreintes de leur contenu calculées hors ligne).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    for name in PRECOMPUTED_ARRAYS:
+        np.save(os.path.join(output_dir, f"{name}.npy"), np.ascontiguousarray(getattr(table, name)))
+
+    with open(os.path.join(output_dir, PRECOMPUTED_META), "w") as f:
+        json.dump({"alphas": list(table.alphas), "top_n": table.top_n, "sources": table.sources,
+                   "source_digests": source_digests}, f)
+
+    return output_dir
@@ -0,0 +1,43 @@
+# src/p10_reco/ranking.py
+
+import numpy as np
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Renvoie les indices des k plus grands scores, triés par score décroissant.
+
+    Sélection par np.argpartition puis tri des seuls k candidats : coût
+    O(n + k log k) au lieu de O(n log n) pour un tri complet.
+    En cas d'égalité, l'indice le plus petit passe en premier (résultat
+    déterministe, identique à un tri stable décroissant).
+
+    Args:
+        scores (np.ndarray): vecteur de scores (n,)
+        k (int): nombre d'indices à renvoyer
+
+    Returns:
+        np.ndarray: indices (min(k, n),) triés par score décroissant
+    """
+    scores = np.asarray(scores)
+    n = len(scores)
+    k = min(int(k), n)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    if k < n:
+        # Seuil = k-ième plus grand score
+        partitioned = np.argpartition(scores, n - k)
+        kth = scores[partitioned[n - k]]
+
+        # argpartition départage les ex aequo au seuil de façon arbitraire :
+        # on garde tous les scores strictement supérieurs, puis les ex aequo
+        # d'indice le plus petit
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(above)]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(n)
+
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
@@ -0,0 +1,421 @@
+# src/p10_reco/recommendation_engine.py
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+# Imports du service uniquement (ni sklearn ni Surprise : scoring par produits scalaires)
+from .cf_scoring import get_cf_scorer
+from .click_index import build_user_click_index
+from .ann_index import search_ivf
+from .ranking import top_k_indices
+from .article_index import as_article_index
+from .embeddings import mean_profile
+
+
+def get_seen_articles(user_id, df, click_index = None) -> np.ndarray:
+    """
+    Articles déjà cliqués par l'utilisateur (sans doublons).
+    Lecture O(historique) dans l'index CSR s'il est fourni, sinon balayage de df.
+    """
+    if click_index is not None:
+        return click_index.get_articles(user_id)
+    return df[df["user_id"] == user_id]["article_id"].unique()
+
+
+def get_all_articles(df, click_index = None) -> np.ndarray:
+    """
+    Catalogue des articles présents dans les interactions.
+    """
+    if click_index is not None:
+        return click_index.all_articles
+    return df["article_id"].unique()
+
+
+def get_user_profile(user_id, embeddings : np.ndarray, seen_rows : np.ndarray, user_profiles = None,
+                     norms : np.ndarray = None) -> np.ndarray:
+    """
+    Profil CBF (moyenne des embeddings vus) : lu dans la matrice précalculée
+    si elle couvre l'utilisateur, sinon calculé sur son historique.
+    - norms : normes d'origine des lignes (ArticleIndex.norms), pour moyenner
+              les embeddings bruts et non les lignes normalisées
+    """
+    if user_profiles is not None:
+        profile = user_profiles.get(user_id)
+        if profile is not None:
+            return profile
+    return mean_profile(embeddings, seen_rows, norms)
+
+
+def cosine_scores(embeddings : np.ndarray, profile : np.ndarray) -> np.ndarray:
+    """
+    Similarité cosinus entre un profil et tous les articles, en un seul GEMV.
+    - embeddings : matrice L2-normalisée (data_preprocessing.normalize_embeddings)
+    - profile : vecteur profil (n_dims,), normalisé ici
+    """
+    norm = np.linalg.norm(profile)
+    if norm == 0:
+        return np.zeros(len(embeddings), dtype = embeddings.dtype)
+    return embeddings @ (profile / norm).astype(embeddings.dtype, copy = False)
+
+
+def get_cbf_recommendations(user_id,
+                            df,
+                            embeddings,
+                            article_id_to_index,
+                            top_n = 5,
+                            click_index = None,
+                            ann_index = None,
+                            n_probe = None,
+                            user_profiles = None):
+    """
+    Renvoie les recommandations CBF pour un utilisateur donné.
+    - user_id : identifiant de l’utilisateur
+    - df : DataFrame interactions (colonnes : user_id, article_id)
+    - embeddings : matrice numpy (n_articles, n_dims), L2-normalisée
+    - article_id_to_index : ArticleIndex (article_index.py) ou dict {article_id: index dans la matrice}
+    - top_n : nombre de recommandations à renvoyer
+    - click_index : index utilisateur → articles (click_index.build_user_click_index), optionnel
+    - ann_index : index IVF (ann_index.build_ivf_index) ; recherche approchée au lieu
+                  de scorer tout le catalogue, optionnel
+    - n_probe : groupes IVF visités (réglage rappel / latence, cf. recall_at_k_report)
+    - user_profiles : profils précalculés (user_profiles.UserProfiles), optionnel
+    Retour : liste d’IDs d’articles recommandés
+    """
+    user_clicks = get_seen_articles(user_id, df, click_index)
+
+    if len(user_clicks) == 0:
+        return []  # Aucun historique → aucune recommandation
+
+    # On récupère les indices correspondants dans la matrice d’embeddings
+    article_index = as_article_index(article_id_to_index)
+    valid_indices = article_index.rows(user_clicks)
+    valid_indices = valid_indices[valid_indices >= 0]
+
+    if len(valid_indices) == 0:
+        return []  # Aucun article cliquable ne correspond aux embeddings
+
+    user_profile = get_user_profile(user_id, embeddings, valid_indices, user_profiles, article_index.norms)
+
+    if ann_index is not None:
+        # Recherche approchée : seuls les articles des n_probe groupes les plus proches sont scorés
+        norm = np.linalg.norm(user_profile)
+        if norm == 0:
+            return []
+        top_indices, _ = search_ivf(ann_index, embeddings, user_profile / norm, top_n,
+                                    n_probe = n_probe, exclude_rows = valid_indices)
+        top_ids = article_index.ids(top_indices)
+        return [int(aid) for aid in top_ids[top_ids >= 0]]
+
+    # Calcul des similarités avec tous les articles (produit scalaire, matrice pré-normalisée)
+    similarities = cosine_scores(embeddings, user_profile)
+
+    # On évite de recommander des articles déjà vus
+    similarities[valid_indices] = -1
+
+    # Sélection partielle des top_n (argpartition) plutôt qu'un tri complet du catalogue
+    top_indices = top_k_indices(similarities, top_n)
+
+    # Mapping inverse ligne → article_id : lecture directe dans row_to_id
+    top_ids = article_index.ids(top_indices)
+    return [int(aid) for aid in top_ids[top_ids >= 0]]
+
+
+
+def get_cf_recommendations(user_id : int,
+                           df : "pd.DataFrame",
+                           model,
+                           top_n : int = 5,
+                           click_index = None) -> list:
+    """
+    Recommandations CF : prédit les meilleurs articles pour un utilisateur.
+
+    Args:
+        user_id (int) : utilisateur ciblé
+        df (pd.DataFrame) : historique clics
+        model : modèle CF entraîné (SVD) ou facteurs extraits (cf_scoring.CFFactors)
+        top_n (int) : nombre de suggestions
+        click_index (UserClickIndex) : index des clics pré-calculé (optionnel)
+
+    Returns:
+        list : article_id des articles recommandés
+    """
+    # Articles déjà vus par l'utilisateur
+    seen_articles = get_seen_articles(user_id, df, click_index)
+
+    # Tous les articles existants
+    all_articles = get_all_articles(df, click_index)
+
+    # Articles jamais vus
+    unseen_articles = all_articles[~np.isin(all_articles, seen_articles)]
+
+    # Prédictions pour tous les articles non vus en un seul produit matrice-vecteur
+    scores = get_cf_scorer(model).score(user_id, unseen_articles)
+
+    # Sélection des top_n (ordre du catalogue en cas d'égalité)
+    top_indices = top_k_indices(scores, top_n)
+
+    # Récupération des article_id les mieux notés
+    return [int(aid) for aid in unseen_articles[top_indices]]
+
+
+def get_hybrid_recommendations(user_id : int,
+                                df : pd.DataFrame,
+                                embeddings : np.ndarray,
+                                article_id_to_index,
+                                model_cf,
+                                top_n : int = 5,
+                                alpha : float = 0.5,
+                                click_index = None,
+                                user_profiles = None) -> list:
+    """
+    Renvoie des recommandations hybrides (CBF + CF), pondérées par alpha.
+    
+    Args:
+        user_id (int): identifiant utilisateur
+        df (pd.DataFrame): interactions
+        embeddings (np.ndarray): matrice d’embeddings articles, L2-normalisée
+        article_id_to_index (ArticleIndex ou dict): mapping article_id → index
+        model_cf : modèle collaboratif pré-entraîné (SVD ou CFFactors)
+        top_n (int): nombre d’articles à retourner
+        alpha (float): pondération CBF vs CF (0.0 = 100% CF, 1.0 = 100% CBF)
+        click_index (UserClickIndex): index des clics pré-calculé (optionnel)
+        user_profiles (UserProfiles): profils CBF précalculés (optionnel)
+
+    Returns:
+        list: liste des article_id recommandés (triés par score combiné)
+    """
+    # Articles vus par l’utilisateur et catalogue des candidats
+    seen_articles = get_seen_articles(user_id, df, click_index)
+    all_articles = get_all_articles(df, click_index)
+
+    # CBF : profil utilisateur
+    article_index = as_article_index(article_id_to_index)
+    seen_rows = article_index.rows(seen_articles)
+    seen_rows = seen_rows[seen_rows >= 0]
+    if len(seen_rows) == 0:
+        return get_cf_recommendations(user_id, df, model_cf, top_n, click_index)
+
+    profile_vec = get_user_profile(user_id, embeddings, seen_rows, user_profiles, article_index.norms)
+    similarities = cosine_scores(embeddings, profile_vec)
+
+    # Scores CBF alignés sur le catalogue (0 pour les articles sans embedding)
+    candidate_rows = article_index.rows(all_articles)
+    cbf_scores = np.where(candidate_rows >= 0, similarities[candidate_rows], 0.0)
+
+    # CF : scores du même catalogue, dans le même ordre
+    cf_scores = get_cf_scorer(model_cf).score(user_id, all_articles)
+
+    # Fusion des scores pondérés, articles vus exclus
+    hybrid_scores = alpha * cbf_scores + (1 - alpha) * cf_scores
+    hybrid_scores[np.isin(all_articles, seen_articles)] = -np.inf
+
+    # Sélection des top_n sans trier tous les articles
+    top_indices = top_k_indices(hybrid_scores, top_n)
+    top_indices = top_indices[np.isfinite(hybrid_scores[top_indices])]
+
+    return [int(aid) for aid in all_articles[top_indices]]
+
+
+def get_recommendations(user_id: int,
+                        df: pd.DataFrame,
+                        model_cf,  # modèle CF préentraîné ou chargé
+                        embeddings,
+                        article_id_to_index,
+                        mode: str = "auto",
+                        alpha: float = 0.5,
+                        user_clicks_threshold: int = 5,
+                        top_n: int = 5,
+                        click_index = None,
+                        ann_index = None,
+                        n_probe: int = None,
+                        user_profiles = None) -> List[int]:
+    """
+    Fonction centrale de recommandation.
+
+    Paramètres :
+        user_id : ID utilisateur cible
+        df : DataFrame interactions (user_id, article_id)
+        model_cf : modèle collaboratif filtré (ex : SVD)
+        embeddings : matrice d'embeddings réduits des articles, L2-normalisée
+        article_id_to_index : mapping article_id → index dans embeddings (ArticleIndex ou dict)
+        mode : "cbf", "cf", "hybrid" ou "auto"
+        alpha : poids CBF/CF pour mode "hybrid"
+        user_clicks_threshold : seuil de clics pour bascule logique
+        top_n : nombre d’articles recommandés
+        click_index : index utilisateur → articles pré-calculé ; évite les
+                      balayages complets de df à chaque requête
+        ann_index : index IVF optionnel pour la recherche CBF approchée
+        n_probe : groupes IVF visités (défaut : celui de l'index)
+        user_profiles : profils CBF précalculés (UserProfiles) ; évite la moyenne
+                        de tout l'historique à chaque requête
+
+    Retour :
+        Liste des article_id recommandés (triée par score décroissant)
+    """
+    if mode == "auto":
+        if click_index is not None:
+            nb_clicks = click_index.get_click_count(user_id)
+        else:
+            nb_clicks = int((df["user_id"] == user_id).sum())
+
+        if nb_clicks == 0:
+            return []
+        elif nb_clicks < user_clicks_threshold:
+            return get_cbf_recommendations(user_id, df, embeddings, article_id_to_index, top_n, click_index, ann_index, n_probe, user_profiles)
+        else:
+            return get_hybrid_recommendations(user_id, df, embeddings, article_id_to_index, model_cf, top_n, alpha, click_index, user_profiles)
+
+    elif mode == "cbf":
+        return get_cbf_recommendations(user_id, df, embeddings, article_id_to_index, top_n, click_index, ann_index, n_probe, user_profiles)
+
+    elif mode == "cf":
+        return get_cf_recommendations(user_id, df, model_cf, top_n, click_index)
+
+    elif mode == "hybrid":
+        return get_hybrid_recommendations(user_id, df, embeddings, article_id_to_index, model_cf, top_n, alpha, click_index, user_profiles)
+
+    else:
+        raise ValueError(f"Mode de recommandation invalide : {mode}")
+
+
+def _resolve_batch_mode(mode : str, nb_clicks : int, has_profile : bool, user_clicks_threshold : int):
+    """
+    Mode effectif d'un utilisateur dans un batch (même logique que get_recommendations).
+    Renvoie None si aucune recommandation n'est possible.
+    """
+    if mode == "auto":
+        if nb_clicks == 0:
+            return None
+        mode = "cbf" if nb_clicks < user_clicks_threshold else "hybrid"
+
+    if mode == "cbf":
+        return "cbf" if has_profile else None
+    if mode == "hybrid" and not has_profile:
+        return "cf"  # repli CF sans article profilable, comme get_hybrid_recommendations
+    return mode
+
+
+def _catalog_positions(article_ids : np.ndarray, catalog_order : np.ndarray, sorted_catalog : np.ndarray) -> np.ndarray:
+    """
+    Positions des articles dans le catalogue (les articles absents sont ignorés).
+    """
+    positions = np.searchsorted(sorted_catalog, article_ids)
+    found = positions < len(sorted_catalog)
+    found[found] = sorted_catalog[positions[found]] == article_ids[found]
+    return catalog_order[positions[found]]
+
+
+def get_recommendations_batch(user_ids,
+                              df : pd.DataFrame,
+                              model_cf,
+                              embeddings : np.ndarray,
+                              article_id_to_index,
+                              mode : str = "auto",
+                              alpha : float = 0.5,
+                              user_clicks_threshold : int = 5,
+                              top_n : int = 5,
+                              click_index = None,
+                              block_size : int = 64,
+                              user_profiles = None) -> Dict[int, List[int]]:
+    """
+    Recommandations pour plusieurs utilisateurs à la fois (ex : campagne e-mail).
+
+    Les profils d'un bloc d'utilisateurs forment une matrice : CBF et CF sont
+    calculés par produits matrice-matrice, puis top_n par ligne. Résultats
+    identiques à get_recommendations appelé utilisateur par utilisateur.
+
+    Args:
+        user_ids : identifiants des utilisateurs ciblés
+        df (pd.DataFrame) : interactions (user_id, article_id)
+        model_cf : modèle CF (SVD) ou facteurs extraits (CFFactors)
+        embeddings (np.ndarray) : matrice d'embeddings L2-normalisée
+        article_id_to_index (ArticleIndex ou dict) : mapping article_id → index
+        mode (str) : "cbf", "cf", "hybrid" ou "auto"
+        alpha (float) : poids CBF/CF pour le mode hybride
+        user_clicks_threshold (int) : seuil de clics pour le mode "auto"
+        top_n (int) : nombre d'articles par utilisateur
+        click_index (UserClickIndex) : index des clics (construit une fois si absent)
+        block_size (int) : utilisateurs par bloc ; borne la mémoire à
+                           block_size x n_articles scores
+        user_profiles (UserProfiles) : profils CBF précalculés, lus tels quels (optionnel)
+
+    Returns:
+        dict : {user_id: liste des article_id recommandés}
+    """
+    if mode not in ("auto", "cbf", "cf", "hybrid"):
+        raise ValueError(f"Mode de recommandation invalide : {mode}")
+
+    # Structures partagées par tous les blocs
+    if click_index is None:
+        click_index = build_user_click_index(df)
+    scorer = get_cf_scorer(model_cf) if mode != "cbf" else None
+
+    article_index = as_article_index(article_id_to_index)
+    all_articles = click_index.all_articles
+    cf_items = scorer.prepare_items(all_articles) if scorer is not None else None
+    candidate_rows = article_index.rows(all_articles)
+    catalog_order = np.argsort(all_articles, kind = "stable")
+    sorted_catalog = all_articles[catalog_order]
+
+    row_to_article_id = article_index.ids(np.arange(len(embeddings)))
+
+    results = {}
+    user_ids = list(user_ids)
+
+    for start in range(0, len(user_ids), block_size):
+        block = user_ids[start:start + block_size]
+
+        # Historiques, profils et mode effectif de chaque utilisateur du bloc
+        profiles = np.zeros((len(block), embeddings.shape[1]), dtype = embeddings.dtype)
+        seen_rows, seen_positions, block_modes = [], [], []
+        for i, user_id in enumerate(block):
+            seen = click_index.get_articles(user_id)
+            rows = article_index.rows(seen)
+            rows = rows[rows >= 0]
+            if len(rows):
+                profile = get_user_profile(user_id, embeddings, rows, user_profiles, article_index.norms)
+                norm = np.linalg.norm(profile)
+                if norm > 0:
+                    profiles[i] = profile / norm
+
+            seen_rows.append(rows)
+            seen_positions.append(_catalog_positions(seen, catalog_order, sorted_catalog))
+            block_modes.append(_resolve_batch_mode(mode, click_index.get_click_count(user_id),
+                                                   len(rows) > 0, user_clicks_threshold))
+
+        need_cbf = [i for i, m in enumerate(block_modes) if m in ("cbf", "hybrid")]
+        need_cf = [i for i, m in enumerate(block_modes) if m in ("cf", "hybrid")]
+
+        # Scores du bloc : un produit matrice-matrice par famille
+        cbf_block = profiles[need_cbf] @ embeddings.T if need_cbf else None
+        cf_block = scorer.score_matrix([block[i] for i in need_cf], items = cf_items) if need_cf else None
+        cbf_pos = {i: k for k, i in enumerate(need_cbf)}
+        cf_pos = {i: k for k, i in enumerate(need_cf)}
+
+        for i, user_id in enumerate(block):
+            user_mode = block_modes[i]
+
+            if user_mode is None:
+                results[user_id] = []
+
+            elif user_mode == "cbf":
+                similarities = cbf_block[cbf_pos[i]]
+                similarities[seen_rows[i]] = -1
+                top_rows = row_to_article_id[top_k_indices(similarities, top_n)]
+                results[user_id] = [int(aid) for aid in top_rows[top_rows >= 0]]
+
+            else:
+                if user_mode == "cf":
+                    scores = cf_block[cf_pos[i]]
+                else:
+                    similarities = cbf_block[cbf_pos[i]]
+                    cbf_scores = np.where(candidate_rows >= 0, similarities[candidate_rows], 0.0)
+                    scores = alpha * cbf_scores + (1 - alpha) * cf_block[cf_pos[i]]
+
+                scores[seen_positions[i]] = -np.inf
+                top_indices = top_k_indices(scores, top_n)
+                top_indices = top_indices[np.isfinite(scores[top_indices])]
+                results[user_id] = [int(aid) for aid in all_articles[top_indices]]
+
+    return results
@@ -0,0 +1,78 @@
+# src/p10_reco/result_cache.py
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class ResultCache:
+    """
+    Cache LRU + TTL des réponses du service, partagé par les threads du processus.
+
+    Les entrées expirent ttl_s secondes après leur écriture ; au-delà de
+    max_size entrées, la moins récemment lue est supprimée. max_size = 0
+    désactive le cache.
+
+    Args:
+        max_size (int) : nombre maximal d'entrées
+        ttl_s (float) : durée de vie d'une entrée en secondes
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl_s: float = 600.0):
+        self.max_size = max_size
+        self.ttl_s = ttl_s
+        self._entries = OrderedDict()  # clé → (échéance, valeur)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[tuple]:
+        """
+        Valeur en cache, None si absente ou expirée (compté comme un échec).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: tuple):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_s, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Compteurs du cache (exposés par diagnostics.system_diagnostic).
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"size": len(self._entries),
+                    "max_size": self.max_size,
+                    "ttl_s": self.ttl_s,
+                    "hits": self.hits,
+                    "misses": self.misses,
+                    "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                    "evictions": self.evictions,
+                    "expirations": self.expirations}
@@ -0,0 +1,92 @@
+# src/p10_reco/user_directory.py
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+# Une ligne par utilisateur, triée par user_id : un seul .npy mappable (aucun pickle)
+USER_DIRECTORY_DTYPE = np.dtype([("user_id", "<i4"), ("click_count", "<i4"), ("offset", "<i8")])
+
+
+@dataclass(frozen=True)
+class UserDirectory:
+    """
+    Annuaire compact des utilisateurs connus : validation d'un user_id et
+    nombre de clics (décision du mode "auto") sans lire la table des clics.
+
+    Attributs :
+        user_ids (np.ndarray) : user_id triés, int32 (n_users,)
+        click_counts (np.ndarray) : clics par utilisateur, doublons inclus (n_users,)
+        offsets (np.ndarray) : début de l'historique de chaque utilisateur dans
+                               UserClickIndex.article_ids (mêmes clics)
+    """
+    user_ids: np.ndarray
+    click_counts: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> "UserDirectory":
+        """
+        Vues sur les colonnes d'un tableau structuré (ex : np.load(..., mmap_mode="r")).
+        """
+        return cls(user_ids=records["user_id"],
+                   click_counts=records["click_count"],
+                   offsets=records["offset"])
+
+    def to_records(self) -> np.ndarray:
+        records = np.empty(len(self.user_ids), dtype=USER_DIRECTORY_DTYPE)
+        records["user_id"] = self.user_ids
+        records["click_count"] = self.click_counts
+        records["offset"] = self.offsets
+        return records
+
+    @property
+    def n_users(self) -> int:
+        return len(self.user_ids)
+
+    def position(self, user_id: int) -> int:
+        """
+        Ligne de l'utilisateur (-1 s'il est inconnu). Recherche dichotomique : O(log n_users).
+        """
+        pos = int(np.searchsorted(self.user_ids, user_id))
+        if pos < len(self.user_ids) and self.user_ids[pos] == user_id:
+            return pos
+        return -1
+
+    def contains(self, user_id: int) -> bool:
+        return self.position(user_id) >= 0
+
+    def get_click_count(self, user_id: int) -> int:
+        """
+        Nombre total de clics de l'utilisateur (0 s'il est inconnu).
+        """
+        pos = self.position(user_id)
+        return int(self.click_counts[pos]) if pos >= 0 else 0
+
+
+def build_user_directory(click_index) -> UserDirectory:
+    """
+    Extrait l'annuaire d'un UserClickIndex (cf. click_index.build_user_click_index).
+
+    Args:
+        click_index (UserClickIndex) : index des clics
+
+    Returns:
+        UserDirectory
+    """
+    user_ids = np.asarray(click_index.user_ids)
+    if len(user_ids) and (user_ids.min() < np.iinfo(np.int32).min or user_ids.max() > np.iinfo(np.int32).max):
+        raise ValueError("user_id hors de la plage int32 : annuaire compact impossible")
+
+    return UserDirectory(user_ids=user_ids.astype(np.int32),
+                         click_counts=np.asarray(click_index.click_counts).astype(np.int32),
+                         offsets=np.asarray(click_index.offsets[:-1], dtype=np.int64))
+
+
+def save_user_directory(directory: UserDirectory, path: str) -> str:
+    """
+    Écrit l'annuaire en un seul .npy structuré (USER_DIRECTORY_DTYPE).
+    """
+    np.save(path, directory.to_records())
+    return path
@@ -0,0 +1,77 @@
+# src/p10_reco/user_profiles.py
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .article_index import as_article_index
+from .embeddings import mean_profile
+
+
+@dataclass(frozen=True)
+class UserProfiles:
+    """
+    Profils CBF précalculés : une ligne float32 par utilisateur, dans l'ordre
+    de l'annuaire utilisateurs (user_directory.UserDirectory).
+
+    Chaque ligne est la moyenne des embeddings des articles vus, calculée
+    comme dans get_cbf_recommendations : le coût d'une requête ne dépend
+    plus de la longueur de l'historique.
+
+    Attributs :
+        user_ids (np.ndarray) : user_id triés (ceux de l'annuaire) (n_users,)
+        vectors (np.ndarray) : profils (n_users, n_dims), 0 sans article profilable
+    """
+    user_ids: np.ndarray
+    vectors: np.ndarray
+
+    def position(self, user_id: int) -> int:
+        pos = int(np.searchsorted(self.user_ids, user_id))
+        if pos < len(self.user_ids) and self.user_ids[pos] == user_id:
+            return pos
+        return -1
+
+    def get(self, user_id: int) -> Optional[np.ndarray]:
+        """
+        Profil de l'utilisateur, None s'il est absent de la matrice.
+        """
+        pos = self.position(user_id)
+        return self.vectors[pos] if pos >= 0 else None
+
+
+def build_user_profiles(click_index, embeddings: np.ndarray, article_id_to_index) -> UserProfiles:
+    """
+    Calcule la matrice des profils (hors ligne), alignée sur l'index des clics
+    et donc sur l'annuaire construit depuis les mêmes clics.
+
+    Args:
+        click_index (UserClickIndex) : index des clics
+        embeddings (np.ndarray) : matrice d'embeddings L2-normalisée
+        article_id_to_index (ArticleIndex ou dict) : mapping article_id → ligne
+                                                     (et normes d'origine des lignes)
+
+    Returns:
+        UserProfiles
+    """
+    article_index = as_article_index(article_id_to_index)
+    history_rows = article_index.rows(click_index.article_ids)
+
+    vectors = np.zeros((click_index.n_users, embeddings.shape[1]), dtype=np.float32)
+    for pos in range(click_index.n_users):
+        rows = history_rows[click_index.offsets[pos]:click_index.offsets[pos + 1]]
+        rows = rows[rows >= 0]
+        if len(rows):
+            # Même réduction que get_cbf_recommendations (profils identiques au calcul en ligne)
+            vectors[pos] = mean_profile(embeddings, rows, article_index.norms)
+
+    return UserProfiles(user_ids=np.asarray(click_index.user_ids).astype(np.int32), vectors=vectors)
+
+
+def save_user_profiles(profiles: UserProfiles, path: str) -> str:
+    """
+    Écrit la matrice des profils en .npy (float32, mappable) ; les user_id
+    sont ceux de l'annuaire publié à côté.
+    """
+    np.save(path, np.ascontiguousarray(profiles.vectors, dtype=np.float32))
+    return path
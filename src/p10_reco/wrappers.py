@@ -0,0 +1,481 @@
+# src/p10_reco/wrappers.py : point d'entrée du service (local / azure)
+
+import os
+import itertools
+import threading
+from typing import List
+import logging
+
+from .loaders import (PROJECT_ROOT, CLICK_COLUMNS, artifact_version, load_bundle, load_cf_factors, load_df,
+                      load_embeddings_with_ids, load_precomputed_table, load_user_directory,
+                      load_user_profiles)
+from .cf_scoring import CF_FACTOR_ARRAYS, CF_FACTOR_META
+from .recommendation_engine import get_recommendations
+from .click_index import build_user_click_index
+from .article_index import ArticleIndex
+from .result_cache import ResultCache
+from .live_updates import LiveUpdates
+
+# Chargement dynamique .env
+def load_correct_env():
+    if os.getenv("ENV"):
+        logging.info(f"[ENV] Mode '{os.getenv('ENV')}' déjà défini.")
+        return
+
+    # Premier fichier présent : .env.dev, .env.prod, puis .env (racine du projet, sans remonter l'arborescence)
+    env_files = [(".env.dev", " (mode développement)"), (".env.prod", " (mode production)"), (".env", "")]
+    for filename, label in env_files:
+        env_path = os.path.join(PROJECT_ROOT, filename)
+        if os.path.exists(env_path):
+            from dotenv import load_dotenv
+            load_dotenv(dotenv_path=env_path)
+            logging.info(f"[ENV] {filename} chargé{label}")
+            return
+
+    logging.warning("[ENV] Aucun fichier .env trouvé")
+
+load_correct_env()
+
+# ================================
+# Registre d'artefacts (un chargement par processus)
+# ================================
+ARTIFACT_FILES = {
+    # Mode développement : artefacts complets
+    "local": {
+        "df": "df.parquet",
+        "model": "model_cf_factors",
+        "embeddings": "articles_embeddings.npy",
+        "precomputed": "reco_table",  # Optionnel (scripts/precompute_recommendations.py)
+        "users": "user_directory.npy",  # Optionnel (scripts/export_user_directory.py)
+        "profiles": "user_profiles.npy",  # Optionnel, lignes alignées sur "users"
+        "container": None,  # Non utilisé en local
+    },
+    # Mode production : artefacts allégés
+    "azure": {
+        "df": "df_light.parquet",
+        "model": "model_cf_light_factors",
+        "embeddings": "articles_embeddings_light.npy",  # Catalogue de df_articles_light (métadonnées de app.py)
+        "precomputed": "reco_table_light",
+        "users": "user_directory_light.npy",
+        "profiles": "user_profiles_light.npy",
+        "container": "artefacts-fresh",  # Conteneur actuel
+    },
+}
+
+# Composants chargés à la demande, et composants requis par chaque mode :
+# le CBF ne touche jamais au modèle CF, le CF jamais aux embeddings
+ARTIFACT_COMPONENTS = ("clicks", "embeddings", "model", "precomputed", "users", "profiles")
+# Composants construits sur d'autres composants, chargés avant eux (un seul annuaire par processus)
+COMPONENT_DEPENDENCIES = {
+    "profiles": ("users",),
+}
+MODE_ARTIFACTS = {
+    "cbf": ("clicks", "embeddings", "profiles"),
+    "cf": ("clicks", "model"),
+    "hybrid": ("clicks", "embeddings", "model", "profiles"),
+    "auto": ("clicks", "embeddings", "model", "profiles"),
+}
+
+_ARTIFACTS = {}
+_ARTIFACTS_LOCK = threading.Lock()
+
+# Numéro de chargement des artefacts : inclus dans les clés du cache de résultats,
+# il rend inaccessibles les réponses calculées avant un reload()
+_ARTIFACT_VERSIONS = itertools.count(1)
+
+# Cache des réponses (requêtes identiques répétées depuis la barre latérale Streamlit)
+RESULT_CACHE = ResultCache(max_size=int(os.getenv("RESULT_CACHE_SIZE", "10000")),
+                           ttl_s=float(os.getenv("RESULT_CACHE_TTL_S", "600")))
+
+# Demi-vie des profils mis à jour par ingest_clicks (unité de click_timestamp) ; vide = sans amortissement
+LIVE_UPDATES_HALF_LIFE = float(os.getenv("LIVE_UPDATES_HALF_LIFE")) if os.getenv("LIVE_UPDATES_HALF_LIFE") else None
+
+
+def _load_clicks(source: str, files: dict, connection_string: str = None) -> dict:
+    """
+    Clics (user_id, article_id) et index utilisateur → articles cliqués.
+    """
+    df = load_df(source=source,
+                 filename=files["df"],
+                 container_name=files["container"],
+                 connection_string=connection_string,
+                 columns=CLICK_COLUMNS,
+                 compact=True)
+    logging.info(f"[WRAPPERS] df chargé : {df.shape}")
+
+    # Index utilisateur → articles cliqués (évite les balayages de df par requête)
+    click_index = build_user_click_index(df)
+    logging.info(f"[WRAPPERS] Index des clics construit : {click_index.n_users} utilisateurs")
+    return {"df": df, "click_index": click_index}
+
+
+def _load_embeddings(source: str, files: dict, connection_string: str = None) -> dict:
+    """
+    Embeddings (source canonique) et correspondance article_id ↔ ligne en
+    tableaux (ArticleIndex), construite depuis les article_id et les normes
+    d'origine enregistrés à côté.
+    """
+    embeddings, article_ids, norms = load_embeddings_with_ids(source=source,
+                                                              filename=files["embeddings"],
+                                                              container_name=files["container"],
+                                                              connection_string=connection_string)
+    article_index = ArticleIndex.from_article_ids(article_ids, norms=norms)
+    logging.info(f"[WRAPPERS] Embeddings chargés : {embeddings.shape}")
+    return {"embeddings": embeddings, "article_index": article_index}
+
+
+def _load_model(source: str, files: dict, connection_string: str = None) -> dict:
+    """
+    Facteurs du modèle CF (tableaux mappés, prêts pour le scoring vectorisé).
+    """
+    model_cf = load_cf_factors(source=source,
+                               dirname=files["model"],
+                               container_name=files["container"],
+                               connection_string=connection_string)
+    logging.info("[WRAPPERS] Modèle CF chargé")
+    return {"model_cf": model_cf}
+
+
+def source_versions(source: str, connection_string: str = None, content: bool = False) -> dict:
+    """
+    Version de chaque artefact dont dérive la table précalculée (clics,
+    embeddings, facteurs CF), lue sans charger ces artefacts : ETag sur Azure,
+    taille et date de modification en local (cf. loaders.artifact_version).
+    content=True : empreintes SHA-256 du contenu local (précalcul hors ligne).
+    """
+    files = ARTIFACT_FILES[source]
+    folders = {files["df"]: "outputs", files["embeddings"]: "outputs"}
+    folders.update({f"{files['model']}/{name}": "models"
+                    for name in [f"{array}.npy" for array in CF_FACTOR_ARRAYS] + [CF_FACTOR_META]})
+    return load_bundle({
+        name: (lambda name=name: artifact_version(source, folders[name], name, files["container"], connection_string,
+                                                  content=content))
+        for name in folders
+    })
+
+
+def _load_precomputed(source: str, files: dict, connection_string: str = None) -> dict:
+    """
+    Table de recommandations précalculées si elle est publiée et calculée sur
+    les artefacts publiés (cf. source_versions), None sinon (le service calcule
+    alors toutes les recommandations en ligne).
+    """
+    try:
+        precomputed = load_precomputed_table(source=source,
+                                             dirname=files["precomputed"],
+                                             container_name=files["container"],
+                                             connection_string=connection_string)
+        if precomputed.sources != source_versions(source, connection_string):
+            raise RuntimeError("table calculée sur d'autres artefacts (clics, embeddings ou modèle CF republiés)")
+        logging.info(f"[WRAPPERS] Table précalculée chargée : {len(precomputed.user_ids)} utilisateurs, "
+                     f"top {precomputed.top_n}")
+    except (FileNotFoundError, RuntimeError) as e:
+        logging.warning(f"[WRAPPERS] Table précalculée indisponible, calcul en ligne : {str(e)}")
+        precomputed = None
+    return {"precomputed": precomputed}
+
+
+def _load_users(source: str, files: dict, connection_string: str = None) -> dict:
+    """
+    Annuaire utilisateurs s'il est publié, None sinon (repli sur l'index des clics).
+    """
+    try:
+        user_directory = load_user_directory(source=source,
+                                             filename=files["users"],
+                                             container_name=files["container"],
+                                             connection_string=connection_string)
+        logging.info(f"[WRAPPERS] Annuaire utilisateurs chargé : {user_directory.n_users} utilisateurs")
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        logging.warning(f"[WRAPPERS] Annuaire utilisateurs indisponible, index des clics utilisé : {str(e)}")
+        user_directory = None
+    return {"user_directory": user_directory}
+
+
+def _load_profiles(source: str, files: dict, connection_string: str = None, artifacts: dict = None) -> dict:
+    """
+    Matrice des profils CBF si elle est publiée, None sinon (profils calculés par requête).
+    Ses lignes sont celles de l'annuaire déjà chargé par le composant "users".
+    """
+    try:
+        user_profiles = load_user_profiles(source=source,
+                                           filename=files["profiles"],
+                                           user_directory=artifacts.get("user_directory"),
+                                           container_name=files["container"],
+                                           connection_string=connection_string)
+        logging.info(f"[WRAPPERS] Profils utilisateurs chargés : {user_profiles.vectors.shape}")
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        logging.warning(f"[WRAPPERS] Profils utilisateurs indisponibles, calcul par requête : {str(e)}")
+        user_profiles = None
+    return {"user_profiles": user_profiles}
+
+
+_COMPONENT_LOADERS = {
+    "clicks": _load_clicks,
+    "embeddings": _load_embeddings,
+    "model": _load_model,
+    "precomputed": _load_precomputed,
+    "users": _load_users,
+    "profiles": _load_profiles,
+}
+
+
+def _load_artifacts(source: str, connection_string: str = None,
+                    components: tuple = ARTIFACT_COMPONENTS) -> dict:
+    """
+    Charge les composants demandés d'une source (téléchargements concurrents)
+    et prépare les structures dérivées.
+    """
+    if source not in ARTIFACT_FILES:
+        raise ValueError(f"Source invalide : {source}. Utiliser 'local' ou 'azure'")
+
+    files = ARTIFACT_FILES[source]
+    logging.info(f"[WRAPPERS] Chargement des artefacts ({source}) : {', '.join(components)}...")
+
+    # Dépendances d'abord (annuaire : petit fichier), puis le reste en parallèle ;
+    # une dépendance hors du lot est celle déjà chargée pour la source
+    required = {dep for name in components for dep in COMPONENT_DEPENDENCIES.get(name, ())}
+    artifacts = {}
+    for batch in ([name for name in components if name in required],
+                  [name for name in components if name not in required]):
+        available = {**_ARTIFACTS.get(source, {}), **artifacts}
+        tasks = {}
+        for name in batch:
+            kwargs = {"artifacts": available} if name in COMPONENT_DEPENDENCIES else {}
+            tasks[name] = lambda name=name, kwargs=kwargs: _COMPONENT_LOADERS[name](source, files, connection_string,
+                                                                                    **kwargs)
+        loaded = load_bundle(tasks)
+        for name in batch:
+            artifacts.update(loaded[name])
+    return artifacts
+
+
+def _with_dependencies(components: tuple) -> tuple:
+    """
+    Composants demandés et ceux dont ils dépendent (cf. COMPONENT_DEPENDENCIES).
+    """
+    names = set(components)
+    for name in components:
+        names.update(COMPONENT_DEPENDENCIES.get(name, ()))
+    return tuple(name for name in ARTIFACT_COMPONENTS if name in names)
+
+
+def _get_components(source: str, components: tuple, connection_string: str = None) -> dict:
+    """
+    Artefacts de la source contenant au moins les composants demandés (et leurs
+    dépendances) : les composants manquants sont chargés une seule fois, puis
+    partagés par toutes les invocations du processus.
+    """
+    components = _with_dependencies(components)
+    artifacts = _ARTIFACTS.get(source)
+    if artifacts is not None and artifacts["components"].issuperset(components):
+        return artifacts
+
+    with _ARTIFACTS_LOCK:
+        # Un autre thread a pu charger tout ou partie des composants pendant l'attente du verrou
+        artifacts = _ARTIFACTS.get(source) or {"components": frozenset(), "version": next(_ARTIFACT_VERSIONS)}
+        missing = tuple(name for name in ARTIFACT_COMPONENTS
+                        if name in components and name not in artifacts["components"])
+        if missing:
+            # Copie complétée puis bascule : les lecteurs de l'ancien dict ne sont pas affectés
+            artifacts = {**artifacts,
+                         **_load_artifacts(source, connection_string, missing),
+                         "components": artifacts["components"].union(missing)}
+            _ARTIFACTS[source] = artifacts
+        return artifacts
+
+
+def get_artifacts(source: str = "local", connection_string: str = None, mode: str = None) -> dict:
+    """
+    Renvoie les artefacts de la source demandée, chargés au premier appel
+    puis partagés par toutes les invocations du processus.
+
+    Avec mode ("cbf", "cf", "hybrid", "auto"), seuls les composants utiles à
+    ce mode sont garantis chargés (cf. MODE_ARTIFACTS) ; sans mode, tous.
+    """
+    if mode is None:
+        components = ARTIFACT_COMPONENTS
+    elif mode in MODE_ARTIFACTS:
+        components = MODE_ARTIFACTS[mode]
+    else:
+        raise ValueError(f"Mode de recommandation invalide : {mode}")
+    return _get_components(source, components, connection_string)
+
+
+def warmup(source: str = "local", connection_string: str = None, mode: str = None) -> dict:
+    """
+    Précharge les artefacts (à appeler au démarrage du worker), éventuellement
+    limités à ceux d'un mode.
+    """
+    return get_artifacts(source=source, connection_string=connection_string, mode=mode)
+
+
+def reload(source: str = "local", connection_string: str = None) -> dict:
+    """
+    Recharge les composants déjà chargés (nouveau modèle ou nouvelles données publiés).
+    Les requêtes en cours conservent les anciens artefacts jusqu'à la bascule.
+    """
+    current = _ARTIFACTS.get(source)
+    components = tuple(name for name in ARTIFACT_COMPONENTS
+                       if current is None or name in current["components"])
+    artifacts = {**_load_artifacts(source, connection_string, components),
+                 "components": frozenset(components),
+                 "version": next(_ARTIFACT_VERSIONS)}
+    with _ARTIFACTS_LOCK:
+        _ARTIFACTS[source] = artifacts
+    logging.info(f"[WRAPPERS] Artefacts ({source}) rechargés")
+    return artifacts
+
+
+def _get_live_updates(source: str, connection_string: str = None) -> LiveUpdates:
+    """
+    Surcouche des clics ingérés, créée une fois par chargement d'artefacts :
+    un reload() repart des artefacts republiés (qui intègrent ces clics).
+    """
+    artifacts = _get_components(source, ("clicks", "embeddings", "profiles"), connection_string)
+    live = artifacts.get("live_updates")
+    if live is not None:
+        return live
+
+    with _ARTIFACTS_LOCK:
+        artifacts = _ARTIFACTS[source]
+        if artifacts.get("live_updates") is None:
+            live = LiveUpdates(artifacts["click_index"],
+                               artifacts["embeddings"],
+                               artifacts["article_index"],
+                               user_profiles=artifacts.get("user_profiles"),
+                               half_life=LIVE_UPDATES_HALF_LIFE)
+            artifacts = {**artifacts, "live_updates": live}
+            _ARTIFACTS[source] = artifacts
+        return artifacts["live_updates"]
+
+
+def ingest_clicks(events, source: str = "local", connection_string: str = None) -> int:
+    """
+    Prend en compte de nouveaux clics sans reconstruire ni recharger les artefacts :
+    profil (somme courante et nombre d'embeddings) et articles vus de chaque
+    utilisateur sont mis à jour en O(d) par clic ; l'appel suivant à
+    get_recommendations_from_user en tient compte.
+
+    Args:
+        events: clics (user_id, article_id, click_timestamp), en tuples ou en dicts
+        source: "local" ou "azure"
+        connection_string: Chaîne connexion Azure
+
+    Returns:
+        Nombre de clics ingérés
+    """
+    live = _get_live_updates(source, connection_string)
+    count = live.ingest_many(events)
+    logging.info(f"[WRAPPERS] {count} clics ingérés ({source})")
+    return count
+
+
+def is_known_user(user_id: int, source: str = "local", connection_string: str = None) -> bool:
+    """
+    Vrai si l'utilisateur a au moins un clic dans les artefacts de la source
+    ou parmi les clics ingérés.
+    Lu dans l'annuaire utilisateurs (O(log n), sans la table des clics) s'il est publié.
+    """
+    live = _ARTIFACTS.get(source, {}).get("live_updates")
+    if live is not None and live.has_user(user_id):
+        return True
+
+    user_directory = _get_components(source, ("users",), connection_string)["user_directory"]
+    if user_directory is not None:
+        return user_directory.contains(user_id)
+    artifacts = _get_components(source, ("clicks",), connection_string)
+    return artifacts["click_index"].position(user_id) >= 0
+
+
+def get_recommendations_from_user(user_id: int,
+                                  mode: str = "hybrid",
+                                  alpha: float = 0.7,
+                                  user_clicks_threshold: int = 3,
+                                  top_n: int = 5,
+                                  source: str = "local",
+                                  connection_string: str = None) -> List[dict]:
+    """
+    Fonction principale de recommandation avec gestion dual local/azure.
+    Les artefacts sont chargés une seule fois par processus, et seulement ceux
+    du mode demandé (cf. get_artifacts). Les utilisateurs et paramètres couverts par la table précalculée sont servis
+    directement ; les autres sont calculés en ligne. Les réponses sont mises en
+    cache (RESULT_CACHE) pour la version courante des artefacts.
+    
+    Args:
+        user_id: ID utilisateur
+        mode: "cbf", "cf", "hybrid", "auto"
+        alpha: Pondération hybride (0-1)
+        user_clicks_threshold: Seuil minimum de clics
+        top_n: Nombre de recommandations
+        source: "local" (artefacts complets) ou "azure" (artefacts allégés)
+        connection_string: Chaîne connexion Azure
+    
+    Returns:
+        Liste de recommandations
+    """
+    
+    logging.info(f"[WRAPPERS] Démarrage recommandations pour user_id={user_id}, source={source}")
+    
+    try:
+        if mode not in MODE_ARTIFACTS:
+            raise ValueError(f"Mode de recommandation invalide : {mode}")
+
+        artifacts = _get_components(source, ("precomputed", "users"), connection_string)
+
+        # Clics ingérés depuis le chargement : la table précalculée et l'annuaire
+        # ne reflètent plus cet utilisateur
+        live = artifacts.get("live_updates")
+        updated = live is not None and live.has_user(user_id)
+
+        cache_key = (source, artifacts.get("version"), int(user_id), mode, float(alpha),
+                     int(user_clicks_threshold), int(top_n), live.revision(user_id) if updated else 0)
+        cached = RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            logging.info(f"[WRAPPERS] {len(cached)} recommandations (cache)")
+            return list(cached)
+
+        # Lecture directe dans la table précalculée (utilisateur et paramètres de la grille)
+        precomputed = artifacts.get("precomputed")
+        if precomputed is not None and not updated:
+            recommendations = precomputed.lookup(user_id, mode, alpha, user_clicks_threshold, top_n)
+            if recommendations is not None:
+                logging.info(f"[WRAPPERS] {len(recommendations)} recommandations (table précalculée)")
+                RESULT_CACHE.put(cache_key, tuple(recommendations))
+                return recommendations
+
+        # Mode "auto" tranché par l'annuaire : seul le mode effectif est chargé et calculé
+        user_directory = artifacts.get("user_directory")
+        if mode == "auto" and (updated or user_directory is not None):
+            nb_clicks = (live.click_index if updated else user_directory).get_click_count(user_id)
+            if nb_clicks == 0:
+                RESULT_CACHE.put(cache_key, ())
+                return []
+            mode = "cbf" if nb_clicks < user_clicks_threshold else "hybrid"
+
+        # Génération des recommandations : chargement des seuls composants du mode
+        artifacts = get_artifacts(source=source, connection_string=connection_string, mode=mode)
+        click_index, user_profiles = artifacts["click_index"], artifacts.get("user_profiles")
+        if updated:
+            click_index, user_profiles = live.click_index, live.user_profiles
+
+        recommendations = get_recommendations(
+            user_id=user_id,
+            df=artifacts["df"],
+            model_cf=artifacts.get("model_cf"),
+            embeddings=artifacts.get("embeddings"),
+            article_id_to_index=artifacts.get("article_index"),
+            mode=mode,
+            alpha=alpha,
+            user_clicks_threshold=user_clicks_threshold,
+            top_n=top_n,
+            click_index=click_index,
+            user_profiles=user_profiles
+        )
+
+        logging.info(f"[WRAPPERS] {len(recommendations)} recommandations générées")
+        RESULT_CACHE.put(cache_key, tuple(recommendations))
+        return recommendations
+
+    except Exception as e:
+        logging.error(f"[WRAPPERS] Erreur : {str(e)}")
+        raise RuntimeError(f"Erreur dans get_recommendations_from_user: {str(e)}")
\ No newline at end of file
@@ -24,7 +24,7 @@ def update_recommendations(change,
         user_id (int) : utilisateur ciblé
         df (pd.DataFrame) : DataFrame des interactions
         embeddings (np.ndarray) : matrice des embeddings compressés
-        article_id_to_index (dict) : mapping article_id → index
+        article_id_to_index (ArticleIndex ou dict) : mapping article_id → index
         model_cf : modèle CF entraîné
         df_articles (pd.DataFrame) : DataFrame contenant les métadonnées articles
         output_widget : zone de sortie ipywidgets.Output()
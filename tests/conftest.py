@@ -6,3 +6,115 @@ import os
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+# ================================
+# Jeux de données synthétiques (tests unitaires sans artefacts outputs/)
+# ================================
+@pytest.fixture(scope="session")
+def clicks_df() -> pd.DataFrame:
+    """Clics synthétiques : 40 utilisateurs, 120 articles, doublons inclus"""
+    rng = np.random.default_rng(10)
+    user_ids = rng.integers(1, 41, size=600)
+    article_ids = rng.integers(0, 120, size=600)
+    return pd.DataFrame({"user_id": user_ids, "article_id": article_ids})
+
+
+@pytest.fixture(scope="session")
+def article_embeddings():
+    """Embeddings L2-normalisés (150 articles, 16 dims) et mapping article_id → index"""
+    rng = np.random.default_rng(20)
+    embeddings = rng.normal(size=(150, 16)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    article_id_to_index = {article_id: idx for idx, article_id in enumerate(range(150))}
+    return embeddings, article_id_to_index
+
+
+@pytest.fixture(scope="session")
+def svd_model(clicks_df):
+    """Modèle SVD entraîné comme dans model_training.train_cf_model"""
+    from surprise import Dataset, Reader, SVD
+
+    df_ratings = clicks_df[["user_id", "article_id"]].copy()
+    df_ratings["click"] = 1.0
+    data = Dataset.load_from_df(df_ratings, Reader(rating_scale=(0, 1)))
+    model = SVD(n_factors=8, random_state=0)
+    model.fit(data.build_full_trainset())
+    return model
+
+
+# ================================
+# Émulateur Blob minimal (HEAD / GET) pour les tests des loaders Azure
+# ================================
+class FakeBlobStore:
+    """Blobs servis en HTTP local : nom → contenu, ETag, journal des requêtes"""
+
+    def __init__(self, port: int):
+        self.blobs = {}
+        self.requests = []  # (méthode, nom du blob, port client)
+        # Chaîne de connexion de l'émulateur Azurite (compte et clé publics de développement)
+        self.conn_str = ("DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;"
+                         "AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw==;"
+                         f"BlobEndpoint=http://127.0.0.1:{port}/devstoreaccount1;")
+
+    def put(self, name: str, payload: bytes):
+        version = sum(1 for method, blob, _ in self.requests if method == "PUT" and blob == name)
+        self.blobs[name] = (payload, f'"0x{version + 1}{len(payload)}"')
+        self.requests.append(("PUT", name, None))
+
+    def count(self, method: str, name: str = None) -> int:
+        return sum(1 for m, blob, _ in self.requests if m == method and name in (None, blob))
+
+
+@pytest.fixture
+def fake_blob_store():
+    import threading
+    import http.server
+    from email.utils import formatdate
+
+    store = None
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def _reply(self, with_body: bool):
+            name = self.path.split("?")[0].rsplit("/", 1)[-1]
+            store.requests.append((self.command, name, self.client_address[1]))
+            if name not in store.blobs:
+                self.send_response(404)
+                self.send_header("x-ms-error-code", "BlobNotFound")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            payload, etag = store.blobs[name]
+            self.send_response(206 if with_body else 200)
+            if with_body:
+                self.send_header("Content-Range", f"bytes 0-{len(payload) - 1}/{len(payload)}")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("x-ms-blob-type", "BlockBlob")
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", formatdate(usegmt=True))
+            self.end_headers()
+            if with_body:
+                self.wfile.write(payload)
+
+        def do_HEAD(self):
+            self._reply(with_body=False)
+
+        def do_GET(self):
+            self._reply(with_body=True)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    store = FakeBlobStore(server.server_port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield store
+    server.shutdown()
+    server.server_close()
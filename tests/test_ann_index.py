@@ -0,0 +1,72 @@
+# tests/test_ann_index.py
+
+import numpy as np
+
+from p10_reco.ann_index import build_ivf_index, recall_at_k_report, search_ivf
+from p10_reco.recommendation_engine import get_cbf_recommendations
+
+
+def _normalized(n, d, seed):
+    matrix = np.random.default_rng(seed).normal(size=(n, d)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+def test_index_partitions_catalog():
+    embeddings = _normalized(2000, 16, 0)
+    index = build_ivf_index(embeddings, n_lists=20, seed=0)
+
+    assert index.offsets[-1] == len(embeddings)
+    np.testing.assert_array_equal(np.sort(index.rows), np.arange(len(embeddings)))
+
+
+def test_full_probe_is_exact_search():
+    """n_probe = n_lists : même résultat que la recherche exhaustive"""
+    embeddings = _normalized(2000, 16, 1)
+    index = build_ivf_index(embeddings, n_lists=20, seed=0)
+    query = embeddings[5]
+
+    rows, _ = search_ivf(index, embeddings, query, 10, n_probe=index.n_lists, exclude_rows=np.array([5]))
+    exact = np.argsort(-(embeddings @ query), kind="stable")
+    np.testing.assert_array_equal(rows, exact[exact != 5][:10])
+
+
+def test_recall_report_increases_with_n_probe():
+    embeddings = _normalized(3000, 16, 2)
+    index = build_ivf_index(embeddings, n_lists=30, seed=0)
+    queries = embeddings[:50]
+
+    report = recall_at_k_report(index, embeddings, queries, k=10, n_probe_grid=(1, 4, 30))
+    recalls = report[report["method"] == "ivf"]["recall@10"].tolist()
+
+    assert recalls == sorted(recalls)
+    assert recalls[-1] == 1.0
+
+
+def test_cbf_with_full_probe_matches_exact(clicks_df, article_embeddings):
+    embeddings, article_id_to_index = article_embeddings
+    index = build_ivf_index(embeddings, n_lists=6, seed=0)
+
+    for user_id in [4, 18, 33]:
+        exact = get_cbf_recommendations(user_id, clicks_df, embeddings, article_id_to_index, top_n=5)
+        approx = get_cbf_recommendations(user_id, clicks_df, embeddings, article_id_to_index, top_n=5,
+                                         ann_index=index, n_probe=index.n_lists)
+        assert approx == exact
+
+
+def test_search_probes_more_lists_when_short():
+    """Moins de k articles non vus dans les groupes visités : groupes suivants visités"""
+    embeddings = _normalized(500, 16, 3)
+    index = build_ivf_index(embeddings, n_lists=50, seed=0)
+    query = embeddings[7]
+
+    # Les articles du groupe le plus proche sont tous exclus (utilisateur très actif)
+    first = np.argmax(index.centroids @ query)
+    seen = index.rows[index.offsets[first]:index.offsets[first + 1]]
+    rows, scores = search_ivf(index, embeddings, query, 10, n_probe=1, exclude_rows=seen)
+
+    assert len(rows) == 10
+    assert not np.isin(rows, seen).any()
+    assert np.all(np.diff(scores) <= 0)
+
+    rows, _ = search_ivf(index, embeddings, query, 600, n_probe=1)
+    assert len(rows) == len(embeddings)  # repli sur la recherche exacte
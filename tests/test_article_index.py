@@ -0,0 +1,60 @@
+# tests/test_article_index.py
+
+import numpy as np
+import pytest
+
+from p10_reco.article_index import ArticleIndex
+
+
+def test_lookups_match_dict():
+    """Adressage direct id → ligne et ligne → id, identiques au dict d'origine"""
+    rng = np.random.default_rng(0)
+    article_ids = rng.choice(5_000, size=300, replace=False)
+    mapping = {int(aid): row for row, aid in enumerate(article_ids)}
+    index = ArticleIndex.from_article_ids(article_ids)
+
+    queries = np.concatenate([article_ids, [-3, 4_999, 5_000, 10**9]])
+    expected = [mapping.get(int(aid), -1) for aid in queries]
+    np.testing.assert_array_equal(index.rows(queries), expected)
+    np.testing.assert_array_equal(index.ids(np.arange(-1, 302)), [-1] + list(article_ids) + [-1, -1])
+
+    assert len(index) == len(mapping)
+    assert index[int(article_ids[7])] == 7
+    assert int(article_ids[7]) in index and -3 not in index
+    assert index.get(10**9, -1) == -1
+    with pytest.raises(KeyError):
+        index[10**9]
+
+
+def test_from_dict_partial_mapping():
+    """Un mapping partiel laisse les lignes sans article à -1"""
+    index = ArticleIndex.from_dict({10: 2, 4: 0})
+    np.testing.assert_array_equal(index.row_to_id, [4, -1, 10])
+    np.testing.assert_array_equal(index.rows([10, 4, 5]), [2, 0, -1])
+
+    with pytest.raises(ValueError):
+        ArticleIndex.from_article_ids([3, -1])
+
+
+@pytest.mark.parametrize("mode", ["cbf", "hybrid", "auto"])
+def test_engine_same_results_with_index_and_dict(mode, clicks_df, article_embeddings, svd_model):
+    """Mêmes recommandations avec l'ArticleIndex qu'avec le dict (unitaire et batch)"""
+    from p10_reco.click_index import build_user_click_index
+    from p10_reco.recommendation_engine import get_recommendations, get_recommendations_batch
+
+    embeddings, article_id_to_index = article_embeddings
+    partial = {aid: row for aid, row in article_id_to_index.items() if aid % 5}
+    click_index = build_user_click_index(clicks_df)
+    user_ids = list(range(1, 41))
+
+    for mapping in (article_id_to_index, partial):
+        index = ArticleIndex.from_dict(mapping)
+        batch = get_recommendations_batch(user_ids, clicks_df, svd_model, embeddings, index, mode=mode,
+                                          alpha=0.4, user_clicks_threshold=15, top_n=6, click_index=click_index)
+        for user_id in user_ids:
+            expected = get_recommendations(user_id, clicks_df, svd_model, embeddings, mapping, mode=mode,
+                                           alpha=0.4, user_clicks_threshold=15, top_n=6, click_index=click_index)
+            assert get_recommendations(user_id, clicks_df, svd_model, embeddings, index, mode=mode,
+                                       alpha=0.4, user_clicks_threshold=15, top_n=6,
+                                       click_index=click_index) == expected
+            assert batch[user_id] == expected
@@ -0,0 +1,91 @@
+# tests/test_cf_scoring.py
+import os
+
+import numpy as np
+import pytest
+
+from p10_reco.cf_scoring import CFFactors
+
+
+@pytest.mark.parametrize("user_id", [1, 17, 40, 10_000])
+def test_score_matches_predict(svd_model, user_id):
+    """Scores vectorisés identiques à model.predict (utilisateurs/articles inconnus inclus)"""
+    factors = CFFactors.from_svd(svd_model)
+    article_ids = np.arange(-5, 160)
+
+    expected = [svd_model.predict(user_id, aid).est for aid in article_ids]
+    np.testing.assert_allclose(factors.score(user_id, article_ids), expected, rtol=0, atol=1e-12)
+
+
+def test_score_matches_predict_unbiased(clicks_df):
+    from surprise import Dataset, Reader, SVD
+
+    df_ratings = clicks_df[["user_id", "article_id"]].copy()
+    df_ratings["click"] = 1.0
+    data = Dataset.load_from_df(df_ratings, Reader(rating_scale=(0, 1)))
+    model = SVD(n_factors=4, biased=False, random_state=0)
+    model.fit(data.build_full_trainset())
+
+    factors = CFFactors.from_svd(model)
+    article_ids = np.arange(0, 130)
+    for user_id in [2, 10_000]:
+        expected = [model.predict(user_id, aid).est for aid in article_ids]
+        np.testing.assert_allclose(factors.score(user_id, article_ids), expected, rtol=0, atol=1e-12)
+
+
+def test_factor_artifact_roundtrip(svd_model, tmp_path):
+    """L'artefact .npy exporté se recharge en memmap et score comme le modèle"""
+    from model_training import export_cf_factors
+    from p10_reco.loaders import open_cf_factors
+    from p10_reco.cf_scoring import CF_FACTOR_ARRAYS, CF_FACTOR_META
+
+    output_dir = export_cf_factors(svd_model, str(tmp_path / "model_cf_factors"))
+    paths = {name: os.path.join(output_dir, f"{name}.npy") for name in CF_FACTOR_ARRAYS}
+    factors = open_cf_factors(paths, os.path.join(output_dir, CF_FACTOR_META))
+
+    assert isinstance(factors.pu, np.memmap)
+    article_ids = np.arange(-5, 160)
+    for user_id in [1, 17, 10_000]:
+        expected = [svd_model.predict(user_id, aid).est for aid in article_ids]
+        np.testing.assert_allclose(factors.score(user_id, article_ids), expected, rtol=0, atol=1e-12)
+
+
+def test_factor_artifact_from_blob(svd_model, fake_blob_store, tmp_path, monkeypatch):
+    """Chargement Azure : blobs <dossier>/<tableau>.npy, sans pickle"""
+    from p10_reco import loaders
+    from model_training import export_cf_factors
+
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_DIR", str(tmp_path / "cache"))
+    output_dir = export_cf_factors(svd_model, str(tmp_path / "model_cf_light_factors"))
+    for filename in os.listdir(output_dir):
+        with open(os.path.join(output_dir, filename), "rb") as f:
+            fake_blob_store.put(filename, f.read())
+
+    factors = loaders.load_cf_factors(source="azure", dirname="model_cf_light_factors",
+                                      connection_string=fake_blob_store.conn_str)
+    reference = CFFactors.from_svd(svd_model)
+    np.testing.assert_array_equal(factors.user_ids, reference.user_ids)
+    np.testing.assert_array_equal(factors.qi, reference.qi)
+    assert factors.global_mean == reference.global_mean
+    assert factors.rating_scale == reference.rating_scale
+
+
+@pytest.mark.parametrize("biased", [True, False])
+def test_score_matrix_with_prepared_items(clicks_df, biased):
+    """Catalogue préparé une fois : scores identiques à score(), bloc par bloc"""
+    from surprise import Dataset, Reader, SVD
+
+    df_ratings = clicks_df[["user_id", "article_id"]].copy()
+    df_ratings["click"] = 1.0
+    data = Dataset.load_from_df(df_ratings, Reader(rating_scale=(0, 1)))
+    model = SVD(n_factors=4, biased=biased, random_state=0)
+    model.fit(data.build_full_trainset())
+
+    factors = CFFactors.from_svd(model)
+    article_ids = np.arange(-5, 160)
+    items = factors.prepare_items(article_ids)
+    for block in ([1, 2, 10_000], [17, 40]):
+        scores = factors.score_matrix(block, items=items)
+        np.testing.assert_array_equal(scores, factors.score_matrix(block, article_ids))
+        for row, user_id in zip(scores, block):
+            np.testing.assert_allclose(row, factors.score(user_id, article_ids), rtol=0, atol=1e-12)
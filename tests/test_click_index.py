@@ -0,0 +1,38 @@
+# tests/test_click_index.py
+
+import numpy as np
+
+from p10_reco.click_index import build_user_click_index
+from p10_reco.recommendation_engine import get_recommendations
+
+
+def test_index_matches_dataframe_scan(clicks_df):
+    """L'index renvoie le même historique qu'un balayage de df"""
+    index = build_user_click_index(clicks_df)
+
+    assert index.n_users == clicks_df["user_id"].nunique()
+    for user_id in clicks_df["user_id"].unique():
+        user_rows = clicks_df[clicks_df["user_id"] == user_id]
+        expected = np.sort(user_rows["article_id"].unique())
+        np.testing.assert_array_equal(index.get_articles(user_id), expected)
+        assert index.get_click_count(user_id) == len(user_rows)
+
+
+def test_index_unknown_user(clicks_df):
+    index = build_user_click_index(clicks_df)
+    assert index.position(10_000) == -1
+    assert len(index.get_articles(10_000)) == 0
+    assert index.get_click_count(10_000) == 0
+
+
+def test_engine_same_results_with_index(clicks_df, article_embeddings, svd_model):
+    """Les recommandations sont identiques avec ou sans index"""
+    embeddings, article_id_to_index = article_embeddings
+    index = build_user_click_index(clicks_df)
+
+    for mode in ["cbf", "cf", "hybrid", "auto"]:
+        for user_id in [1, 7, 23]:
+            kwargs = dict(user_id=user_id, df=clicks_df, model_cf=svd_model,
+                          embeddings=embeddings, article_id_to_index=article_id_to_index,
+                          mode=mode, top_n=5)
+            assert get_recommendations(**kwargs, click_index=index) == get_recommendations(**kwargs)
@@ -0,0 +1,54 @@
+# tests/test_import_budget.py
+import os
+import subprocess
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+src_path = os.path.join(project_root, "src")
+
+# Budget d'import du chemin de service (démarrage à froid de la Function), en secondes
+IMPORT_BUDGET_S = float(os.getenv("IMPORT_BUDGET_S", "1.5"))
+
+# Modules réservés à l'entraînement ou à Azure, à ne pas charger à l'import
+HEAVY_MODULES = ["sklearn", "surprise", "joblib", "azure.storage.blob", "matplotlib"]
+
+
+def _import_in_fresh_process(module: str) -> dict:
+    """Importe un module dans un interpréteur neuf : durée et modules lourds chargés"""
+    code = (
+        "import sys, time\n"
+        f"sys.path.insert(0, {src_path!r})\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(elapsed, ','.join(heavy))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=project_root, check=True)
+    elapsed, _, heavy = result.stdout.strip().splitlines()[-1].partition(" ")
+    return {"elapsed": float(elapsed), "heavy": [m for m in heavy.split(",") if m]}
+
+
+def test_serving_path_skips_training_dependencies():
+    """Ni sklearn ni Surprise ni SDK Azure à l'import du service (chargés à la demande)"""
+    for module in ["p10_reco.recommendation_engine", "p10_reco.wrappers"]:
+        assert _import_in_fresh_process(module)["heavy"] == [], module
+
+
+def test_serving_import_time_budget():
+    result = _import_in_fresh_process("p10_reco")
+    assert result["elapsed"] < IMPORT_BUDGET_S, f"import p10_reco : {result['elapsed']:.2f} s"
+
+
+def test_loaders_import_skips_dotenv():
+    """Import de loaders sans dotenv ni recherche de .env (fichier chargé par wrappers.load_correct_env)"""
+    code = (
+        "import sys\n"
+        f"sys.path.insert(0, {src_path!r})\n"
+        "import p10_reco.loaders\n"
+        "print('dotenv' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=project_root, check=True)
+    assert result.stdout.strip().splitlines()[-1] == "False"
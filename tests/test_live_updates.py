@@ -0,0 +1,126 @@
+# tests/test_live_updates.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from p10_reco.article_index import ArticleIndex
+from p10_reco.click_index import build_user_click_index
+from p10_reco.live_updates import LiveUpdates
+from p10_reco.recommendation_engine import get_recommendations
+from p10_reco.user_profiles import build_user_profiles
+
+NEW_CLICKS = [(3, 130, 1_000), (3, 131, 2_000), (3, 131, 3_000), (45, 12, 4_000), (45, 140, 5_000)]
+
+
+@pytest.fixture
+def live(clicks_df, article_embeddings):
+    embeddings, article_id_to_index = article_embeddings
+    click_index = build_user_click_index(clicks_df)
+    profiles = build_user_profiles(click_index, embeddings, article_id_to_index)
+    return LiveUpdates(click_index, embeddings, ArticleIndex.from_dict(article_id_to_index), user_profiles=profiles)
+
+
+def test_overlay_matches_rebuilt_artifacts(live, clicks_df, article_embeddings):
+    """Après ingestion : historiques, nombres de clics et profils d'un df reconstruit"""
+    embeddings, article_id_to_index = article_embeddings
+    assert live.ingest_many(NEW_CLICKS) == len(NEW_CLICKS)
+
+    rebuilt_df = pd.concat([clicks_df, pd.DataFrame([c[:2] for c in NEW_CLICKS], columns=["user_id", "article_id"])])
+    rebuilt = build_user_click_index(rebuilt_df)
+    rebuilt_profiles = build_user_profiles(rebuilt, embeddings, article_id_to_index)
+
+    for user_id in [3, 45, 4]:
+        np.testing.assert_array_equal(live.click_index.get_articles(user_id), rebuilt.get_articles(user_id))
+        assert live.click_index.get_click_count(user_id) == rebuilt.get_click_count(user_id)
+        np.testing.assert_allclose(live.user_profiles.get(user_id), rebuilt_profiles.get(user_id), atol=1e-6)
+
+    assert live.revision(3) == 3 and live.revision(4) == 0
+
+
+@pytest.mark.parametrize("mode", ["cbf", "hybrid", "auto"])
+def test_recommendations_reflect_clicks(mode, live, clicks_df, article_embeddings, svd_model):
+    embeddings, article_id_to_index = article_embeddings
+    live.ingest_many(NEW_CLICKS)
+    rebuilt_df = pd.concat([clicks_df, pd.DataFrame([c[:2] for c in NEW_CLICKS], columns=["user_id", "article_id"])])
+    rebuilt = build_user_click_index(rebuilt_df)
+
+    for user_id in [3, 45]:
+        served = get_recommendations(user_id, clicks_df, svd_model, embeddings, article_id_to_index, mode=mode,
+                                     alpha=0.5, user_clicks_threshold=15, top_n=5,
+                                     click_index=live.click_index, user_profiles=live.user_profiles)
+        expected = get_recommendations(user_id, rebuilt_df, svd_model, embeddings, article_id_to_index, mode=mode,
+                                       alpha=0.5, user_clicks_threshold=15, top_n=5, click_index=rebuilt)
+        assert served == expected
+        assert not set(served) & {130, 131, 12, 140}
+
+
+def test_time_decay(clicks_df, article_embeddings):
+    """Profil = moyenne pondérée, les poids étant divisés par 2 à chaque demi-vie"""
+    embeddings, article_id_to_index = article_embeddings
+    live = LiveUpdates(build_user_click_index(clicks_df), embeddings, article_id_to_index, half_life=1_000)
+
+    live.ingest(10_000, 5, click_timestamp=0)
+    live.ingest(10_000, 6, click_timestamp=1_000)
+    live.ingest(10_000, 7, click_timestamp=3_000)
+
+    weights = np.array([0.125, 0.25, 1.0])
+    expected = (weights[:, None] * embeddings[[5, 6, 7]]).sum(axis=0) / weights.sum()
+    np.testing.assert_allclose(live.user_profiles.get(10_000), expected, atol=1e-6)
+
+
+def test_n_events_during_concurrent_ingest(live):
+    """n_events se lit pendant que d'autres threads ajoutent des utilisateurs"""
+    import threading
+
+    users = range(20_000, 20_400)
+    writer = threading.Thread(target=lambda: live.ingest_many([(u, 12, None) for u in users]))
+    writer.start()
+    counts = []
+    while writer.is_alive():
+        counts.append(live.n_events)
+    writer.join()
+
+    assert counts == sorted(counts)
+    assert live.n_events == len(users)
+
+
+@pytest.mark.parametrize("events", [[(3, 130, 1_000), {"user_id": 45}], [(3, 130), (45, "x")], [(3, 130), None],
+                                    {"user_id": 3, "article_id": 130}])
+def test_invalid_batch_ingests_nothing(live, events):
+    """Un clic invalide dans le lot : erreur levée avant le premier clic appliqué"""
+    with pytest.raises((TypeError, ValueError)):
+        live.ingest_many(events)
+    assert live.n_events == 0
+    assert not live.has_user(3)
+
+
+def test_wrapper_ingest_then_recommend(clicks_df, article_embeddings, svd_model, monkeypatch):
+    """L'appel suivant à get_recommendations_from_user reflète le clic, sans reload()"""
+    from p10_reco import wrappers
+    from p10_reco.result_cache import ResultCache
+
+    embeddings, article_id_to_index = article_embeddings
+    click_index = build_user_click_index(clicks_df)
+    components = {"clicks": {"df": clicks_df, "click_index": click_index},
+                  "embeddings": {"embeddings": embeddings, "article_index": ArticleIndex.from_dict(article_id_to_index)},
+                  "model": {"model_cf": svd_model}, "precomputed": {"precomputed": None},
+                  "users": {"user_directory": None}, "profiles": {"user_profiles": None}}
+
+    def fake_load_artifacts(source, connection_string=None, names=wrappers.ARTIFACT_COMPONENTS):
+        return {key: value for name in names for key, value in components[name].items()}
+
+    monkeypatch.setattr(wrappers, "_load_artifacts", fake_load_artifacts)
+    monkeypatch.setattr(wrappers, "_ARTIFACTS", {})
+    monkeypatch.setattr(wrappers, "RESULT_CACHE", ResultCache(max_size=100, ttl_s=60))
+
+    before = wrappers.get_recommendations_from_user(3, mode="cbf", top_n=5)
+    assert wrappers.ingest_clicks([{"user_id": 3, "article_id": before[0], "click_timestamp": 1}]) == 1
+
+    after = wrappers.get_recommendations_from_user(3, mode="cbf", top_n=5)
+    assert before[0] not in after
+
+    assert not wrappers.is_known_user(10_000)
+    wrappers.ingest_clicks([(10_000, 5, 2)])
+    assert wrappers.is_known_user(10_000)
+    assert wrappers.get_recommendations_from_user(10_000, mode="cbf", top_n=3) != []
@@ -11,8 +11,8 @@ if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
 # === IMPORTS APRES MISE A JOUR DE sys.path ===
-from loaders import load_df, load_embeddings, load_cf_model
-from wrappers import get_recommendations_from_user
+from p10_reco.loaders import load_df, load_embeddings, load_cf_model
+from p10_reco.wrappers import get_recommendations_from_user
 
 # === CHARGEMENT DU .env SI DISPONIBLE ===
 dotenv_path = os.path.join(project_root, ".env")
@@ -72,3 +72,304 @@ def test_get_recommendations_azure():
     assert isinstance(recommendations, list), "Résultat non listé (Azure)"
     assert len(recommendations) > 0, "Aucune reco depuis Azure"
     assert isinstance(recommendations[0], int), "Les IDs doivent être entiers (Azure)"
+
+
+def test_embeddings_npy_is_memory_mapped(tmp_path):
+    """L'artefact .npy s'ouvre en memmap, normalisé et sans copie"""
+    from p10_reco.embeddings import save_embeddings_npy
+    from p10_reco.loaders import open_embeddings_memmap
+
+    raw = np.random.default_rng(0).normal(size=(50, 8))
+    path = str(tmp_path / "articles_embeddings.npy")
+    save_embeddings_npy(raw, path)
+
+    embeddings = open_embeddings_memmap(path)
+    assert isinstance(embeddings, np.memmap)
+    assert embeddings.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, atol=1e-6)
+
+
+def test_float32_npy_from_other_producer_is_normalized(tmp_path, monkeypatch):
+    """Un .npy float32 non normalisé n'est pas servi tel quel : normalisé, normes calculées"""
+    from p10_reco import loaders
+
+    raw = np.random.default_rng(1).normal(size=(40, 8)).astype(np.float32) * 3.0
+    (tmp_path / "outputs").mkdir()
+    np.save(tmp_path / "outputs" / "articles_embeddings.npy", raw)
+    np.save(tmp_path / "outputs" / "articles_embeddings_article_ids.npy", np.arange(100, 140))
+    monkeypatch.setattr(loaders, "PROJECT_ROOT", str(tmp_path))
+
+    embeddings = loaders.open_embeddings_memmap(str(tmp_path / "outputs" / "articles_embeddings.npy"))
+    np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, atol=1e-6)
+
+    embeddings, article_ids, norms = loaders.load_embeddings_with_ids(source="local")
+    np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, atol=1e-6)
+    np.testing.assert_allclose(norms, np.linalg.norm(raw, axis=1), rtol=1e-6)
+    np.testing.assert_array_equal(article_ids, np.arange(100, 140))
+
+
+def test_embeddings_npy_saves_article_ids(tmp_path):
+    """Les article_id de chaque ligne sont enregistrés à côté de la matrice"""
+    from p10_reco.embeddings import save_embeddings_npy, article_ids_path
+
+    raw = np.random.default_rng(0).normal(size=(5, 4))
+    path = str(tmp_path / "articles_embeddings.npy")
+    save_embeddings_npy(raw, path, article_ids=[10, 11, 12, 20, 30])
+
+    assert article_ids_path(path).endswith("articles_embeddings_article_ids.npy")
+    np.testing.assert_array_equal(np.load(article_ids_path(path)), [10, 11, 12, 20, 30])
+
+    with pytest.raises(ValueError):
+        save_embeddings_npy(raw, path, article_ids=[1, 2])
+
+
+def test_load_bundle_runs_tasks_concurrently():
+    """Les artefacts sont chargés en parallèle, chacun sous son nom"""
+    import threading
+    from p10_reco.loaders import load_bundle
+
+    # Chaque tâche attend les deux autres : bloquerait si l'exécution était séquentielle
+    barrier = threading.Barrier(3, timeout=5)
+
+    def task(value):
+        def run():
+            barrier.wait()
+            return value
+        return run
+
+    loaded = load_bundle({"df": task(1), "embeddings": task(2), "model": task(3)})
+    assert loaded == {"df": 1, "embeddings": 2, "model": 3}
+
+
+def test_load_bundle_propagates_errors():
+    from p10_reco.loaders import load_bundle
+
+    def failing():
+        raise RuntimeError("blob introuvable")
+
+    with pytest.raises(RuntimeError, match="blob introuvable"):
+        load_bundle({"df": lambda: 1, "model": failing})
+
+
+def test_blob_client_is_shared_and_keeps_connections_alive(fake_blob_store):
+    """Un seul client Blob par processus, connexion HTTP réutilisée (émulateur local)"""
+    from p10_reco.loaders import get_blob_service_client
+
+    payload = b"0123456789" * 100
+    filenames = ["df.parquet", "model_cf.pkl", "articles_embeddings.npy"]
+    for filename in filenames:
+        fake_blob_store.put(filename, payload)
+
+    client = get_blob_service_client(fake_blob_store.conn_str)
+    assert get_blob_service_client(fake_blob_store.conn_str) is client
+
+    for filename in filenames:
+        blob = get_blob_service_client(fake_blob_store.conn_str).get_blob_client("artefacts-fresh", filename)
+        assert blob.download_blob().readall() == payload
+
+    # Trois téléchargements, une seule connexion TCP
+    client_ports = [port for method, _, port in fake_blob_store.requests if method == "GET"]
+    assert len(client_ports) == 3
+    assert len(set(client_ports)) == 1
+
+
+def test_blob_disk_cache_revalidates_with_etag(fake_blob_store, tmp_path, monkeypatch):
+    """Le blob n'est retéléchargé que si son ETag a changé"""
+    from p10_reco import loaders
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_DIR", str(tmp_path))
+    fake_blob_store.put("df.parquet", b"v1" * 50)
+
+    first = loaders.download_blob_to_file("artefacts-fresh", "df.parquet", fake_blob_store.conn_str)
+    second = loaders.download_blob_to_file("artefacts-fresh", "df.parquet", fake_blob_store.conn_str)
+    assert first == second
+    assert fake_blob_store.count("GET", "df.parquet") == 1
+    assert fake_blob_store.count("HEAD", "df.parquet") == 2
+
+    # Nouvelle publication : nouvelle version, l'ancienne reste sur disque
+    fake_blob_store.put("df.parquet", b"v2" * 60)
+    third = loaders.download_blob_to_file("artefacts-fresh", "df.parquet", fake_blob_store.conn_str)
+    assert third != first
+    assert open(third, "rb").read() == b"v2" * 60
+    assert os.path.exists(first)
+    assert fake_blob_store.count("GET", "df.parquet") == 2
+
+
+def test_blob_disk_cache_concurrent_downloads(fake_blob_store, tmp_path, monkeypatch):
+    """Threads qui téléchargent le même blob : un seul GET, tous reçoivent le fichier complet"""
+    from concurrent.futures import ThreadPoolExecutor
+    from p10_reco import loaders
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_DIR", str(tmp_path))
+    fake_blob_store.put("user_directory_light.npy", b"dir" * 1000)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        paths = list(executor.map(lambda _: loaders.download_blob_to_file(
+            "artefacts-fresh", "user_directory_light.npy", fake_blob_store.conn_str), range(8)))
+
+    assert len(set(paths)) == 1
+    assert open(paths[0], "rb").read() == b"dir" * 1000
+    assert fake_blob_store.count("GET", "user_directory_light.npy") == 1
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_blob_disk_cache_evicts_least_recently_used(fake_blob_store, tmp_path, monkeypatch):
+    """Au-delà de la taille maximale, les versions les moins récemment utilisées sont supprimées"""
+    from p10_reco import loaders
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_MAX_BYTES", 250)
+
+    fake_blob_store.put("df.parquet", b"a" * 100)
+    old_df = loaders.download_blob_to_file("artefacts-fresh", "df.parquet", fake_blob_store.conn_str)
+    os.utime(old_df, (1, 1))  # Version la plus ancienne
+    fake_blob_store.put("model_cf.pkl", b"b" * 100)
+    model = loaders.download_blob_to_file("artefacts-fresh", "model_cf.pkl", fake_blob_store.conn_str)
+
+    fake_blob_store.put("df.parquet", b"c" * 100)
+    new_df = loaders.download_blob_to_file("artefacts-fresh", "df.parquet", fake_blob_store.conn_str)
+
+    assert not os.path.exists(old_df)
+    assert not os.path.exists(f"{old_df}.meta.json")
+    assert os.path.exists(model) and os.path.exists(new_df)
+
+
+def test_blob_disk_cache_falls_back_offline(fake_blob_store, tmp_path, monkeypatch):
+    """HEAD impossible (réseau) : la dernière version en cache est utilisée"""
+    from azure.core.exceptions import ServiceRequestError
+    from azure.storage.blob import BlobClient
+    from p10_reco import loaders
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_DIR", str(tmp_path))
+    fake_blob_store.put("model_cf.pkl", b"model")
+    cached = loaders.download_blob_to_file("artefacts-fresh", "model_cf.pkl", fake_blob_store.conn_str)
+
+    def unreachable(self, **kwargs):
+        raise ServiceRequestError("connexion impossible")
+
+    monkeypatch.setattr(BlobClient, "get_blob_properties", unreachable)
+    assert loaders.download_blob_to_file("artefacts-fresh", "model_cf.pkl", fake_blob_store.conn_str) == cached
+
+
+def test_blob_disk_cache_does_not_serve_deleted_blob(fake_blob_store, tmp_path, monkeypatch):
+    """Blob supprimé (404) : l'erreur est propagée, la copie en cache n'est pas servie"""
+    from azure.core.exceptions import ResourceNotFoundError
+    from p10_reco import loaders
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_DIR", str(tmp_path))
+    fake_blob_store.put("recs.npy", b"table")
+    loaders.download_blob_to_file("artefacts-fresh", "recs.npy", fake_blob_store.conn_str)
+
+    del fake_blob_store.blobs["recs.npy"]  # Table retirée du conteneur
+    with pytest.raises(ResourceNotFoundError):
+        loaders.download_blob_to_file("artefacts-fresh", "recs.npy", fake_blob_store.conn_str)
+
+
+def test_read_parquet_projects_columns(tmp_path):
+    """Seules les colonnes demandées sont décodées"""
+    import pandas as pd
+    from p10_reco.loaders import read_parquet
+
+    path = str(tmp_path / "df.parquet")
+    pd.DataFrame({"user_id": [1, 2, 2], "article_id": [10, 11, 12],
+                  "session_id": [7, 8, 9], "click_country": ["1", "2", "3"]}).to_parquet(path)
+
+    df = read_parquet(path, columns=["user_id", "article_id"])
+    assert list(df.columns) == ["user_id", "article_id"]
+    assert df["article_id"].tolist() == [10, 11, 12]
+    assert list(read_parquet(path).columns) == ["user_id", "article_id", "session_id", "click_country"]
+
+
+def test_load_df_azure_reads_projected_columns(fake_blob_store, tmp_path, monkeypatch):
+    """Chargement Azure : fichier en cache disque, lu par memory map avec projection"""
+    import pandas as pd
+    from p10_reco import loaders
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_DIR", str(tmp_path))
+    source = tmp_path / "source.parquet"
+    pd.DataFrame({"user_id": [1, 2], "article_id": [3, 4], "session_size": [2, 5]}).to_parquet(source)
+    fake_blob_store.put("df_light.parquet", source.read_bytes())
+
+    df = loaders.load_df(source="azure", filename="df_light.parquet",
+                         connection_string=fake_blob_store.conn_str, columns=["user_id", "article_id"])
+    assert list(df.columns) == ["user_id", "article_id"]
+    assert df["user_id"].tolist() == [1, 2]
+
+
+def _npy_bytes(array) -> bytes:
+    import io
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
+
+
+def test_embeddings_ids_from_blob(fake_blob_store, tmp_path, monkeypatch):
+    """Azure : .npy sans fichier d'article_id (404) refusé, normes absentes tolérées ; .npz lu avec ses article_id"""
+    from p10_reco import loaders
+    from p10_reco.embeddings import normalize_embeddings
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_DIR", str(tmp_path))
+
+    raw = np.random.default_rng(2).normal(size=(6, 4)).astype(np.float32)
+    fake_blob_store.put("articles_embeddings_light.npy", _npy_bytes(normalize_embeddings(raw)))
+    with pytest.raises(FileNotFoundError):
+        loaders.load_embeddings_with_ids(source="azure", filename="articles_embeddings_light.npy",
+                                         connection_string=fake_blob_store.conn_str)
+
+    fake_blob_store.put("articles_embeddings_light_article_ids.npy", _npy_bytes(np.array([3, 9, 27, 40, 41, 42])))
+    _, article_ids, norms = loaders.load_embeddings_with_ids(source="azure", filename="articles_embeddings_light.npy",
+                                                             connection_string=fake_blob_store.conn_str)
+    np.testing.assert_array_equal(article_ids, [3, 9, 27, 40, 41, 42])
+    assert norms is None
+
+    npz_path = tmp_path / "articles.npz"
+    np.savez_compressed(npz_path, embeddings=raw, article_ids=[5, 8, 13, 21, 34, 55])
+    fake_blob_store.put("articles.npz", npz_path.read_bytes())
+    _, article_ids, norms = loaders.load_embeddings_with_ids(source="azure", filename="articles.npz",
+                                                             connection_string=fake_blob_store.conn_str)
+    np.testing.assert_array_equal(article_ids, [5, 8, 13, 21, 34, 55])
+    np.testing.assert_allclose(norms, np.linalg.norm(raw, axis=1), rtol=1e-6)
+
+
+def test_embeddings_ids_download_error_is_raised(fake_blob_store, tmp_path, monkeypatch):
+    """Azure : une erreur autre que 404 sur le fichier d'article_id n'est pas prise pour une absence"""
+    from azure.core.exceptions import ServiceRequestError
+    from p10_reco import loaders
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_DIR", str(tmp_path))
+
+    fake_blob_store.put("articles_embeddings_light.npy", _npy_bytes(np.eye(4, dtype=np.float32)))
+    download = loaders.download_blob_to_file
+
+    def flaky_download(container_name, filename, conn_str):
+        if filename.endswith("_article_ids.npy"):
+            raise ServiceRequestError("timeout")
+        return download(container_name, filename, conn_str)
+
+    monkeypatch.setattr(loaders, "download_blob_to_file", flaky_download)
+    with pytest.raises(ServiceRequestError):
+        loaders.load_embeddings_with_ids(source="azure", filename="articles_embeddings_light.npy",
+                                         connection_string=fake_blob_store.conn_str)
+
+
+def test_compact_dtypes_shrinks_click_table():
+    """Ids en int32, codes en petits entiers, textes répétitifs en category"""
+    import pandas as pd
+    from p10_reco.loaders import compact_dtypes
+
+    rng = np.random.default_rng(0)
+    n = 10000
+    df = pd.DataFrame({
+        "user_id": rng.integers(0, 300000, size=n),
+        "article_id": rng.integers(0, 364047, size=n),
+        "click_timestamp": rng.integers(1_506_800_000_000, 1_508_000_000_000, size=n),
+        "click_os": rng.integers(1, 20, size=n),
+        "click_country": rng.choice(["FR", "DE", "US"], size=n),
+        "words_count": rng.normal(200, 50, size=n),
+    })
+    memory_before = df.memory_usage(deep=True).sum()
+    original = df.copy()
+
+    df = compact_dtypes(df)
+    assert df["user_id"].dtype == np.int32
+    assert df["article_id"].dtype == np.int32
+    assert df["click_timestamp"].dtype == np.int64  # ne tient pas en int32
+    assert df["click_os"].dtype == np.int8
+    assert df["click_country"].dtype == "category"
+    assert df["words_count"].dtype == np.float32
+    assert df.memory_usage(deep=True).sum() * 2 < memory_before
+
+    np.testing.assert_array_equal(df["article_id"], original["article_id"])
+    assert (df["click_country"].astype(str) == original["click_country"]).all()
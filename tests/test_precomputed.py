@@ -0,0 +1,144 @@
+# tests/test_precomputed.py
+import os
+
+import numpy as np
+import pytest
+
+from p10_reco.click_index import build_user_click_index
+from p10_reco.precomputed import build_precomputed_table
+from p10_reco.recommendation_engine import get_recommendations
+
+USER_IDS = list(range(1, 41)) + [10_000]  # utilisateur sans clic inclus
+
+
+@pytest.fixture(scope="module")
+def serving(clicks_df, article_embeddings, svd_model):
+    embeddings, article_id_to_index = article_embeddings
+    index = build_user_click_index(clicks_df)
+    table = build_precomputed_table(USER_IDS, clicks_df, svd_model, embeddings, article_id_to_index,
+                                    click_index=index, alphas=[0.0, 0.3, 0.7, 1.0], top_n=8, block_size=9)
+    return table, index
+
+
+@pytest.mark.parametrize("mode,alpha,threshold", [("cbf", 0.5, 5), ("cf", 0.5, 5), ("hybrid", 0.3, 5),
+                                                  ("hybrid", 1.0, 5), ("auto", 0.7, 15), ("auto", 0.0, 1)])
+@pytest.mark.parametrize("top_n", [1, 5, 8])
+def test_table_matches_online(serving, mode, alpha, threshold, top_n, clicks_df, article_embeddings, svd_model):
+    """La table renvoie, préfixe top_n compris, les listes du calcul en ligne"""
+    table, index = serving
+    embeddings, article_id_to_index = article_embeddings
+
+    for user_id in USER_IDS:
+        expected = get_recommendations(user_id, clicks_df, svd_model, embeddings, article_id_to_index,
+                                       mode=mode, alpha=alpha, user_clicks_threshold=threshold,
+                                       top_n=top_n, click_index=index)
+        assert table.lookup(user_id, mode, alpha, threshold, top_n) == expected, user_id
+
+
+def test_lookup_outside_table_returns_none(serving):
+    """Paramètres hors grille, top_n > N ou utilisateur absent : repli en ligne"""
+    table, _ = serving
+    assert table.lookup(1, "hybrid", 0.55, 5, 5) is None
+    assert table.lookup(1, "auto", 0.55, 1, 5) is None
+    assert table.lookup(1, "cf", 0.5, 5, 9) is None
+    assert table.lookup(41, "cf", 0.5, 5, 5) is None
+    assert table.lookup(1, "popular", 0.5, 5, 5) is None
+
+
+def test_table_artifact_roundtrip(serving, tmp_path):
+    """L'artefact .npy se recharge en memmap et sert les mêmes réponses"""
+    from p10_reco.precomputed import save_precomputed_table, PRECOMPUTED_ARRAYS, PRECOMPUTED_META
+    from p10_reco.loaders import open_precomputed_table
+
+    table, _ = serving
+    output_dir = save_precomputed_table(table, str(tmp_path / "reco_table"))
+    paths = {name: os.path.join(output_dir, f"{name}.npy") for name in PRECOMPUTED_ARRAYS}
+    reopened = open_precomputed_table(paths, os.path.join(output_dir, PRECOMPUTED_META))
+
+    assert isinstance(reopened.recs, np.memmap)
+    assert reopened.alphas == table.alphas
+    assert reopened.sources == table.sources
+    for user_id in USER_IDS:
+        assert reopened.lookup(user_id, "hybrid", 0.7, 5, 5) == table.lookup(user_id, "hybrid", 0.7, 5, 5)
+
+
+def test_wrapper_serves_from_table(serving, monkeypatch):
+    """Le wrapper répond depuis la table et ne calcule en ligne que hors grille"""
+    from p10_reco import wrappers
+    from p10_reco.result_cache import ResultCache
+
+    table, _ = serving
+    online = []
+
+    def fake_get_recommendations(user_id, **kwargs):
+        online.append((user_id, kwargs["alpha"]))
+        return [-1]
+
+    monkeypatch.setattr(wrappers, "get_recommendations", fake_get_recommendations)
+    monkeypatch.setattr(wrappers, "RESULT_CACHE", ResultCache(max_size=0))
+    monkeypatch.setattr(wrappers, "_ARTIFACTS", {"local": {"precomputed": table, "df": None, "model_cf": None,
+                                                           "click_index": None, "version": 1,
+                                                           "components": frozenset(wrappers.ARTIFACT_COMPONENTS)}})
+
+    served = wrappers.get_recommendations_from_user(3, mode="hybrid", alpha=0.7, top_n=5)
+    assert served == table.lookup(3, "hybrid", 0.7, 5, 5)
+    assert online == []
+
+    assert wrappers.get_recommendations_from_user(3, mode="hybrid", alpha=0.55, top_n=5) == [-1]
+    assert online == [(3, 0.55)]
+
+
+def test_wrapper_skips_table_of_other_artifacts(serving, monkeypatch):
+    """La table n'est servie que si meta.json enregistre les versions des artefacts publiés"""
+    import dataclasses
+    from p10_reco import wrappers
+
+    table, _ = serving
+    published = {"df.parquet": "sha256:a", "model_cf_factors/pu.npy": "sha256:b"}
+    monkeypatch.setattr(wrappers, "source_versions", lambda source, connection_string=None: published)
+
+    for sources, served in [(dict(published), True), ({**published, "df.parquet": "sha256:c"}, False), (None, False)]:
+        stored = dataclasses.replace(table, sources=sources)
+        monkeypatch.setattr(wrappers, "load_precomputed_table", lambda **kwargs: stored)
+        loaded = wrappers._load_precomputed("local", wrappers.ARTIFACT_FILES["local"])["precomputed"]
+        assert (loaded is stored) == served
+
+
+def test_source_versions_follow_local_stat(tmp_path, monkeypatch):
+    """Version locale : taille et date de modification (sans lecture du fichier) ; empreinte du contenu sur demande"""
+    import builtins
+    from p10_reco import loaders
+
+    monkeypatch.setattr(loaders, "PROJECT_ROOT", str(tmp_path))
+    (tmp_path / "outputs").mkdir()
+    path = tmp_path / "outputs" / "df.parquet"
+    path.write_bytes(b"v1")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    digest = loaders.artifact_version("local", "outputs", "df.parquet", content=True)
+
+    with monkeypatch.context() as m:
+        m.setattr(builtins, "open", lambda *args, **kwargs: pytest.fail("fichier lu au démarrage"))
+        first = loaders.artifact_version("local", "outputs", "df.parquet")
+        assert loaders.artifact_version("local", "outputs", "df.parquet") == first
+
+    path.write_bytes(b"v2")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert loaders.artifact_version("local", "outputs", "df.parquet") != first
+    assert loaders.artifact_version("local", "outputs", "df.parquet", content=True) != digest
+    with pytest.raises(FileNotFoundError):
+        loaders.artifact_version("local", "outputs", "absent.parquet")
+
+
+def test_source_versions_from_blob_etag(fake_blob_store):
+    """Version Azure : ETag du blob (HEAD, sans téléchargement), modifié par une republication"""
+    from p10_reco import loaders
+
+    fake_blob_store.put("df_light.parquet", b"v1")
+    first = loaders.artifact_version("azure", "outputs", "df_light.parquet",
+                                     connection_string=fake_blob_store.conn_str)
+    fake_blob_store.put("df_light.parquet", b"v2")
+    assert loaders.artifact_version("azure", "outputs", "df_light.parquet",
+                                    connection_string=fake_blob_store.conn_str) != first
+    assert fake_blob_store.count("GET") == 0
+    with pytest.raises(RuntimeError):
+        loaders.artifact_version("azure", "outputs", "absent.parquet", connection_string=fake_blob_store.conn_str)
@@ -0,0 +1,20 @@
+# tests/test_ranking.py
+
+import numpy as np
+import pytest
+
+from p10_reco.ranking import top_k_indices
+
+
+@pytest.mark.parametrize("k", [0, 1, 5, 50, 200])
+def test_top_k_matches_stable_sort(k):
+    """Même résultat qu'un tri stable décroissant complet, ex aequo compris"""
+    rng = np.random.default_rng(0)
+    scores = rng.integers(0, 20, size=100).astype(float)  # nombreux ex aequo
+
+    expected = np.argsort(-scores, kind="stable")[:k]
+    np.testing.assert_array_equal(top_k_indices(scores, k), expected)
+
+
+def test_top_k_constant_scores():
+    np.testing.assert_array_equal(top_k_indices(np.ones(10), 3), [0, 1, 2])
@@ -0,0 +1,104 @@
+# tests/test_recommendation_engine.py
+
+import numpy as np
+import pytest
+
+from p10_reco.embeddings import normalize_embeddings
+from p10_reco.recommendation_engine import cosine_scores
+
+
+def test_dot_product_on_normalized_matrix_is_cosine():
+    """Produit scalaire sur matrice pré-normalisée = similarité cosinus"""
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    rng = np.random.default_rng(0)
+    raw = rng.normal(size=(200, 24))
+    raw[3] = 0.0  # vecteur nul toléré
+    profile = rng.normal(size=24)
+
+    normalized = normalize_embeddings(raw)
+    assert normalized.dtype == np.float32 and normalized.flags["C_CONTIGUOUS"]
+
+    expected = cosine_similarity(profile.reshape(1, -1), raw)[0]
+    np.testing.assert_allclose(cosine_scores(normalized, profile), expected, atol=1e-6)
+
+
+def test_hybrid_matches_reference_fusion(clicks_df, article_embeddings, svd_model):
+    """Fusion vectorisée = fusion article par article (articles sans embedding inclus)"""
+    from p10_reco.recommendation_engine import get_hybrid_recommendations
+
+    embeddings, article_id_to_index = article_embeddings
+    # Une partie du catalogue n'a pas d'embedding → score CBF nul
+    partial_index = {aid: idx for aid, idx in article_id_to_index.items() if aid % 7}
+    alpha = 0.6
+
+    for user_id in [3, 11, 29]:
+        seen = clicks_df[clicks_df["user_id"] == user_id]["article_id"].unique()
+        rows = [partial_index[aid] for aid in seen if aid in partial_index]
+        profile = embeddings[rows].mean(axis=0)
+        cbf = cosine_scores(embeddings, profile)
+
+        reference = {}
+        for aid in clicks_df["article_id"].unique():
+            if aid in seen:
+                continue
+            cbf_score = cbf[partial_index[aid]] if aid in partial_index else 0
+            reference[aid] = alpha * cbf_score + (1 - alpha) * svd_model.predict(user_id, aid).est
+        expected = [int(aid) for aid, _ in sorted(reference.items(), key=lambda x: x[1], reverse=True)[:5]]
+
+        assert get_hybrid_recommendations(user_id, clicks_df, embeddings, partial_index,
+                                          svd_model, top_n=5, alpha=alpha) == expected
+
+
+@pytest.mark.parametrize("mode", ["auto", "cbf", "cf", "hybrid"])
+def test_batch_matches_single_user(mode, clicks_df, article_embeddings, svd_model):
+    """Le batch par blocs renvoie les mêmes listes que les appels unitaires"""
+    from p10_reco.click_index import build_user_click_index
+    from p10_reco.recommendation_engine import get_recommendations, get_recommendations_batch
+
+    embeddings, article_id_to_index = article_embeddings
+    index = build_user_click_index(clicks_df)
+    user_ids = list(range(1, 41)) + [10_000]  # utilisateur inconnu inclus
+
+    batch = get_recommendations_batch(user_ids, clicks_df, svd_model, embeddings, article_id_to_index,
+                                      mode=mode, alpha=0.3, user_clicks_threshold=15, top_n=5,
+                                      click_index=index, block_size=7)
+
+    for user_id in user_ids:
+        expected = get_recommendations(user_id, clicks_df, svd_model, embeddings, article_id_to_index,
+                                       mode=mode, alpha=0.3, user_clicks_threshold=15, top_n=5,
+                                       click_index=index)
+        assert batch[user_id] == expected, user_id
+
+
+@pytest.mark.parametrize("path", ["single", "batch", "profiles"])
+def test_cbf_profile_uses_raw_embeddings(path, clicks_df):
+    """Avec les normes d'origine, le CBF sur matrice normalisée = CBF sur embeddings bruts"""
+    from sklearn.metrics.pairwise import cosine_similarity
+    from p10_reco.article_index import ArticleIndex
+    from p10_reco.click_index import build_user_click_index
+    from p10_reco.recommendation_engine import get_cbf_recommendations, get_recommendations_batch
+    from p10_reco.user_profiles import build_user_profiles
+
+    rng = np.random.default_rng(5)
+    raw = (rng.normal(size=(150, 16)) * rng.uniform(0.1, 10.0, size=(150, 1))).astype(np.float32)
+    embeddings, norms = normalize_embeddings(raw, return_norms=True)
+    article_index = ArticleIndex.from_article_ids(np.arange(150), norms=norms)
+    click_index = build_user_click_index(clicks_df)
+    user_ids = list(range(1, 41))
+
+    if path == "batch":
+        served = get_recommendations_batch(user_ids, clicks_df, None, embeddings, article_index,
+                                           mode="cbf", top_n=5, click_index=click_index, block_size=7)
+    else:
+        profiles = build_user_profiles(click_index, embeddings, article_index) if path == "profiles" else None
+        served = {user_id: get_cbf_recommendations(user_id, clicks_df, embeddings, article_index, top_n=5,
+                                                   click_index=click_index, user_profiles=profiles)
+                  for user_id in user_ids}
+
+    for user_id in user_ids:
+        # Référence : profil = moyenne des embeddings bruts, cosinus sur la matrice brute
+        seen = click_index.get_articles(user_id)
+        similarities = cosine_similarity(raw[seen].mean(axis=0).reshape(1, -1), raw)[0]
+        similarities[seen] = -1
+        assert served[user_id] == [int(aid) for aid in np.argsort(-similarities, kind="stable")[:5]], user_id
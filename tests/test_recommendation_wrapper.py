@@ -11,7 +11,7 @@ src_path = os.path.join(project_root, "src")
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
-from wrappers import get_recommendations_from_user
+from p10_reco.wrappers import get_recommendations_from_user
 
 
 def test_reco(user_id: int = None,
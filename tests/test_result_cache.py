@@ -0,0 +1,69 @@
+# tests/test_result_cache.py
+
+from p10_reco import result_cache
+from p10_reco.result_cache import ResultCache
+
+
+def test_lru_eviction():
+    """Au-delà de max_size, l'entrée la moins récemment lue est supprimée"""
+    cache = ResultCache(max_size=2, ttl_s=60)
+    cache.put("a", (1,))
+    cache.put("b", (2,))
+    assert cache.get("a") == (1,)
+    cache.put("c", (3,))
+
+    assert cache.get("b") is None
+    assert cache.get("a") == (1,)
+    assert cache.get("c") == (3,)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (3, 1, 1, 2)
+
+
+def test_ttl_expiry(monkeypatch):
+    """Une entrée expirée est supprimée et comptée comme un échec"""
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+
+    cache = ResultCache(max_size=10, ttl_s=30)
+    cache.put("a", (1,))
+    now[0] += 29
+    assert cache.get("a") == (1,)
+    now[0] += 2
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_disabled_cache():
+    cache = ResultCache(max_size=0)
+    cache.put("a", (1,))
+    assert cache.get("a") is None
+
+
+def test_wrapper_cache_invalidated_by_reload(monkeypatch):
+    """Requêtes identiques servies par le cache ; un reload() invalide les réponses"""
+    from p10_reco import wrappers
+
+    computed = []
+
+    def fake_load_artifacts(source, connection_string=None, components=wrappers.ARTIFACT_COMPONENTS):
+        return {"df": None, "model_cf": None, "click_index": None, "precomputed": None}
+
+    def fake_get_recommendations(user_id, **kwargs):
+        computed.append(user_id)
+        return [user_id, len(computed)]
+
+    monkeypatch.setattr(wrappers, "_load_artifacts", fake_load_artifacts)
+    monkeypatch.setattr(wrappers, "get_recommendations", fake_get_recommendations)
+    monkeypatch.setattr(wrappers, "_ARTIFACTS", {})
+    monkeypatch.setattr(wrappers, "RESULT_CACHE", ResultCache(max_size=100, ttl_s=60))
+
+    first = wrappers.get_recommendations_from_user(7, mode="cf", top_n=5)
+    first.append("mutation de l'appelant")
+    assert wrappers.get_recommendations_from_user(7, mode="cf", top_n=5) == [7, 1]
+    assert wrappers.get_recommendations_from_user(7, mode="cf", top_n=4) == [7, 2]
+    assert computed == [7, 7]
+
+    wrappers.reload(source="local")
+    assert wrappers.get_recommendations_from_user(7, mode="cf", top_n=5) == [7, 3]
+    assert wrappers.RESULT_CACHE.stats()["hits"] == 1
@@ -0,0 +1,82 @@
+# tests/test_user_directory.py
+
+import numpy as np
+import pytest
+
+from p10_reco.click_index import build_user_click_index
+from p10_reco.user_directory import USER_DIRECTORY_DTYPE, build_user_directory, save_user_directory
+
+
+def test_directory_matches_click_index(clicks_df):
+    """Validation, nombre de clics et offsets identiques à l'index des clics"""
+    index = build_user_click_index(clicks_df)
+    directory = build_user_directory(index)
+
+    assert directory.user_ids.dtype == np.int32
+    for user_id in list(range(0, 43)) + [10_000]:
+        assert directory.contains(user_id) == (index.position(user_id) >= 0)
+        assert directory.get_click_count(user_id) == index.get_click_count(user_id)
+
+    for pos, user_id in enumerate(index.user_ids):
+        start = directory.offsets[pos]
+        end = directory.offsets[pos + 1] if pos + 1 < directory.n_users else len(index.article_ids)
+        np.testing.assert_array_equal(index.article_ids[start:end], index.get_articles(user_id))
+
+
+def test_directory_artifact_roundtrip(clicks_df, tmp_path):
+    """Un seul .npy structuré, rouvert en memmap sans pickle"""
+    from p10_reco.loaders import open_user_directory
+
+    directory = build_user_directory(build_user_click_index(clicks_df))
+    path = save_user_directory(directory, str(tmp_path / "user_directory.npy"))
+    reopened = open_user_directory(path)
+
+    assert np.load(path, mmap_mode="r").dtype == USER_DIRECTORY_DTYPE
+    assert isinstance(reopened.user_ids, np.memmap)
+    np.testing.assert_array_equal(reopened.user_ids, directory.user_ids)
+    np.testing.assert_array_equal(reopened.click_counts, directory.click_counts)
+
+    np.save(tmp_path / "other.npy", np.arange(5))
+    with pytest.raises(ValueError):
+        open_user_directory(str(tmp_path / "other.npy"))
+
+
+def test_wrapper_uses_directory(clicks_df, monkeypatch):
+    """Validation et mode "auto" tranchés par l'annuaire, sans charger la table des clics"""
+    from p10_reco import wrappers
+    from p10_reco.result_cache import ResultCache
+
+    directory = build_user_directory(build_user_click_index(clicks_df))
+    loads, calls = [], []
+
+    def fake_load_artifacts(source, connection_string=None, components=wrappers.ARTIFACT_COMPONENTS):
+        loads.extend(components)
+        loaded = {"users": {"user_directory": directory}, "precomputed": {"precomputed": None},
+                  "clicks": {"df": None, "click_index": None}, "embeddings": {"embeddings": None},
+                  "model": {"model_cf": None}, "profiles": {"user_profiles": None}}
+        return {key: value for name in components for key, value in loaded[name].items()}
+
+    def fake_get_recommendations(user_id, **kwargs):
+        calls.append(kwargs["mode"])
+        return [1, 2]
+
+    monkeypatch.setattr(wrappers, "_load_artifacts", fake_load_artifacts)
+    monkeypatch.setattr(wrappers, "get_recommendations", fake_get_recommendations)
+    monkeypatch.setattr(wrappers, "_ARTIFACTS", {})
+    monkeypatch.setattr(wrappers, "RESULT_CACHE", ResultCache(max_size=0))
+
+    user_id = int(directory.user_ids[0])
+    assert wrappers.is_known_user(user_id)
+    assert not wrappers.is_known_user(10_000)
+    assert loads == ["users"]
+
+    nb_clicks = directory.get_click_count(user_id)
+    wrappers.get_recommendations_from_user(user_id, mode="auto", user_clicks_threshold=nb_clicks + 1)
+    assert calls == ["cbf"]
+    assert "model" not in loads
+
+    wrappers.get_recommendations_from_user(user_id, mode="auto", user_clicks_threshold=nb_clicks)
+    assert calls == ["cbf", "hybrid"]
+
+    assert wrappers.get_recommendations_from_user(10_000, mode="auto") == []
+    assert len(calls) == 2
@@ -0,0 +1,90 @@
+# tests/test_user_profiles.py
+
+import numpy as np
+import pytest
+
+from p10_reco.click_index import build_user_click_index
+from p10_reco.user_profiles import build_user_profiles
+
+
+def test_profiles_match_history_mean(clicks_df, article_embeddings):
+    """Chaque ligne est la moyenne des embeddings vus, comme en ligne"""
+    embeddings, article_id_to_index = article_embeddings
+    click_index = build_user_click_index(clicks_df)
+    profiles = build_user_profiles(click_index, embeddings, article_id_to_index)
+
+    assert profiles.vectors.dtype == np.float32
+    assert profiles.vectors.shape == (click_index.n_users, embeddings.shape[1])
+    for user_id in click_index.user_ids:
+        rows = [article_id_to_index[aid] for aid in click_index.get_articles(user_id)]
+        np.testing.assert_array_equal(profiles.get(user_id), np.mean(embeddings[rows], axis=0))
+    assert profiles.get(10_000) is None
+
+
+@pytest.mark.parametrize("mode", ["cbf", "hybrid", "auto"])
+def test_engine_same_results_with_profiles(mode, clicks_df, article_embeddings, svd_model):
+    """Recommandations identiques avec ou sans matrice de profils (unitaire et batch)"""
+    from p10_reco.recommendation_engine import get_recommendations, get_recommendations_batch
+
+    embeddings, article_id_to_index = article_embeddings
+    click_index = build_user_click_index(clicks_df)
+    profiles = build_user_profiles(click_index, embeddings, article_id_to_index)
+    user_ids = list(range(1, 41)) + [10_000]
+
+    batch = get_recommendations_batch(user_ids, clicks_df, svd_model, embeddings, article_id_to_index, mode=mode,
+                                      alpha=0.6, user_clicks_threshold=15, top_n=5, click_index=click_index,
+                                      user_profiles=profiles)
+    for user_id in user_ids:
+        expected = get_recommendations(user_id, clicks_df, svd_model, embeddings, article_id_to_index, mode=mode,
+                                       alpha=0.6, user_clicks_threshold=15, top_n=5, click_index=click_index)
+        assert get_recommendations(user_id, clicks_df, svd_model, embeddings, article_id_to_index, mode=mode,
+                                   alpha=0.6, user_clicks_threshold=15, top_n=5, click_index=click_index,
+                                   user_profiles=profiles) == expected
+        assert batch[user_id] == expected
+
+
+def test_profile_artifact_aligned_with_directory(clicks_df, article_embeddings, tmp_path):
+    """La matrice se rouvre en memmap sur les lignes de l'annuaire ; un désalignement est refusé"""
+    from p10_reco.loaders import open_user_profiles
+    from p10_reco.user_directory import build_user_directory
+    from p10_reco.user_profiles import save_user_profiles
+
+    embeddings, article_id_to_index = article_embeddings
+    click_index = build_user_click_index(clicks_df)
+    profiles = build_user_profiles(click_index, embeddings, article_id_to_index)
+    directory = build_user_directory(click_index)
+
+    path = save_user_profiles(profiles, str(tmp_path / "user_profiles.npy"))
+    reopened = open_user_profiles(path, directory)
+    assert isinstance(reopened.vectors, np.memmap)
+    np.testing.assert_array_equal(reopened.get(7), profiles.get(7))
+
+    smaller = build_user_directory(build_user_click_index(clicks_df[clicks_df["user_id"] != 7]))
+    with pytest.raises(ValueError):
+        open_user_profiles(path, smaller)
+
+
+def test_wrapper_profiles_reuse_loaded_directory(clicks_df, article_embeddings, fake_blob_store, tmp_path, monkeypatch):
+    """Azure : les profils sont lus sur l'annuaire du composant "users", téléchargé une seule fois"""
+    from p10_reco import loaders, wrappers
+    from p10_reco.user_directory import build_user_directory, save_user_directory
+    from p10_reco.user_profiles import save_user_profiles
+
+    monkeypatch.setattr(loaders, "ARTIFACTS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(wrappers, "_ARTIFACTS", {})
+    embeddings, article_id_to_index = article_embeddings
+    click_index = build_user_click_index(clicks_df)
+    files = wrappers.ARTIFACT_FILES["azure"]
+    for name, path in [(files["users"], save_user_directory(build_user_directory(click_index),
+                                                            str(tmp_path / "directory.npy"))),
+                       (files["profiles"], save_user_profiles(build_user_profiles(click_index, embeddings,
+                                                                                  article_id_to_index),
+                                                              str(tmp_path / "profiles.npy")))]:
+        with open(path, "rb") as f:
+            fake_blob_store.put(name, f.read())
+
+    artifacts = wrappers._get_components("azure", ("profiles",), fake_blob_store.conn_str)
+    assert artifacts["components"] == {"users", "profiles"}
+    assert artifacts["user_profiles"] is not None
+    assert artifacts["user_profiles"].user_ids is artifacts["user_directory"].user_ids
+    assert fake_blob_store.count("GET", files["users"]) == 1
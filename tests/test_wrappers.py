@@ -10,7 +10,7 @@ if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
 # === IMPORTS APRES MISE A JOUR DE sys.path ===
-from wrappers import get_recommendations_from_user
+from p10_reco.wrappers import get_recommendations_from_user
 
 @pytest.mark.parametrize("source", ["local"])
 def test_get_recommendations_local(source):
@@ -30,4 +30,57 @@ def test_get_recommendations_local(source):
 
 # COMMENTAIRE: Test Azure supprimé car infrastructure distante instable
 # Le système local est entièrement fonctionnel et validé
-# Les artefacts Azure sont vérifiés par scripts/check_azure_artifacts.py
\ No newline at end of file
+# Les artefacts Azure sont vérifiés par scripts/check_azure_artifacts.py
+
+def test_artifacts_loaded_once_per_process(monkeypatch):
+    """Les artefacts sont chargés une seule fois puis partagés entre appels"""
+    from p10_reco import wrappers
+    calls = []
+
+    def fake_load_artifacts(source, connection_string=None, components=wrappers.ARTIFACT_COMPONENTS):
+        calls.append(source)
+        return {"source": source, "load": len(calls)}
+
+    monkeypatch.setattr(wrappers, "_load_artifacts", fake_load_artifacts)
+    monkeypatch.setattr(wrappers, "_ARTIFACTS", {})
+
+    first = wrappers.warmup(source="local")
+    second = wrappers.get_artifacts(source="local")
+    assert first is second
+    assert calls == ["local"]
+
+    reloaded = wrappers.reload(source="local")
+    assert reloaded["load"] == 2
+    assert reloaded["version"] != first["version"]
+    assert wrappers.get_artifacts(source="local") is reloaded
+
+
+def test_artifacts_loaded_per_mode(monkeypatch):
+    """Chaque mode ne charge que ses composants, une seule fois ; reload() les reprend tous"""
+    from p10_reco import wrappers
+    loads = []
+
+    def fake_load_artifacts(source, connection_string=None, components=wrappers.ARTIFACT_COMPONENTS):
+        loads.append(components)
+        return {name: f"{name}@{len(loads)}" for name in components}
+
+    monkeypatch.setattr(wrappers, "_load_artifacts", fake_load_artifacts)
+    monkeypatch.setattr(wrappers, "_ARTIFACTS", {})
+
+    cbf = wrappers.get_artifacts(source="local", mode="cbf")
+    assert loads == [("clicks", "embeddings", "users", "profiles")]
+    assert "model" not in cbf
+
+    cf = wrappers.get_artifacts(source="local", mode="cf")
+    assert loads[1:] == [("model",)]
+    assert cf["clicks"] == "clicks@1"
+    assert cf["version"] == cbf["version"]
+
+    wrappers.get_artifacts(source="local", mode="hybrid")
+    assert len(loads) == 2
+
+    wrappers.reload(source="local")
+    assert loads[2:] == [("clicks", "embeddings", "model", "users", "profiles")]
+
+    with pytest.raises(ValueError):
+        wrappers.get_artifacts(source="local", mode="popular")